@@ -0,0 +1,128 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+"""
+Latency and throughput benchmarks for pytza500 against a simulated TZA500.
+
+Usage:
+    python benchmarks/benchmark.py [--samples 2000] [--latency 0.001] [--processing-time 0.0002]
+"""
+
+
+import os
+import sys
+import argparse
+import numpy as np
+from time import perf_counter, process_time, sleep
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Run from a checkout without installing
+
+from pytza500 import TZA500, GAIN, UNITS, LoopbackTransport
+from pytza500.simulator import step_signal
+
+
+def connect(**device_options) -> TZA500:
+    tza = TZA500()
+    if not tza.connect_transport(LoopbackTransport(**device_options)):
+        raise Exception("Cannot connect to simulated device.")
+    tza.set_unit(UNITS.NANOAMPERE)
+    return tza
+
+
+def report(name: str, samples: int, wall_time: float, cpu_time: float, latencies: np.ndarray | None = None) -> None:
+    line = "{:<28} {:>10.0f} samples/s {:>8.1f} µs CPU/sample".format(name, samples / wall_time, cpu_time / samples * 1e6)
+    if latencies is not None:
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e6
+        line += "   latency p50 {:.0f} µs  p90 {:.0f} µs  p99 {:.0f} µs  max {:.0f} µs".format(p50, p90, p99, latencies.max() * 1e6)
+    print(line)
+
+
+def bench_single(samples: int, **device_options) -> None:
+    tza = connect(**device_options)
+    latencies = np.empty(samples)
+    cpu_start = process_time()
+    start = perf_counter()
+    for i in range(samples):
+        t = perf_counter()
+        tza.tza_get_measurement()
+        latencies[i] = perf_counter() - t
+    report("tza_get_measurement", samples, perf_counter() - start, process_time() - cpu_start, latencies)
+    tza.disconnect()
+
+
+def bench_batch(samples: int, **device_options) -> None:
+    tza = connect(**device_options)
+    cpu_start = process_time()
+    start = perf_counter()
+    tza.tza_get_measurements(samples)
+    report("tza_get_measurements", samples, perf_counter() - start, process_time() - cpu_start)
+    tza.disconnect()
+
+
+def bench_stream(samples: int, **device_options) -> None:
+    tza = connect(**device_options)
+    received = 0
+    cpu_start = process_time()
+    start = perf_counter()
+    tza.start_stream(buffer_size=samples)
+    while received < samples:
+        sleep(0.01)
+        received += len(tza.read_stream()[1])
+    tza.stop_stream()
+    report("stream", received, perf_counter() - start, process_time() - cpu_start)
+    tza.disconnect()
+
+
+def bench_autogain(samples: int, **device_options) -> None:
+    # Signal jumps by decades every 20 ms
+    tza = connect(signal=step_signal([5.0, 5e5, 50.0, 5e6, 500.0], 0.02), **device_options)
+    tza.tza_set_gain(GAIN.AUTO)
+    tza.reset_autogain_statistics()
+    cpu_start = process_time()
+    start = perf_counter()
+    tza.tza_get_measurements(samples)
+    report("auto-gain", samples, perf_counter() - start, process_time() - cpu_start)
+    statistics = tza.autogain_statistics
+    print("{:<28} {:>10} range changes {:>8} extra round trips ({:.3f} per sample)".format(
+        "", statistics["range_changes"], statistics["extra_round_trips"], statistics["extra_round_trips"] / samples))
+    tza.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pytza500 benchmarks against a simulated TZA500")
+    parser.add_argument("--samples", type=int, default=2000, help="Samples per benchmark")
+    parser.add_argument("--latency", type=float, default=0.001, help="Simulated USB round trip latency in seconds")
+    parser.add_argument("--processing-time", type=float, default=0.0002, help="Simulated device processing time per command in seconds")
+    args = parser.parse_args()
+
+    device_options = {"latency": args.latency, "processing_time": args.processing_time}
+
+    bench_single(args.samples, **device_options)
+    bench_batch(args.samples, **device_options)
+    bench_stream(args.samples, **device_options)
+    bench_autogain(args.samples, **device_options)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,10 +22,25 @@
 
 
 import re
-import sys
-import ftd2xx
+import importlib
+import threading
+import numpy as np
 from enum import Enum
-from time import sleep
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from time import sleep, time, perf_counter
+
+from .ringbuffer import RingBuffer
+from .pipeline import CommandPipeline
+from .parser import count_frames, parse_measurement_frames
+from .metrics import Metrics
+from .averaging import WindowStatistics, WINDOW_RECORD
+from .settling import SettlingModel, StabilityDetector
+from .responsivity import ResponsivityCurve
+from .calibration import Calibration, CalibrationStore
+from .discovery import DeviceInfo, DeviceDiscovery
+from .transport import Transport, HandleTransport, FTD2XXTransport, SerialTransport, LoopbackTransport
 
 
 class BANDWITH(Enum):
@@ -45,7 +60,7 @@ class GAIN(Enum):
     X100 = "x100"
     X1000 = "x1000"
     X10000 = "x10000"
-    X100000 = "x1000000"
+    X100000 = "x100000"
     AUTO = "auto-gain"
 
 class UNITS(Enum):
@@ -58,6 +73,21 @@ class UNITS(Enum):
     MILLIWATTS = "mW"
     WATTS = "W"
 
+_discovery = DeviceDiscovery()
+
+# Sample of TZA500.sweep()
+SWEEP_RECORD = np.dtype([
+    ("bandwith", "u1"), # Bandwith code (1 = 10 kHz, 2 = 1 kHz, ...)
+    ("gain", "u1"), # Gain code (1 = x1, 2 = x10, ...)
+    ("index", "<i4"), # Number of the sample at this configuration
+    ("timestamp", "<f8"), # Unix timestamp
+    ("value", "<f8") # Value in the selected unit
+])
+
+# Errors raised when the connection to the device is lost, transports translate their driver errors to ConnectionError.
+# A TimeoutError is no lost connection, reconnecting and repeating the command is the wrong recovery for it.
+_CONNECTION_ERRORS = (ConnectionError,)
+
 class TZA500():
     def __init__(self) -> None :
         """
@@ -66,7 +96,11 @@ class TZA500():
         self._unit: str = UNITS.MICROAMPERE.value
 
         self._port: str = ""
-        self._device = None
+        self._device: Transport = None # Open transport
+        self._transport: Transport = None # Transport opened again on reconnect
+        self._auto_reconnect: dict = None # Options of reconnect() if enabled
+        self._reconnecting: bool = False
+        self._reconnects: int = 0
 
         self._bandwith_steps: dict = {
             "10 kHz": "B1",
@@ -85,6 +119,18 @@ class TZA500():
             "auto-gain": "auto-gain"
         }
 
+        # Reverse lookup tables from device codes to bandwith and gain names
+        self._bandwith_names: dict = dict(zip(self._bandwith_steps.values(), self._bandwith_steps.keys()))
+        self._gain_names: dict = dict(zip(self._gain_steps.values(), self._gain_steps.keys()))
+
+        # Sampling rate in Hz for each bandwith at which consecutive samples are still independent
+        self._bandwith_sample_rates: dict = {
+            "10 kHz": 20000.0,
+            "1 kHz": 2000.0,
+            "100 Hz": 200.0,
+            "10 Hz": 20.0
+        }
+
         self._units: dict = {
             "nA": "Nanoampere (nA)",
             "µA": "Microampere (µA)",
@@ -95,7 +141,9 @@ class TZA500():
             "mW": "Milliwatts (mW)",
             "W": "Watts (W)",
         }
-        self._sensitivity: float = 1.0
+        self._sensitivity: float = 1.0 # Responsivity in A/W used for watt units
+        self._responsivity: ResponsivityCurve = None
+        self._wavelength: float = None
         self._initial_auto_zero: str = INITIAL_AUTO_ZERO.NONE.value
         self._invert_input_polarity: bool = False
         self._bandwith: str = BANDWITH.KHZ_10.value
@@ -103,7 +151,51 @@ class TZA500():
         self._gain: str = GAIN.X1.value
         self._max_gain: int = len(self._gain_steps) - 1
 
-        self._tza_comm_max_retries: int = 800
+        # Amplitude in nA at 100 % of the range of each gain level.
+        # Gains 1-3 report in µA with 122.85, 12.285 and 1.2285 µA per percent,
+        # gains 4-6 repeat the same numbers in nA.
+        self._gain_full_scale: dict = {
+            1: 12285000.0,
+            2: 1228500.0,
+            3: 122850.0,
+            4: 12285.0,
+            5: 1228.5,
+            6: 122.85
+        }
+        self._autogain_lower_level: float = 8.0 # Switch to a higher gain below this level in percent
+        self._autogain_upper_level: float = 90.0 # Switch to a lower gain above this level in percent
+        self._autogain_range_changes: int = 0
+        self._autogain_round_trips: int = 0
+
+        self._settling: SettlingModel = SettlingModel()
+        self._settle_detector: StabilityDetector = None # Detects stable readings if adaptive settling is enabled
+        self._settle_deadline: float = 0.0 # perf_counter() time at which the output is settled at the latest
+
+        self._calibration_store: CalibrationStore = None
+        self._temperature: float = None # Ambient temperature in °C for the expiry of calibrations
+        self._calibration: Calibration = None # Offsets subtracted from measurements
+
+        self._state_cache: bool = False # Answer getters from confirmed settings instead of querying the device
+        self._state_valid: set[str] = set() # Settings known to match the device: "gain", "bandwith", "polarity"
+
+        self._tza_comm_timeout: int = 8000 # Total time in ms to wait for a reply
+        self._tza_read_timeout: int = 10 # Time in ms a single blocking read waits in the driver
+        self._tza_latency_timer: int = 2 # Time in ms the FTDI chip buffers data before sending it to the host
+        self._tza_comm_max_retries: int = self._tza_comm_timeout // self._tza_read_timeout
+        self._rx_buffer: bytearray = bytearray() # Received bytes not yet returned as a reply
+        # Lines of multi-line replies. The lines are separated by "\n" or "\r\n". "$I" has a variable number of lines.
+        self._tza_reply_lines: dict = {"V?": 2, "$I": None}
+        # Start of the last line of multi-line replies with a variable number of lines, in lower case
+        self._tza_reply_last_lines: dict = {"$I": b"date of manufacturing"}
+        self._pipeline: CommandPipeline = CommandPipeline(self._tza_send, self._tza_recv, self._tza_purge, depth=8, read_frames=self._tza_recv_frames)
+        self._tza_lock: threading.RLock = threading.RLock() # Serializes transactions between threads
+        self._metrics: Metrics = None
+        self._metrics_in_flight: deque = deque() # (command, send time) of commands without reply, only used with metrics
+
+        self._stream_thread: threading.Thread = None
+        self._stream_stop: threading.Event = threading.Event()
+        self._stream_buffer: RingBuffer = None
+        self._stream_error: Exception = None
 
         self._tza_fw: str = ""
         self._tza_serial: str = ""
@@ -116,11 +208,69 @@ class TZA500():
     @sensitivity.setter
     def sensitivity(self, value: float) -> None:
         self._sensitivity = value
+        self._wavelength = None # No longer the responsivity at the wavelength
+
+    @property
+    def responsivity(self) -> ResponsivityCurve | None:
+        return self._responsivity
+
+    def set_responsivity(self, curve: ResponsivityCurve | None) -> None:
+        """
+        Sets the calibration curve of the photodiode used for watt units.
+
+        :param:
+            curve(ResponsivityCurve | None): Calibration curve, e.g. ResponsivityCurve.from_csv("photodiode.csv")
+        """
+        self._responsivity = curve
+        if curve is not None and self._wavelength is not None:
+            self.tza_set_wavelength(self._wavelength)
+
+    def tza_set_wavelength(self, wavelength: float) -> bool:
+        """
+        Sets the sensitivity to the responsivity of the calibration curve at the wavelength.
+
+        :param:
+            wavelength(float): Wavelength in nm
+        
+        :return:
+            result(bool): Returns whether a calibration curve is set and covers the wavelength
+        """
+        if self._responsivity is None:
+            return False
+        try:
+            self._sensitivity = self._responsivity.responsivity(wavelength)
+        except Exception:
+            return False
+        self._wavelength = float(wavelength)
+        return True
+
+    def tza_get_wavelength(self) -> float | None:
+        """
+        Returns the wavelength set with tza_set_wavelength().
+
+        :return:
+            wavelength(float | None): Wavelength in nm or None if the sensitivity was set directly
+        """
+        return self._wavelength
 
     @property
     def unit(self) -> str:
         return self._units[self._unit]
     
+    @property
+    def state_cache(self) -> bool:
+        return self._state_cache
+    
+    @state_cache.setter
+    def state_cache(self, value: bool) -> None:
+        """
+        Enables or disables the state cache. When enabled, gain, bandwith and
+        polarity getters return the last confirmed value without querying the
+        device, and setters skip commands for values that are already set.
+        """
+        self._state_cache = bool(value)
+        self._state_valid.clear()
+
     @property
     def initial_auto_zero(self) -> str:
         return self._initial_auto_zero
@@ -142,33 +292,47 @@ class TZA500():
         return self._tza_date_of_manufacturing
     
     @staticmethod
-    def find_devices() -> list[str]:
+    def find_devices(max_age: float = 0.0) -> list[str]:
         """
         Return list of found devices
 
+        :param:
+            max_age(float): Reuse the last scan if it is not older than max_age seconds
+        
         :result:
             found_devices(list[str]): list of found TZA500 devices
         """
-        devices_found = []
+        return [str(device) for device in _discovery.devices(max_age)]
 
-        if sys.platform != "win32":
-            ftd2xx.setVIDPID(0x0403, 0x9a68) # For linux and macOS
+    @staticmethod
+    def discover_devices(max_age: float = 1.0) -> list[DeviceInfo]:
+        """
+        Return list of found devices as structured records
 
-        numDevs = ftd2xx.createDeviceInfoList()
+        :param:
+            max_age(float): Reuse the last scan if it is not older than max_age seconds
+        
+        :result:
+            found_devices(list[DeviceInfo]): list of found TZA500 devices
+        """
+        return _discovery.devices(max_age)
 
-        for i in range(0, numDevs):
-            dev = ftd2xx.getDeviceInfoDetail(i)
-            if "TZA500" in dev["description"].decode(errors="ignore"):
-                devices_found.append("{} - {}".format(dev["description"].decode(errors="ignore"), dev["serial"].decode(errors="ignore")))
+    @staticmethod
+    def discovery() -> DeviceDiscovery:
+        """
+        Returns the shared device discovery, e.g. to monitor devices being plugged in or removed.
 
-        return devices_found
+        :result:
+            discovery(DeviceDiscovery): Shared device discovery
+        """
+        return _discovery
     
-    def connect(self, device: str) -> None:
+    def connect(self, device: str | DeviceInfo) -> None:
         """
         Connects to TZA500 and initializes it
 
         :param:
-            device(str): Device string in the format "TZA500 - serial_number" E.g. "TZA500 - 12345"
+            device(str | DeviceInfo): Device string in the format "TZA500 - serial_number" E.g. "TZA500 - 12345" or a found device
         
         :return:
             result(bool): Returns whether the device was successfully connected and initialized.
@@ -177,25 +341,160 @@ class TZA500():
         if self._device != None:
             return False
 
-        if device == "":
+        if isinstance(device, DeviceInfo):
+            self._port = device.serial
+        elif device == "":
             raise Exception("No port selected.")
-        self._port = device.split("- ")[1]
+        else:
+            self._port = device.split("- ")[1]
 
         # Open device
+        transport = FTD2XXTransport(self._port)
         try:
-            self._device = ftd2xx.openEx(self._port.encode())
-            self._device.setBaudRate(115200)
-            self._device.setDataCharacteristics(8, 0, 0) # 8 data bits, 1 stop bit, no parity
-            self._device.setFlowControl(0, 0, 0) # No flow control
-            self._device.setTimeouts(1000, 0)
-            self._device.setChars(126, 1, 0, 0)
-            self._device.resetDevice()
-            self._device.purge() # Purge receive/transmit buffers
-        except ftd2xx.DeviceError:
+            transport.open()
+            self._tza_open(transport)
+        except ConnectionError:
             raise Exception("Cannot open Device with serial number {}.".format(self._port))
         
-        self._tza_send("$U")
-        if self._tza_recv() != "U OK":
+        return self._tza_start()
+
+    def connect_transport(self, transport: Transport) -> bool:
+        """
+        Connects to TZA500 through the given transport and initializes it
+
+        :param:
+            transport(Transport): Transport to the device, e.g. SerialTransport("/dev/ttyUSB0") or LoopbackTransport()
+        
+        :return:
+            result(bool): Returns whether the device was successfully connected and initialized.
+        """
+        if self._device != None:
+            return False
+
+        transport.open()
+        self._tza_open(transport)
+        return self._tza_start()
+
+    def connect_handle(self, handle) -> bool:
+        """
+        Connects to TZA500 through an already opened device handle and initializes it
+
+        :param:
+            handle: Object providing the methods of an ftd2xx device handle, e.g. FakeTZA500Device
+        
+        :return:
+            result(bool): Returns whether the device was successfully connected and initialized.
+        """
+        return self.connect_transport(HandleTransport(handle))
+
+    @property
+    def reconnects(self) -> int:
+        return self._reconnects
+
+    def enable_auto_reconnect(self, max_attempts: int = 5, initial_delay: float = 0.05, max_delay: float = 2.0) -> None:
+        """
+        Reconnects automatically when the connection is lost during a command
+        and repeats the command. Running streams and measurements continue.
+
+        :param:
+            max_attempts(int): Maximum number of attempts per connection loss
+            initial_delay(float): Delay in seconds before the second attempt, doubled for every further attempt
+            max_delay(float): Maximum delay in seconds between two attempts
+        """
+        self._auto_reconnect = {"max_attempts": max_attempts, "initial_delay": initial_delay, "max_delay": max_delay}
+
+    def disable_auto_reconnect(self) -> None:
+        """
+        Disables automatic reconnection.
+        """
+        self._auto_reconnect = None
+
+    def reconnect(self, max_attempts: int = 5, initial_delay: float = 0.05, max_delay: float = 2.0) -> bool:
+        """
+        Opens the connection to the device again with exponential backoff.
+        The device identity read on connect is kept, and only the gain,
+        bandwith and polarity settings that differ from the device defaults
+        are sent again. Unit and sensitivity are kept.
+
+        :param:
+            max_attempts(int): Maximum number of attempts
+            initial_delay(float): Delay in seconds before the second attempt, doubled for every further attempt
+            max_delay(float): Maximum delay in seconds between two attempts
+        
+        :return:
+            result(bool): Returns whether the device was reconnected
+        """
+        if self._transport is None:
+            return False
+
+        with self._tza_lock:
+            self._reconnecting = True
+            try:
+                delay = initial_delay
+                for attempt in range(max_attempts):
+                    if attempt > 0:
+                        sleep(delay)
+                        delay = min(delay * 2, max_delay)
+
+                    self._tza_close_handle()
+                    try:
+                        self._transport.open()
+                        self._device = self._transport
+                        self._tza_setup_device()
+                        self._pipeline.resync()
+                        if self._tza_query("$U") == "U OK" and self._tza_restore_settings():
+                            self._reconnects += 1
+                            return True
+                    except _CONNECTION_ERRORS + (TimeoutError,):
+                        pass # Not ready yet after reopening, try again
+                self._tza_close_handle()
+                return False
+            finally:
+                self._reconnecting = False
+
+    def _tza_try_reconnect(self) -> bool:
+        return self._auto_reconnect is not None and not self._reconnecting and self.reconnect(**self._auto_reconnect)
+
+    def _tza_close_handle(self) -> None:
+        if self._device is not None:
+            try:
+                self._device.close()
+            except Exception:
+                pass # The connection is already lost
+            self._device = None
+        self._pipeline.resync()
+
+    def _tza_restore_settings(self) -> bool:
+        """
+        Sends the settings that differ from the device defaults (10 kHz, not inverted, x1).
+        """
+        self._state_valid.clear()
+        if self._bandwith != BANDWITH.KHZ_10.value and not self.tza_set_bandwith(self._bandwith):
+            return False
+        if self._invert_input_polarity and not self.tza_set_polarity(True):
+            return False
+        if self._autogain_gain is not None and self._autogain_gain != 1 and not self.tza_set_gain(self._gain_names["V{}".format(self._autogain_gain)]):
+            return False
+        return True
+
+    def _tza_open(self, transport: Transport) -> None:
+        """
+        Sets up an opened transport. If that fails the transport is closed
+        again, so the device is not kept claimed.
+        """
+        self._transport = self._device = transport
+        try:
+            self._tza_setup_device()
+        except BaseException:
+            self._tza_close_handle()
+            self._transport = None
+            raise
+
+    def _tza_setup_device(self) -> None:
+        self._device.configure(self._tza_read_timeout, self._tza_latency_timer)
+
+    def _tza_start(self) -> bool:
+        if self._tza_query("$U") != "U OK":
             self.disconnect()
             return False
 
@@ -204,28 +503,215 @@ class TZA500():
             return False
         return True
     
+    def set_receive_latency(self, latency_timer: int = 2, read_timeout: int = 10) -> bool:
+        """
+        Sets the tradeoff between reply latency and CPU usage of the receive path.
+        Lower values return replies sooner, higher values wake up the host less often.
+
+        :param:
+            latency_timer(int): Time in ms (2-255) the FTDI chip buffers data before sending it to the host
+            read_timeout(int): Time in ms (>= 1) a single blocking read waits in the driver for new data
+        
+        :return:
+            result(bool): Returns whether the values were set successfully
+        """
+        if not 2 <= latency_timer <= 255 or read_timeout < 1:
+            return False
+
+        self._tza_latency_timer = int(latency_timer)
+        self._tza_read_timeout = int(read_timeout)
+        self._tza_comm_max_retries = max(1, self._tza_comm_timeout // self._tza_read_timeout)
+
+        if self._device is not None:
+            self._device.set_latency(self._tza_read_timeout, self._tza_latency_timer)
+        return True
+    
+    @property
+    def pipeline_depth(self) -> int:
+        return self._pipeline.depth
+    
+    @pipeline_depth.setter
+    def pipeline_depth(self, value: int) -> None:
+        """
+        Sets the maximum number of commands in flight. 1 disables pipelining.
+        """
+        with self._tza_lock:
+            self._pipeline.depth = value
+
+    def resync(self) -> None:
+        """
+        Purges the device buffers and discards all replies still in flight.
+        Use this to recover after the communication got out of step.
+        """
+        with self._tza_lock:
+            self._pipeline.resync()
+
+    @property
+    def metrics(self) -> Metrics | None:
+        return self._metrics
+
+    def enable_metrics(self, tracer: Callable[[str, str, bytes, float | None], None] | None = None) -> Metrics:
+        """
+        Enables collecting per command latency histograms and counters.
+
+        :param:
+            tracer(Callable[[str, str, bytes, float | None], None] | None): Called with (event, command, data, latency)
+                for every "send", "recv" and "timeout" event
+        
+        :return:
+            metrics(Metrics): Collected metrics, see Metrics.snapshot() and Metrics.to_prometheus()
+        """
+        with self._tza_lock:
+            if self._metrics is None:
+                self._metrics = Metrics(tracer)
+                self._metrics_in_flight.clear()
+            elif tracer is not None:
+                self._metrics.tracer = tracer
+            return self._metrics
+
+    def disable_metrics(self) -> None:
+        """
+        Stops collecting metrics.
+        """
+        with self._tza_lock:
+            self._metrics = None
+            self._metrics_in_flight.clear()
+
     def _tza_send(self, msg: str):
         if self._device is None:
             raise Exception("Send error: port not open.")
-        self._device.purge() # Purge receive/transmit buffers
-        self._device.write(msg.encode())
+        data = msg.encode()
+        self._device.write(data)
+        if self._metrics is not None:
+            self._metrics_in_flight.append((msg, perf_counter()))
+            self._metrics.sent(msg, data)
+
+    def _tza_purge(self):
+        if self._device is not None:
+            self._device.purge() # Purge receive/transmit buffers
+        self._rx_buffer.clear()
+        if self._metrics is not None:
+            self._metrics_in_flight.clear()
+            self._metrics.purged()
+
+    def _tza_metrics_received(self, data: bytes, retries: int) -> None:
+        # Replies arrive in the order the commands were sent
+        command, sent = self._metrics_in_flight.popleft() if len(self._metrics_in_flight) > 0 else ("", perf_counter())
+        if retries > 0:
+            self._metrics.retried(command, retries)
+        self._metrics.received(command, data, perf_counter() - sent)
+
+    def _tza_metrics_timed_out(self) -> None:
+        command, sent = self._metrics_in_flight[0] if len(self._metrics_in_flight) > 0 else ("", perf_counter())
+        self._metrics.retried(command, self._tza_comm_max_retries)
+        self._metrics.timed_out(command, perf_counter() - sent)
     
+    def _tza_find_frame_end(self, lines: int | None = None, last_line: bytes | None = None) -> tuple[int, bool]:
+        """
+        Returns the index of the '\r' terminating the first reply in the
+        receive buffer or -1 if no reply has been received yet, and whether
+        the reply is known to be complete. A '\r' directly followed by '\n'
+        separates lines of a multi-line reply. With a known number of lines
+        the reply ends at the first '\r' after lines - 1 line breaks, with a
+        known last line at the '\r' ending it, even if no '\n' follows yet.
+        """
+        end = self._rx_buffer.find(b"\r")
+        if lines is not None:
+            while end >= 0 and self._rx_buffer.count(b"\n", 0, end) < lines - 1:
+                end = self._rx_buffer.find(b"\r", end + 1)
+            return end, end >= 0
+        start = 0
+        while end >= 0:
+            if last_line is not None and self._rx_buffer[start:end].rsplit(b"\n", 1)[-1].lower().startswith(last_line):
+                return end, True
+            if self._rx_buffer[end + 1:end + 2] != b"\n":
+                return end, end < len(self._rx_buffer) - 1 # Followed by the next reply
+            start = end + 1
+            end = self._rx_buffer.find(b"\r", start)
+        return end, False
+
     def _tza_recv(self) -> str:
         if self._device is None:
             raise Exception("Recive error: port not open.")
-        msg = b""
+        # The chip sends a packet after every '\r', so the '\n' of a line break can arrive later.
+        # A multi-line reply whose last line is unknown is complete once no more data follows.
+        command = self._pipeline.receiving
+        multiline = command in self._tza_reply_lines
+        lines = self._tza_reply_lines.get(command)
+        last_line = self._tza_reply_last_lines.get(command)
+        confirmed = False
+        i = 0
+        while i < self._tza_comm_max_retries:
+            end, complete = self._tza_find_frame_end(lines, last_line)
+            if end >= 0 and (not multiline or complete or confirmed): # Complete reply in buffer
+                if self._metrics is not None:
+                    self._tza_metrics_received(bytes(self._rx_buffer[:end + 1]), i)
+                msg = self._rx_buffer[:end].decode(errors="ignore")
+                del self._rx_buffer[:end + 1]
+                return msg.replace("\r", '').strip()
+
+            queue_status = self._device.queue_status()
+            if queue_status > 0: # Read entire buffer
+                self._rx_buffer += self._device.read(queue_status)
+            else:
+                received = self._device.read(1) # Block in the driver until data arrives or the read timeout expires
+                if len(received) == 0:
+                    i += 1
+                    confirmed = end >= 0
+                self._rx_buffer += received
+        if self._metrics is not None:
+            self._tza_metrics_timed_out()
+        raise TimeoutError("No Valid Data received.")
+
+    def _tza_query(self, msg: str) -> str:
+        """
+        Sends a command and returns its reply as one transaction.
+        """
+        with self._tza_lock:
+            try:
+                return self._pipeline.query(msg)
+            except _CONNECTION_ERRORS:
+                if not self._tza_try_reconnect():
+                    raise
+                return self._pipeline.query(msg)
+
+    def _tza_recv_frames(self, max_count: int) -> tuple[bytes, int]:
+        """
+        Waits for at least one complete reply and returns up to max_count
+        complete replies as raw bytes including their '\r' terminators.
+        """
+        if self._device is None:
+            raise Exception("Recive error: port not open.")
         i = 0
         while i < self._tza_comm_max_retries:
-            if self._device.getQueueStatus() > 0: # Check if bytes in buffer
-                msg = self._device.read(self._device.getQueueStatus()) # Read entire buffer
-                while not msg.endswith(b'\r'): # Append buffer until '\r' is found
-                    queue_status = self._device.getQueueStatus()
-                    if queue_status > 0:
-                        msg += self._device.read(queue_status)
-                
-                return msg.decode(errors="ignore").replace("\r", '').strip()
-            sleep(0.01)
-            i += 1
+            queue_status = self._device.queue_status()
+            if queue_status > 0: # Read entire buffer
+                self._rx_buffer += self._device.read(queue_status)
+
+            count = count_frames(self._rx_buffer)
+            if count > 0:
+                if count <= max_count:
+                    end = self._rx_buffer.rfind(b"\r") + 1
+                else:
+                    count = max_count
+                    end = 0
+                    for _ in range(count):
+                        end = self._rx_buffer.find(b"\r", end) + 1
+                data = bytes(self._rx_buffer[:end])
+                del self._rx_buffer[:end]
+                if self._metrics is not None:
+                    for frame in data.split(b"\r")[:count]:
+                        self._tza_metrics_received(frame + b"\r", i)
+                        i = 0
+                return data, count
+
+            if queue_status == 0:
+                received = self._device.read(1) # Block in the driver until data arrives or the read timeout expires
+                if len(received) == 0:
+                    i += 1
+                self._rx_buffer += received
+        if self._metrics is not None:
+            self._tza_metrics_timed_out()
         raise TimeoutError("No Valid Data received.")
 
     def _initialize(self) -> bool:
@@ -246,6 +732,11 @@ class TZA500():
         if not self.tza_set_auto_zero_reset():
             self.disconnect()
             return False
+
+        if self._calibration_store is not None: # Offsets are measured in the auto zero reset state
+            self._calibration = self._calibration_store.get(self._tza_serial, self._tza_fw, self._temperature)
+            if self._calibration is not None:
+                self._max_gain = self._calibration.max_gain
     
         # Set default values
         if not self.tza_set_gain(self._gain):
@@ -260,8 +751,7 @@ class TZA500():
         :return:
             info(str): Printable device info
         """
-        self._tza_send("$I")
-        return self._tza_recv()
+        return self._tza_query("$I")
     
     def set_unit(self, unit: UNITS) -> bool:
         """
@@ -285,17 +775,19 @@ class TZA500():
         :return:
             is_polarity_inverted(bool): True if the polarity is inverted
         """
-        self._tza_send("$F")
-        received = self._tza_recv()
+        if self._tza_is_cached("polarity"):
+            return self._invert_input_polarity
+
+        received = self._tza_query("$F")
 
         if received == "F0":
             self._invert_input_polarity = False
-            return False
         elif received == "F1":
             self._invert_input_polarity = True
-            return True
         else:
             return None
+        self._tza_set_cached("polarity")
+        return self._invert_input_polarity
     
     def tza_set_polarity(self, invert_polarity: bool) -> bool:
         """
@@ -309,13 +801,15 @@ class TZA500():
         """
         invert_polarity = bool(invert_polarity)
 
+        if self._tza_is_cached("polarity") and self._invert_input_polarity == invert_polarity:
+            return True
+
         polarity_command = "N" if invert_polarity == False else "C"
         
-        self._tza_send("${}".format(polarity_command))
-
-        recv = self._tza_recv()
+        recv = self._tza_query("${}".format(polarity_command))
         if recv == "{} OK".format(polarity_command):
             self._invert_input_polarity = invert_polarity
+            self._tza_set_cached("polarity")
             return True
         return False
     
@@ -326,11 +820,14 @@ class TZA500():
         :return:
             bandwith(str): Current bandwith in format: 10 kHz, 1 kHz, ...
         """
-        self._tza_send("B?")
-        received = self._tza_recv()
+        if self._tza_is_cached("bandwith"):
+            return self._bandwith
+
+        received = self._tza_query("B?")
 
         if received in self._bandwith_steps.values():
-            self._bandwith = dict(zip(self._bandwith_steps.values(), self._bandwith_steps.keys()))[received]
+            self._bandwith = self._bandwith_names[received]
+            self._tza_set_cached("bandwith")
             return self._bandwith
         return None
     
@@ -349,11 +846,15 @@ class TZA500():
 
         if bandwith not in self._bandwith_steps.keys():
             raise Exception("Invalid bandwith. choose one from the pre-defined bandwiths.")
+
+        if self._tza_is_cached("bandwith") and self._bandwith == bandwith:
+            return True
         
-        self._tza_send(self._bandwith_steps[bandwith])
-        recv = self._tza_recv()
+        recv = self._tza_query(self._bandwith_steps[bandwith])
         if recv == "{} OK".format(self._bandwith_steps[bandwith]):
             self._bandwith = bandwith
+            self._tza_set_cached("bandwith")
+            self._tza_settle(self._settling.settle_time(bandwith, self._autogain_gain))
             return True
         return False
 
@@ -364,15 +865,18 @@ class TZA500():
         :return:
             gain(str): Current gain in format: x1, x10, ...
         """
-        self._tza_send("V?")
-        received = self._tza_recv()
+        if self._tza_is_cached("gain"):
+            return ("Auto: " if self._gain == "auto-gain" else "") + self._gain_names["V{}".format(self._autogain_gain)]
+
+        received = self._tza_query("V?")
         
         gain = received.splitlines()
         if gain[0] == "V? OK" and gain[1] in self._gain_steps.values():
             if self._gain != "auto-gain":
-                self._gain = dict(zip(self._gain_steps.values(), self._gain_steps.keys()))[gain[1]]
-            self._autogain_gain = int(self._gain_steps[dict(zip(self._gain_steps.values(), self._gain_steps.keys()))[gain[1]]][1:])
-            return ("Auto: " if self._gain == "auto-gain" else "") + dict(zip(self._gain_steps.values(), self._gain_steps.keys()))[gain[1]]
+                self._gain = self._gain_names[gain[1]]
+            self._autogain_gain = int(gain[1][1:])
+            self._tza_set_cached("gain")
+            return ("Auto: " if self._gain == "auto-gain" else "") + self._gain_names[gain[1]]
         return None
     
     def tza_set_gain(self, gain: str | GAIN) -> bool:
@@ -394,97 +898,604 @@ class TZA500():
         if gain == "auto-gain":
             self._gain = gain
             return True
+
+        if self._tza_is_cached("gain") and self._autogain_gain == int(self._gain_steps[gain][1:]):
+            if self._gain != "auto-gain":
+                self._gain = gain
+            return True
         
-        self._tza_send(self._gain_steps[gain])
-        recv = self._tza_recv()
+        recv = self._tza_query(self._gain_steps[gain])
         if recv == "{} OK".format(self._gain_steps[gain]):
             if self._gain != "auto-gain":
                 self._gain = gain
             self._autogain_gain = int(self._gain_steps[gain][1:])
+            self._tza_set_cached("gain")
+            self._tza_settle(self._settling.settle_time(self._bandwith, self._autogain_gain))
             return True
         return False
 
-    def tza_set_auto_zero(self) -> bool:
-        self._tza_send("$A")
+    def _tza_is_cached(self, setting: str) -> bool:
+        return self._state_cache and setting in self._state_valid
+
+    def _tza_set_cached(self, setting: str) -> None:
+        if self._state_cache:
+            self._state_valid.add(setting)
+
+    def configure(self, **settings) -> bool:
+        """
+        Applies several settings as one transaction. Only settings that differ
+        from the known device state are sent, all commands are sent in one
+        pipelined burst with the bandwith first, and host-side settings are
+        only applied once the device accepted all commands. If a command
+        fails, the commands already accepted are reverted.
+
+        :param:
+            bandwith(str | BANDWITH): Bandwith to set
+            gain(str | GAIN): Gain to set
+            polarity(bool): Whether the polarity should be inverted
+            unit(UNITS): Unit to use for measurements
+            sensitivity(float): Sensitivity for watt units
+            wavelength(float): Wavelength in nm, sets the sensitivity from the responsivity curve
         
-        recv = self._tza_recv()
+        :return:
+            result(bool): Returns whether all settings were applied, nothing is changed otherwise
+        """
+        unknown = set(settings) - {"bandwith", "gain", "polarity", "unit", "sensitivity", "wavelength"}
+        if len(unknown) > 0:
+            raise Exception("Invalid setting {}.".format(", ".join(sorted(unknown))))
+
+        # Validate everything before anything is sent
+        bandwith = settings.get("bandwith")
+        if type(bandwith) == BANDWITH:
+            bandwith = str(bandwith.value)
+        if bandwith is not None and bandwith not in self._bandwith_steps.keys():
+            raise Exception("Invalid bandwith. choose one from the pre-defined bandwiths.")
+
+        gain = settings.get("gain")
+        if type(gain) == GAIN:
+            gain = str(gain.value)
+        if gain is not None and gain not in self._gain_steps.keys():
+            raise Exception("Invalid gain. choose one from the pre-defined gains.")
+
+        unit = settings.get("unit")
+        if unit is not None and unit not in UNITS:
+            raise Exception("Invalid unit. choose one from the pre-defined units.")
+
+        sensitivity = settings.get("sensitivity")
+        wavelength = settings.get("wavelength")
+        if wavelength is not None:
+            if self._responsivity is None:
+                raise Exception("No responsivity curve set. Use set_responsivity() first.")
+            sensitivity = self._responsivity.responsivity(wavelength) # Raises outside the calibrated range
+
+        # Device commands that change the state, (setting, command, value) in the order they are sent
+        commands = []
+        if bandwith is not None and not (self._tza_is_cached("bandwith") and self._bandwith == bandwith):
+            commands.append(("bandwith", self._bandwith_steps[bandwith], bandwith))
+        if "polarity" in settings:
+            polarity = bool(settings["polarity"])
+            if not (self._tza_is_cached("polarity") and self._invert_input_polarity == polarity):
+                commands.append(("polarity", "C" if polarity else "N", polarity))
+        if gain is not None and gain != "auto-gain":
+            level = int(self._gain_steps[gain][1:])
+            if not (self._tza_is_cached("gain") and self._autogain_gain == level):
+                commands.append(("gain", self._gain_steps[gain], level))
+
+        with self._tza_lock:
+            if len(commands) > 0 and not self._tza_apply(commands):
+                return False
+
+            for setting, _, value in commands:
+                if setting == "bandwith":
+                    self._bandwith = value
+                elif setting == "polarity":
+                    self._invert_input_polarity = value
+                else:
+                    self._autogain_gain = value
+                self._tza_set_cached(setting)
+            if len(commands) > 0:
+                self._tza_settle(self._settling.settle_time(self._bandwith, self._autogain_gain))
+
+            if gain is not None:
+                self._gain = gain
+            if unit is not None:
+                self._unit = unit.value
+            if sensitivity is not None:
+                self._sensitivity = sensitivity
+                self._wavelength = float(wavelength) if wavelength is not None else None
+        return True
+
+    def _tza_apply(self, commands: list[tuple[str, str, object]]) -> bool:
+        """
+        Sends the commands of configure() pipelined and reverts the accepted ones if any fails.
+        """
+        def send(burst: list[str]) -> list[bool]:
+            tags = [self._pipeline.submit(command if command[0] in "BV" else "$" + command) for command in burst]
+            return [self._pipeline.result(tag) == "{} OK".format(command) for tag, command in zip(tags, burst)]
+
+        def previous(setting: str) -> str | None:
+            if setting == "bandwith":
+                return self._bandwith_steps[self._bandwith]
+            elif setting == "polarity":
+                return "C" if self._invert_input_polarity else "N"
+            return "V{}".format(self._autogain_gain) if self._autogain_gain is not None else None
+
+        try:
+            accepted = send([command for _, command, _ in commands])
+        except _CONNECTION_ERRORS:
+            # Unknown which commands were applied, the device state must be read or set again
+            self._state_valid.difference_update(setting for setting, _, _ in commands)
+            self._pipeline.resync()
+            if not self._tza_try_reconnect():
+                raise
+            accepted = None
+        if accepted is not None and all(accepted):
+            return True
+        if accepted is None:
+            accepted = [True] * len(commands) # Set all settings of the burst back after reconnecting
+
+        # Revert in reverse order to the previous state
+        revert = [previous(setting) for (setting, _, _), ok in reversed(list(zip(commands, accepted))) if ok]
+        revert = [command for command in revert if command is not None]
+        self._state_valid.difference_update(setting for setting, _, _ in commands) # Read again if used with the state cache
+        try:
+            send(revert)
+        except _CONNECTION_ERRORS:
+            self._pipeline.resync()
+            if not self._tza_try_reconnect():
+                raise
+        return False
+
+    def sweep(self, gains: list[str | GAIN] | None = None, bandwiths: list[str | BANDWITH] | None = None, samples: int = 100) -> np.ndarray:
+        """
+        Measures samples values at every combination of gain and bandwith.
+        The bandwith changes least often and the gains are walked back and
+        forth, so every step changes one setting to its neighbour. After each
+        change the output settles before measuring. The previous bandwith and
+        gain are restored afterwards.
+
+        :param:
+            gains(list[str | GAIN] | None): Fixed gains to measure at, all up to the maximum gain if None. Auto-gain is skipped.
+            bandwiths(list[str | BANDWITH] | None): Bandwiths to measure at, the selected bandwith if None
+            samples(int): Number of measurements per combination
+        
+        :return:
+            records(np.ndarray): SWEEP_RECORD records with bandwith, gain, index, timestamp and value in the selected unit
+        """
+        if samples < 1:
+            raise Exception("Invalid number of measurements.")
+
+        bandwiths = [str(bandwith.value) if type(bandwith) == BANDWITH else bandwith for bandwith in (bandwiths or [self._bandwith])]
+        levels = list(range(1, self._max_gain + 1))
+        if gains is not None:
+            gains = [str(gain.value) if type(gain) == GAIN else gain for gain in gains]
+            gains = [gain for gain in gains if gain != "auto-gain"] # Sweeps measure at fixed gains
+            if len(gains) == 0 or any(gain not in self._gain_steps.keys() for gain in gains):
+                raise Exception("Invalid gain. choose one from the pre-defined gains.")
+            levels = [int(self._gain_steps[gain][1:]) for gain in gains]
+        for bandwith in bandwiths:
+            if bandwith not in self._bandwith_steps.keys():
+                raise Exception("Invalid bandwith. choose one from the pre-defined bandwiths.")
+        levels = sorted(set(levels))
+        bandwiths = list(dict.fromkeys(bandwiths))
+
+        # Start at the selected configuration, then walk the gains back and forth
+        if self._bandwith in bandwiths:
+            bandwiths.remove(self._bandwith)
+            bandwiths.insert(0, self._bandwith)
+        current = self._autogain_gain or 1
+        if abs(levels[-1] - current) < abs(levels[0] - current):
+            levels.reverse()
+
+        records = np.zeros(len(bandwiths) * len(levels) * samples, dtype=SWEEP_RECORD)
+        previous_gain = self._gain
+        previous = {"bandwith": self._bandwith}
+        if self._autogain_gain is not None:
+            previous["gain"] = self._gain_names["V{}".format(self._autogain_gain)]
+        position = 0
+        last_step = {}
+
+        with self._tza_lock:
+            try:
+                for bandwith in bandwiths:
+                    for level in levels:
+                        step = {"bandwith": bandwith, "gain": self._gain_names["V{}".format(level)]}
+                        changes = {setting: value for setting, value in step.items() if last_step.get(setting) != value} # Also without the state cache
+                        if not self.configure(**changes):
+                            raise Exception("Cannot set bandwith {} and gain level {}.".format(bandwith, level))
+                        last_step = step
+                        self.wait_settled()
+
+                        timestamps, amplitudes, _ = self._tza_measure_raw(count=samples)
+                        block = records[position:position + samples]
+                        block["bandwith"] = int(self._bandwith_steps[bandwith][1:])
+                        block["gain"] = level
+                        block["index"] = np.arange(samples)
+                        block["timestamp"] = timestamps
+                        block["value"] = self._tza_convert_array(amplitudes)
+                        position += samples
+                    levels.reverse()
+            except BaseException as error:
+                try:
+                    self._tza_sweep_restore(previous, previous_gain)
+                except Exception as restore_error:
+                    raise error from restore_error # Report why the sweep failed, not only why restoring failed
+                raise
+            self._tza_sweep_restore(previous, previous_gain)
+        return records
+
+    def _tza_sweep_restore(self, previous: dict, previous_gain: str) -> None:
+        try:
+            self.configure(**previous)
+        finally:
+            self._gain = previous_gain # Fixed gains while sweeping, also restores auto-gain
+
+    def refresh(self) -> bool:
+        """
+        Discards the state cache and reads gain, bandwith and polarity from the device.
+
+        :return:
+            result(bool): Returns whether all settings were read successfully
+        """
+        self._state_valid.clear()
+        return self.tza_get_gain() is not None and self.tza_get_bandwith() is not None and self.tza_is_polarity_inverted() is not None
+
+    def tza_set_auto_zero(self, wait: bool = True) -> bool:
+        """
+        Runs the auto zero and waits the settling time of the device. With
+        adaptive settling enabled by set_settling() the wait ends as soon as
+        the readings are stable.
+
+        :param:
+            wait(bool): Wait until settled, otherwise use wait_settled() or settled_future()
+        
+        :return:
+            result(bool): Returns whether the auto zero was successful
+        """
+        if self._tza_auto_zero() is None:
+            return False
+        if wait:
+            self.wait_settled()
+        return True
+    
+    def tza_set_auto_zero_reset(self, wait: bool = True) -> bool:
+        """
+        Resets the auto zero and waits the settling time of the device. With
+        adaptive settling enabled by set_settling() the wait ends as soon as
+        the readings are stable.
+
+        :param:
+            wait(bool): Wait until settled, otherwise use wait_settled() or settled_future()
+        
+        :return:
+            result(bool): Returns whether the auto zero was reset successfully
+        """
+        if self._tza_auto_zero_reset() is None:
+            return False
+        if wait:
+            self.wait_settled()
+        return True
+
+    def _tza_auto_zero(self) -> float | None:
+        """
+        Sends the auto zero command and returns the time in seconds the device
+        needs to settle afterwards at the latest or None if the command failed.
+        """
+        self._state_valid.clear()
+        self._calibration = None # Offsets were measured with the previous zero
+        recv = self._tza_query("$A")
         if recv.count("Gain: ") > 0:
             self._initial_auto_zero = INITIAL_AUTO_ZERO.AUTO_ZERO.value
             self._max_gain = int(recv[-1])
-            sleep(0.2)
-            return True
+            return self._tza_settle(0.2)
         elif recv.count("A OK") > 0:
             self._initial_auto_zero = INITIAL_AUTO_ZERO.AUTO_ZERO.value
             self._max_gain = len(self._gain_steps) - 1
-            sleep(0.5)
-            return True
-        return False
-    
-    def tza_set_auto_zero_reset(self) -> bool:
-        self._tza_send("$R")
+            return self._tza_settle(0.5)
+        return None
 
-        recv = self._tza_recv()
+    def _tza_auto_zero_reset(self) -> float | None:
+        """
+        Sends the auto zero reset command and returns the time in seconds the
+        device needs to settle afterwards at the latest or None if the command failed.
+        """
+        self._state_valid.clear()
+        self._calibration = None # Offsets were measured with the previous zero
+        recv = self._tza_query("$R")
         if recv == "R OK":
             self._initial_auto_zero = INITIAL_AUTO_ZERO.AUTO_ZERO.value
             self._max_gain = len(self._gain_steps) - 1
-            sleep(0.05)
-            return True
-        return False
+            return self._tza_settle(0.05)
+        return None
 
-    def _tza_autogain(self, tmp_amplitude: str, recursion: int = 0, last_operation: int = 0) -> str:
+    @property
+    def settling(self) -> SettlingModel:
         """
-        This function automatically adjusts the gain by checking whether the
-        measured value is too high or too low and then setting a new gain until
-        the measured value is within a valid range.
+        Settling time model of the selected bandwith and gain.
+        """
+        return self._settling
+
+    @property
+    def is_settled(self) -> bool:
+        """
+        Whether the settling time after the last change of bandwith, gain or auto zero has passed.
+        """
+        return perf_counter() >= self._settle_deadline
+
+    def set_settling(self, model: SettlingModel | None = None, adaptive: bool = False, window: int = 3, tolerance: float = 0.1) -> None:
+        """
+        Configures how wait_settled() waits after a change of bandwith, gain or auto zero.
+
+        :param:
+            model(SettlingModel | None): Settling time model, the default model if None
+            adaptive(bool): Poll readings and stop waiting as soon as they are stable
+            window(int): Number of consecutive readings that must be stable
+            tolerance(float): Allowed spread of the readings in percent of the measuring range
+        """
+        self._settling = model if model is not None else SettlingModel()
+        self._settle_detector = StabilityDetector(window, tolerance) if adaptive else None
+
+    def tza_get_settle_time(self, bandwith: str | BANDWITH | None = None, gain: str | GAIN | None = None) -> float:
+        """
+        Returns the modelled settling time after switching to the given bandwith and gain.
+
+        :param:
+            bandwith(str | BANDWITH | None): Bandwith, the selected bandwith if None
+            gain(str | GAIN | None): Gain, the selected gain if None
+        
+        :return:
+            settle_time(float): Settling time in seconds
+        """
+        if type(bandwith) == BANDWITH:
+            bandwith = str(bandwith.value)
+        if type(gain) == GAIN:
+            gain = str(gain.value)
+        gain = self._autogain_gain if gain is None or gain == "auto-gain" else int(self._gain_steps[gain][1:])
+        return self._settling.settle_time(bandwith or self._bandwith, gain)
+
+    def wait_settled(self, timeout: float | None = None, adaptive: bool | None = None) -> bool:
+        """
+        Waits until the output is settled after the last change of bandwith,
+        gain or auto zero. With adaptive settling, readings are taken and the
+        wait ends as soon as they are stable, but never later than the
+        modelled settling time.
+
+        :param:
+            timeout(float | None): Maximum time to wait in seconds
+            adaptive(bool | None): Poll readings until stable, as configured by set_settling() if None
+        
+        :return:
+            result(bool): Returns whether the output is settled
+        """
+        if adaptive is None:
+            adaptive = self._settle_detector is not None
+        end = None if timeout is None else perf_counter() + timeout
+
+        if adaptive:
+            detector = self._settle_detector or StabilityDetector()
+            detector.reset()
+            with self._tza_lock:
+                if self._autogain_gain is None:
+                    self.tza_get_gain()
+                while perf_counter() < self._settle_deadline and (end is None or perf_counter() < end):
+                    amplitude = self._tza_parse_raw(self.tza_get_single_raw_measure())
+                    if detector.add(amplitude, self._gain_full_scale[self._autogain_gain or 1]):
+                        self._settle_deadline = perf_counter()
+                        return True
+
+        remaining = self._settle_deadline - perf_counter()
+        if end is not None and end - perf_counter() < remaining:
+            sleep(max(0.0, end - perf_counter()))
+            return self.is_settled
+        if remaining > 0:
+            sleep(remaining)
+        return True
+
+    def settled_future(self, callback: Callable[[Future], None] | None = None, adaptive: bool | None = None) -> Future:
+        """
+        Waits in a background thread until the output is settled.
+
+        :param:
+            callback(Callable[[Future], None] | None): Called with the future when settled
+            adaptive(bool | None): Poll readings until stable, as configured by set_settling() if None
+        
+        :return:
+            future(Future): Completes with the result of wait_settled()
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        def wait() -> None:
+            try:
+                future.set_result(self.wait_settled(adaptive=adaptive))
+            except Exception as e:
+                future.set_exception(e)
+
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=wait, daemon=True).start()
+        return future
+
+    def _tza_settle(self, settle_time: float) -> float:
         """
-        if recursion >= len(self._gain_steps):
-            return tmp_amplitude
+        Extends the settling deadline by a change that needs settle_time seconds to settle.
+        """
+        self._settle_deadline = max(self._settle_deadline, perf_counter() + settle_time)
+        return settle_time
+
+    @property
+    def calibration(self) -> Calibration | None:
+        """
+        Calibration whose offsets are subtracted from measurements.
+        """
+        return self._calibration
+
+    def set_calibration_store(self, store: CalibrationStore | None, temperature: float | None = None) -> None:
+        """
+        Sets the store of calibrations. On connect the auto zero is reset and
+        the offsets of a valid calibration of the device are subtracted from
+        measurements and its maximum gain is restored. Set the store before
+        connecting.
+
+        :param:
+            store(CalibrationStore | None): Calibration store
+            temperature(float | None): Current ambient temperature in °C for the temperature drift policy
+        """
+        self._calibration_store = store
+        self._temperature = temperature
+
+    def tza_calibrate(self, bandwiths: list[str | BANDWITH] | None = None, gains: list[str | GAIN] | None = None, samples: int = 64, reset: bool = True) -> Calibration | None:
+        """
+        Measures the offsets with no input signal at each bandwith and gain and
+        stores them. Afterwards the offsets are subtracted from measurements
+        until the next auto zero or auto zero reset. The offsets are measured
+        in the auto zero reset state the device is set to on connect. With
+        reset, an auto zero is run first to learn the maximum gain, which is
+        stored with the offsets. The previous bandwith and gain are restored.
+
+        :param:
+            bandwiths(list[str | BANDWITH] | None): Bandwiths to calibrate, all if None
+            gains(list[str | GAIN] | None): Gains to calibrate, all up to the maximum gain if None
+            samples(int): Number of measurements averaged per offset
+            reset(bool): Run an auto zero and reset it first
         
+        :return:
+            calibration(Calibration | None): New calibration or None if the auto zero reset failed
+        """
+        bandwiths = [str(bandwith.value) if type(bandwith) == BANDWITH else bandwith for bandwith in (bandwiths or self._bandwith_steps.keys())]
+        levels = list(range(1, self._max_gain + 1))
+        if gains is not None:
+            levels = sorted(int(self._gain_steps[str(gain.value) if type(gain) == GAIN else gain][1:]) for gain in gains if gain not in ("auto-gain", GAIN.AUTO))
+
+        with self._tza_lock:
+            if reset:
+                if self._tza_auto_zero() is None: # Reports the maximum gain, the reset does not
+                    return None
+                max_gain = self._max_gain
+                if not self.tza_set_auto_zero_reset():
+                    return None
+                self._max_gain = max_gain
+            levels = [level for level in levels if level <= self._max_gain]
+            self._calibration = None
+
+            previous_bandwith, previous_gain, previous_level = self._bandwith, self._gain, self._autogain_gain
+            self._gain = GAIN.X1.value # Fixed gains while calibrating
+            calibration = Calibration(self._tza_serial, self._tza_fw, time(), self._temperature, self._max_gain, self._initial_auto_zero)
+            try:
+                for bandwith in bandwiths:
+                    if not self.tza_set_bandwith(bandwith):
+                        raise Exception("Cannot set bandwith {}.".format(bandwith))
+                    calibration.offsets[bandwith] = {}
+                    for level in levels:
+                        if not self.tza_set_gain(self._gain_names["V{}".format(level)]):
+                            raise Exception("Cannot set gain level {}.".format(level))
+                        self.wait_settled()
+                        _, amplitudes, _ = self._tza_measure_raw(count=samples)
+                        calibration.offsets[bandwith][level] = float(np.mean(amplitudes))
+            finally:
+                self.tza_set_bandwith(previous_bandwith)
+                if previous_level is not None:
+                    self.tza_set_gain(self._gain_names["V{}".format(previous_level)])
+                self._gain = previous_gain
+
+            self._calibration = calibration
+            if self._calibration_store is not None:
+                self._calibration_store.put(calibration)
+                self._calibration_store.save()
+            return calibration
+
+    @property
+    def autogain_statistics(self) -> dict[str, int]:
+        """
+        Number of gain range changes and of additional device round trips caused by auto-gain.
+        """
+        return {
+            "range_changes": self._autogain_range_changes,
+            "extra_round_trips": self._autogain_round_trips
+        }
+
+    def reset_autogain_statistics(self) -> None:
+        """
+        Resets the auto-gain counters.
+        """
+        self._autogain_range_changes = 0
+        self._autogain_round_trips = 0
+
+    def set_autogain_thresholds(self, lower: float = 8.0, upper: float = 90.0) -> bool:
+        """
+        Sets the hysteresis thresholds of auto-gain. While the measured level
+        stays between both thresholds the gain is not changed.
+
+        :param:
+            lower(float): Switch to a higher gain below this level in percent of the range
+            upper(float): Switch to a lower gain above this level in percent of the range
+        
+        :return:
+            result(bool): Returns whether the thresholds were set successfully
+        """
+        if not 0.0 <= lower < upper:
+            return False
+        self._autogain_lower_level = float(lower)
+        self._autogain_upper_level = float(upper)
+        return True
+
+    def _tza_autogain_target(self, amplitude: float) -> int:
+        """
+        Returns the highest gain level at which the amplitude in nA stays below the upper threshold.
+        """
+        target = 1
+        for gain in range(1, self._max_gain + 1):
+            if abs(amplitude) * 100.0 / self._gain_full_scale[gain] < self._autogain_upper_level:
+                target = gain
+        return target
+
+    def _tza_autogain(self, tmp_amplitude: str) -> str:
+        """
+        This function automatically adjusts the gain by checking whether the
+        measured value is outside the thresholds and then jumping directly to
+        the gain level that fits the measured value.
+        """
         if self._autogain_gain is None:
             self.tza_get_gain() # Get gain as int if not already set
-
-        amplitude = float(tmp_amplitude[:-2].replace(",", "."))
-
-        level = 0.0
-
-        # To calculate if the gain needs to be moved up or down:
-        # The maximum output value in percent of each gain level is represented by the numbers (122.85, 12.285, ...)
-        #
-        # 1. Convert the measure amplitude into percent:
-        #    if gain 1: amplitude / 122.85
-        #    if gain 2: amplitude / 12.285
-        #    if gain 3: amplitude / 1.2285
-        #    if gain 4: amplitude / 122.85
-        #    if gain 5: amplitude / 12.285
-        #    if gain 6: amplitude / 1.2285
-        # 2. If the value in percent is above 90 and the set gain level is greater than 1, set the new gain to gain - 1.
-        #    If the value in percent is below 8 and the set gain level is lower than 5, set new gain to gain + 1
-
-        if self._autogain_gain == 1:
-            level = amplitude / 122.85
-        elif self._autogain_gain == 2:
-            level = amplitude / 12.285
-        elif self._autogain_gain == 3:
-            level = amplitude / 1.2285
-        elif self._autogain_gain == 4:
-            level = amplitude / 122.85 # This is not a typo
-        elif self._autogain_gain == 5:
-            level = amplitude / 12.285 # This is not a typo
-        elif self._autogain_gain == 6:
-            level = amplitude / 1.2285 # This is not a typo
-
-        if level > 90.0 and self._autogain_gain > 1:
-            self._autogain_gain -= 1
-            self.tza_set_gain(dict(zip(self._gain_steps.values(), self._gain_steps.keys()))["V{}".format(self._autogain_gain)]) # Set new gain
-            return self._tza_autogain(self.tza_get_single_raw_measure(), recursion + 1, 1) # Return new measurement or re-adjust gain
-        elif level < 8.0 and self._autogain_gain < self._max_gain:
-            if last_operation == 1: # Prevent jumping between two gain leves
-                recursion = len(self._gain_steps)
-            self._autogain_gain += 1
-            self.tza_set_gain(dict(zip(self._gain_steps.values(), self._gain_steps.keys()))["V{}".format(self._autogain_gain)]) # Set new gain
-            return self._tza_autogain(self.tza_get_single_raw_measure(), recursion + 1, 2) # Return new measurement or re-adjust gain
-        else:
-            return tmp_amplitude
+            self._autogain_round_trips += 1
+
+        # To calculate the new gain:
+        # 1. Convert the measured amplitude into percent of the range of the current gain level.
+        # 2. If the value in percent is above the upper or below the lower threshold,
+        #    calculate the highest gain level at which the amplitude is below the upper threshold.
+        # 3. Set this gain, wait for the front end to settle and measure again. A saturated measurement underestimates the
+        #    amplitude, so repeat until the value is within the thresholds.
+
+        last_direction = 0
+        for _ in range(len(self._gain_steps)):
+            amplitude = self._tza_parse_raw(tmp_amplitude)
+            level = abs(amplitude) * 100.0 / self._gain_full_scale[self._autogain_gain]
+
+            if level > self._autogain_upper_level and self._autogain_gain > 1:
+                direction = -1
+            elif level < self._autogain_lower_level and self._autogain_gain < self._max_gain:
+                direction = 1
+            else:
+                break
+
+            if last_direction == -direction: # Prevent jumping between two gain levels
+                break
+            last_direction = direction
+
+            target = self._tza_autogain_target(amplitude)
+            if direction < 0:
+                target = min(target, self._autogain_gain - 1)
+            else:
+                target = max(target, self._autogain_gain + 1)
+
+            self.tza_set_gain(self._gain_names["V{}".format(target)]) # Set new gain
+            self.wait_settled(adaptive=False) # Only the modelled time, readings are taken afterwards anyway
+            tmp_amplitude = self.tza_get_single_raw_measure()
+            self._autogain_range_changes += 1
+            if self._metrics is not None:
+                self._metrics.autogain_step()
+            self._autogain_round_trips += 2
+        return tmp_amplitude
 
     def tza_get_single_raw_measure(self) -> str:
         """
@@ -493,8 +1504,7 @@ class TZA500():
         :return:
             measurement(str): Raw measurement value in the format: I1,0nA or I1,0uA
         """
-        self._tza_send("$E")
-        return self._tza_recv()[1:].strip() # Remove 'I' prefix from response
+        return self._tza_query("$E")[1:].strip() # Remove 'I' prefix from response
 
     def tza_get_measurement(self) -> list[float, str]:
         """
@@ -503,9 +1513,19 @@ class TZA500():
         :return:
             list[value(float): Measured value, unit(str): Selected unit]
         """
-        amplitude = self.tza_get_single_raw_measure()
-        if self._gain == "auto-gain": # Adjust gain if auto-gain is chosen
-            amplitude = self._tza_autogain(amplitude)
+        with self._tza_lock:
+            amplitude = self.tza_get_single_raw_measure()
+            if self._gain == "auto-gain": # Adjust gain if auto-gain is chosen
+                amplitude = self._tza_autogain(amplitude)
+            amplitude = self._tza_parse_raw(amplitude)
+            if self._calibration is not None:
+                amplitude -= self._calibration.offset(self._bandwith, self._autogain_gain)
+        return [self._tza_convert(amplitude), self._unit]
+
+    def _tza_parse_raw(self, amplitude: str) -> float:
+        """
+        Converts a raw measurement in the format 1,0nA or 1,0uA to nA.
+        """
         unit = amplitude[amplitude.find("A")-1:] # Get unit from last two bytes of the response
 
         amplitude = amplitude[:-2].replace(",", ".")
@@ -513,32 +1533,377 @@ class TZA500():
 
         if unit == "uA":
             amplitude *= 1000 # Convert µA to nA
+        return amplitude
 
+    def _tza_unit_scale(self) -> tuple[float, float, int]:
+        """
+        Returns the sensitivity, the divisor from nA and the number of decimals of the selected unit.
+        """
         sensitivity = 1.0
         if self._unit not in ["nA", "µA", "mA", "A"]:
             sensitivity = self._sensitivity
-        
-        amplitude = amplitude / sensitivity
-        
+
         if self._unit.startswith("n"):
-            amplitude = round(amplitude, 3)
+            return sensitivity, 1.0, 3
         elif self._unit.startswith("µ"):
-            amplitude /= 1000 # Nano to micro
-            amplitude = round(amplitude, 6)
+            return sensitivity, 1000.0, 6 # Nano to micro
         elif self._unit.startswith("m"):
-            amplitude /= 1000000 # Nano to milli
-            amplitude = round(amplitude, 9)
-        else:
-            amplitude /= 1000000000 # For A and W
-            amplitude = round(amplitude, 12)
+            return sensitivity, 1000000.0, 9 # Nano to milli
+        return sensitivity, 1000000000.0, 12 # For A and W
+
+    def _tza_convert(self, amplitude: float) -> float:
+        """
+        Converts a value in nA to the selected unit.
+        """
+        sensitivity, divisor, decimals = self._tza_unit_scale()
+
+        amplitude = amplitude / sensitivity
+        if divisor != 1.0:
+            amplitude /= divisor
+        return round(amplitude, decimals)
 
-        return [amplitude, self._unit]
+    def convert(self, amplitudes: np.ndarray, wavelengths: float | np.ndarray | None = None) -> np.ndarray:
+        """
+        Converts values in nA, e.g. streamed or recorded with unit nA, to the
+        selected unit. For watt units the responsivity at the wavelength of
+        each sample can be given, e.g. during a monochromator scan.
+
+        :param:
+            amplitudes(np.ndarray): Values in nA
+            wavelengths(float | np.ndarray | None): Wavelength in nm of all or of each sample, the set wavelength if None
+        
+        :return:
+            values(np.ndarray): Values in the selected unit
+        """
+        return self._tza_convert_array(np.asarray(amplitudes, dtype=np.float64), wavelengths)
+
+    def _tza_convert_array(self, amplitudes: np.ndarray, wavelengths: float | np.ndarray | None = None) -> np.ndarray:
+        """
+        Converts an array of values in nA to the selected unit.
+        """
+        sensitivity, divisor, decimals = self._tza_unit_scale()
+        if wavelengths is not None and self._unit not in ["nA", "µA", "mA", "A"]:
+            if self._responsivity is None:
+                raise Exception("No responsivity curve set. Use set_responsivity() first.")
+            sensitivity = self._responsivity.responsivity(wavelengths)
+
+        amplitudes = amplitudes / sensitivity
+        if divisor != 1.0:
+            amplitudes /= divisor
+        return np.round(amplitudes, decimals, out=amplitudes)
+
+    def _tza_measure_raw(self, count: int | None = None, duration: float | None = None, corrected: bool = True) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Measures count samples or until duration seconds have passed. With a
+        fixed gain up to pipeline_depth requests are kept in flight. With
+        corrected the offsets of the calibration are subtracted. Replies read
+        at once get timestamps spread evenly since the previous read, as the
+        device answered them one after the other in that time.
+
+        :return:
+            tuple[timestamps(np.ndarray), amplitudes(np.ndarray): Values in nA, gains(np.ndarray): Gain codes]
+        """
+        size = count if count is not None else 1024
+        timestamps = np.empty(size, dtype=np.float64)
+        amplitudes = np.empty(size, dtype=np.float64)
+        gains = np.empty(size, dtype=np.uint8)
+
+        deadline = time() + duration if duration is not None else None
+        sent = 0
+        received = 0
+        parsed = 0
+        pending = bytearray() # Raw replies not parsed yet
+        tags = deque()
+        last_read = time()
+
+        with self._tza_lock:
+            autogain = self._gain == "auto-gain"
+            depth = 1 if autogain else self._pipeline.depth # The gain may change after every sample in auto-gain
+
+            try:
+                while True:
+                    try:
+                        while (count is None or sent < count) and len(tags) < depth and (deadline is None or time() < deadline):
+                            tags.append(self._pipeline.submit("$E"))
+                            sent += 1
+                        if len(tags) == 0:
+                            break
+
+                        if received + len(tags) > size: # Grow arrays for time bounded measurements
+                            size = max(size * 2, received + len(tags))
+                            timestamps = np.resize(timestamps, size)
+                            amplitudes = np.resize(amplitudes, size)
+                            gains = np.resize(gains, size)
+
+                        frames = self._tza_measure_step(tags, autogain, amplitudes, received, pending)
+                    except _CONNECTION_ERRORS:
+                        if not self._tza_try_reconnect():
+                            raise
+                        tags.clear() # Requests in flight are lost
+                        sent = received
+                        last_read = time()
+                        continue
+
+                    if autogain:
+                        parsed += 1
+
+                    now = time()
+                    timestamps[received:received + frames] = last_read + (now - last_read) * np.arange(1, frames + 1) / frames
+                    last_read = now
+                    gains[received:received + frames] = self._autogain_gain or 0
+                    received += frames
+
+                    if received - parsed >= 4096: # Parse in large blocks, the per call overhead is high
+                        parse_measurement_frames(pending, out=amplitudes[parsed:received])
+                        pending.clear()
+                        parsed = received
+            finally:
+                if self._pipeline.in_flight > 0: # Aborted, e.g. by a parse error or KeyboardInterrupt. Replies in flight can no longer be matched.
+                    self._pipeline.resync()
+
+        if parsed < received:
+            parse_measurement_frames(pending, out=amplitudes[parsed:received])
+        if corrected and self._calibration is not None: # Offset correction of all samples at once
+            amplitudes[:received] -= self._calibration.offset_table(self._bandwith)[gains[:received]]
+        return timestamps[:received], amplitudes[:received], gains[:received]
+
+    def _tza_measure_step(self, tags: deque, autogain: bool, amplitudes: np.ndarray, received: int, pending: bytearray) -> int:
+        """
+        Receives the next replies of _tza_measure_raw and returns how many were received.
+        """
+        if autogain:
+            amplitude = self._tza_autogain(self._pipeline.result(tags.popleft())[1:].strip()) # Remove 'I' prefix from response
+            amplitudes[received] = self._tza_parse_raw(amplitude)
+            return 1
+
+        data, frames = self._pipeline.collect_raw(len(tags)) # Take all replies that have arrived as raw bytes
+        pending += data
+        for _ in range(frames):
+            tags.popleft()
+        return frames
+
+    def tza_get_measurements(self, n: int, timestamps: bool = False, gains: bool = False, wavelengths: float | np.ndarray | None = None) -> tuple:
+        """
+        Returns n measurement values in the selected unit. Requests are
+        pipelined and the unit conversion is applied to all values at once.
+
+        :param:
+            n(int): Number of measurements
+            timestamps(bool): Also return the Unix timestamp of each measurement
+            gains(bool): Also return the gain code (1 = x1, 2 = x10, ...) of each measurement
+            wavelengths(float | np.ndarray | None): Wavelength in nm of each measurement for watt units, the set wavelength if None
+        
+        :return:
+            tuple[values(np.ndarray): Measured values, unit(str): Selected unit, (timestamps(np.ndarray)), (gains(np.ndarray))]
+        """
+        if n < 0:
+            raise Exception("Invalid number of measurements.")
+        if np.ndim(wavelengths) > 0 and len(wavelengths) != n:
+            raise Exception("Invalid wavelengths. One wavelength per measurement is needed.")
+        return self._tza_measurements_result(*self._tza_measure_raw(count=n), timestamps, gains, wavelengths)
+
+    def tza_get_measurements_for(self, duration: float, timestamps: bool = False, gains: bool = False) -> tuple:
+        """
+        Returns all measurement values in the selected unit taken within duration seconds.
+
+        :param:
+            duration(float): Measurement time in seconds
+            timestamps(bool): Also return the Unix timestamp of each measurement
+            gains(bool): Also return the gain code (1 = x1, 2 = x10, ...) of each measurement
+        
+        :return:
+            tuple[values(np.ndarray): Measured values, unit(str): Selected unit, (timestamps(np.ndarray)), (gains(np.ndarray))]
+        """
+        return self._tza_measurements_result(*self._tza_measure_raw(duration=duration), timestamps, gains)
+
+    def tza_get_windows(self, output_rate: float, windows: int | None = None, duration: float | None = None) -> tuple[np.ndarray, str]:
+        """
+        Oversamples at up to twice the selected bandwith and reduces the raw
+        samples of every window of 1 / output_rate seconds to mean, standard
+        deviation, minimum, maximum and count. The samples are paced evenly
+        over the whole window. Only one record per window is kept.
+
+        :param:
+            output_rate(float): Number of windows per second
+            windows(int | None): Number of windows
+            duration(float | None): Measurement time in seconds if windows is None
+        
+        :return:
+            tuple[records(np.ndarray): Records with the fields timestamp, mean, std, min, max and count in the selected unit, unit(str): Selected unit]
+        """
+        if output_rate <= 0:
+            raise Exception("Invalid output rate. The output rate must be greater than 0.")
+        if windows is None:
+            if duration is None:
+                raise Exception("Either windows or duration must be given.")
+            windows = max(1, int(round(duration * output_rate)))
+
+        window_time = 1.0 / output_rate
+        period = 1.0 / self._bandwith_sample_rates[self._bandwith]
+        max_samples = max(1, int(window_time / period))
+
+        records = np.zeros(windows, dtype=WINDOW_RECORD)
+        statistics = WindowStatistics()
+        window_end = time()
+
+        for i in range(windows):
+            window_start = window_end
+            window_end += window_time
+            statistics.reset()
+            # Spread the samples over the window, consecutive samples closer than the period are correlated by the filter
+            while statistics.count < max_samples:
+                now = time()
+                if now >= window_end:
+                    break
+                due = min(max_samples, int((now - window_start) / period) + 1) - statistics.count
+                if due <= 0:
+                    sleep(min(window_start + statistics.count * period, window_end) - now)
+                    continue
+                _, amplitudes, _ = self._tza_measure_raw(count=due, duration=window_end - now)
+                statistics.add(amplitudes)
+
+            delay = window_end - time()
+            if delay > 0.0: # Bandwith limit reached before the end of the window
+                sleep(delay)
+
+            records[i] = (time(), statistics.mean, statistics.std, statistics.min, statistics.max, statistics.count)
+
+        for field in ("mean", "std", "min", "max"):
+            records[field] = self._tza_convert_array(records[field])
+        return records, self._unit
+
+    def _tza_measurements_result(self, sample_timestamps: np.ndarray, amplitudes: np.ndarray, sample_gains: np.ndarray, timestamps: bool, gains: bool,
+                                 wavelengths: float | np.ndarray | None = None) -> tuple:
+        result = (self._tza_convert_array(amplitudes, wavelengths), self._unit)
+        if timestamps:
+            result += (sample_timestamps,)
+        if gains:
+            result += (sample_gains,)
+        return result
+
+    @property
+    def is_streaming(self) -> bool:
+        return self._stream_thread is not None and self._stream_thread.is_alive()
+
+    @property
+    def stream_overruns(self) -> int:
+        return self._stream_buffer.overruns if self._stream_buffer is not None else 0
+
+    def start_stream(self, rate: float | None = None, buffer_size: int = 65536) -> bool:
+        """
+        Starts continuous acquisition in a background thread. Measurements in
+        the selected unit are stored in a ring buffer and can be fetched with
+        read_stream(). Records that do not fit into a full buffer are dropped
+        and counted in stream_overruns.
+
+        :param:
+            rate(float | None): Sampling rate in Hz or None to sample as fast as possible
+            buffer_size(int): Number of records the ring buffer can hold
+        
+        :return:
+            result(bool): Returns whether the stream was started
+        """
+        if self._device is None or self.is_streaming:
+            return False
+        if rate is not None and rate <= 0:
+            raise Exception("Invalid rate. The rate must be greater than 0.")
+
+        self._stream_buffer = RingBuffer(buffer_size)
+        self._stream_error = None
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(target=self._tza_stream_loop, args=(1.0 / rate if rate else 0.0,), name="TZA500 stream", daemon=True)
+        self._stream_thread.start()
+        return True
+
+    def stop_stream(self) -> None:
+        """
+        Stops continuous acquisition. Records still in the buffer can be fetched with read_stream().
+        """
+        self._stream_stop.set()
+        if self._stream_thread is not None and self._stream_thread is not threading.current_thread():
+            self._stream_thread.join()
+        self._stream_thread = None
+
+    def read_stream(self, max_samples: int | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Removes and returns buffered stream records in order.
+
+        :param:
+            max_samples(int | None): Maximum number of records to return
+        
+        :return:
+            tuple[timestamps(np.ndarray): Unix timestamps, values(np.ndarray): Values in the selected unit, gains(np.ndarray): Gain codes (1 = x1, 2 = x10, ...)]
+        """
+        if self._stream_error is not None:
+            error, self._stream_error = self._stream_error, None
+            raise error
+        if self._stream_buffer is None:
+            raise Exception("Stream error: stream not started.")
+        return self._stream_buffer.drain(max_samples)
+
+    def _tza_stream_loop(self, period: float) -> None:
+        next_sample = perf_counter()
+        try:
+            while not self._stream_stop.is_set():
+                value = self.tza_get_measurement()[0]
+                self._stream_buffer.push(time(), value, self._autogain_gain or 0)
+
+                if period > 0.0:
+                    next_sample += period
+                    delay = next_sample - perf_counter()
+                    if delay > 0.0:
+                        self._stream_stop.wait(delay)
+                    elif delay < -period: # Too far behind, do not try to catch up
+                        next_sample = perf_counter()
+        except Exception as e:
+            self._stream_error = e
     
     def disconnect(self) -> None:
         """
         Disconnects the connected device.
         """
+        self.stop_stream()
         if self._device is not None:
             self._device.close()
             self._device = None
         self.__init__()
+
+
+# Optional parts of the package, imported on first use to keep "import pytza500" fast
+_LAZY_IMPORTS = {
+    "AsyncTZA500": "aio",
+    "TZA500Pool": "pool",
+    "FakeTZA500Device": "simulator",
+    "CaptureWriter": "capture",
+    "CaptureReader": "capture",
+    "TZA500Server": "server",
+    "TZA500Client": "server",
+    "TriggeredCapture": "trigger",
+    "Segment": "trigger",
+    "EDGE": "trigger",
+    "ThresholdTrigger": "trigger",
+    "EdgeTrigger": "trigger",
+    "WindowTrigger": "trigger",
+    "SlopeTrigger": "trigger",
+    "AnalysisPipeline": "analysis"
+}
+
+__all__ = [
+    "TZA500", "BANDWITH", "INITIAL_AUTO_ZERO", "GAIN", "UNITS", "SWEEP_RECORD",
+    "RingBuffer", "CommandPipeline", "count_frames", "parse_measurement_frames", "Metrics",
+    "WindowStatistics", "WINDOW_RECORD", "SettlingModel", "StabilityDetector", "ResponsivityCurve",
+    "Calibration", "CalibrationStore", "DeviceInfo", "DeviceDiscovery",
+    "Transport", "HandleTransport", "FTD2XXTransport", "SerialTransport", "LoopbackTransport"
+] + list(_LAZY_IMPORTS.keys()) # Keeps "from pytza500 import *" complete without the imported modules
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module("." + _LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_LAZY_IMPORTS.keys()))
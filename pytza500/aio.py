@@ -0,0 +1,414 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import asyncio
+import threading
+import numpy as np
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+from . import TZA500, UNITS, GAIN, BANDWITH, ResponsivityCurve
+
+
+_executor: ThreadPoolExecutor = None # Worker threads shared by all AsyncTZA500 instances
+_executor_lock: threading.Lock = threading.Lock()
+_max_workers: int | None = None
+
+
+def set_max_workers(max_workers: int | None) -> None:
+    """
+    Sets the maximum number of worker threads shared by all AsyncTZA500
+    instances. Threads are only started while commands of that many devices
+    run at the same time. Commands already submitted finish on the previous
+    threads.
+
+    :param:
+        max_workers(int | None): Maximum number of worker threads, the ThreadPoolExecutor default if None
+    """
+    global _executor, _max_workers
+    with _executor_lock:
+        _max_workers = max_workers
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="AsyncTZA500")
+        return _executor
+
+
+class AsyncTZA500():
+    def __init__(self, tza: TZA500 | None = None) -> None:
+        """
+        Initializes the AsyncTZA500 class.
+
+        Device commands run on worker threads shared by all instances, so the
+        event loop is never blocked and several devices can be serviced
+        concurrently from one loop. The commands of one instance run one
+        after another in the order they were awaited.
+
+        :param:
+            tza(TZA500 | None): TZA500 instance to wrap. A new instance is created if None.
+        """
+        self._tza: TZA500 = tza if tza is not None else TZA500()
+        self._lock: asyncio.Lock = asyncio.Lock() # Keeps the command order and settling times exclusive to the command that caused them
+
+    async def __aenter__(self) -> "AsyncTZA500":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _run(self, function, *args, **kwargs):
+        async with self._lock:
+            return await asyncio.get_running_loop().run_in_executor(_get_executor(), lambda: function(*args, **kwargs))
+
+    @property
+    def tza(self) -> TZA500:
+        return self._tza
+
+    @property
+    def sensitivity(self) -> float:
+        return self._tza.sensitivity
+    
+    @sensitivity.setter
+    def sensitivity(self, value: float) -> None:
+        self._tza.sensitivity = value
+
+    @property
+    def unit(self) -> str:
+        return self._tza.unit
+    
+    @property
+    def initial_auto_zero(self) -> str:
+        return self._tza.initial_auto_zero
+    
+    @property
+    def invert_input_polarity(self) -> str:
+        return self._tza.invert_input_polarity
+
+    @property
+    def tza_firmware_version(self) -> str:
+        return self._tza.tza_firmware_version
+    
+    @property
+    def tza_serial_number(self) -> str:
+        return self._tza.tza_serial_number
+    
+    @property
+    def tza_date_of_manufacturing(self) -> str:
+        return self._tza.tza_date_of_manufacturing
+
+    @staticmethod
+    async def find_devices() -> list[str]:
+        """
+        Return list of found devices
+
+        :result:
+            found_devices(list[str]): list of found TZA500 devices
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, TZA500.find_devices)
+
+    async def connect(self, device: str) -> bool:
+        """
+        Connects to TZA500 and initializes it
+
+        :param:
+            device(str): Device string in the format "TZA500 - serial_number" E.g. "TZA500 - 12345"
+        
+        :return:
+            result(bool): Returns whether the device was successfully connected and initialized.
+        """
+        return await self._run(self._tza.connect, device)
+
+    async def connect_transport(self, transport) -> bool:
+        """
+        Connects to TZA500 through the given transport and initializes it
+
+        :param:
+            transport(Transport): Transport to the device, e.g. SerialTransport("/dev/ttyUSB0")
+        
+        :return:
+            result(bool): Returns whether the device was successfully connected and initialized.
+        """
+        return await self._run(self._tza.connect_transport, transport)
+
+    async def disconnect(self) -> None:
+        """
+        Disconnects the connected device.
+        """
+        await self._run(self._tza.disconnect)
+
+    async def close(self) -> None:
+        """
+        Disconnects the connected device.
+        """
+        await self.disconnect()
+
+    async def tza_get_info(self) -> str:
+        """
+        Returns the device info as a printable string.
+
+        :return:
+            info(str): Printable device info
+        """
+        return await self._run(self._tza.tza_get_info)
+
+    def set_unit(self, unit: UNITS) -> bool:
+        """
+        Sets the specified unit as the unit used for measurements.
+
+        :param:
+            unit(UNITS): Unit to use for measurements
+        
+        :return:
+            result(bool): Returns whether the unit was set successfully
+        """
+        return self._tza.set_unit(unit)
+
+    def set_responsivity(self, curve: ResponsivityCurve | None) -> None:
+        """
+        Sets the calibration curve of the photodiode used for watt units.
+
+        :param:
+            curve(ResponsivityCurve | None): Calibration curve
+        """
+        self._tza.set_responsivity(curve)
+
+    def tza_set_wavelength(self, wavelength: float) -> bool:
+        """
+        Sets the sensitivity to the responsivity of the calibration curve at the wavelength.
+
+        :param:
+            wavelength(float): Wavelength in nm
+        
+        :return:
+            result(bool): Returns whether a calibration curve is set and covers the wavelength
+        """
+        return self._tza.tza_set_wavelength(wavelength)
+
+    def tza_get_wavelength(self) -> float | None:
+        return self._tza.tza_get_wavelength()
+
+    async def tza_is_polarity_inverted(self) -> bool | None:
+        """
+        Returns whether the polarity is inverted or not.
+
+        :return:
+            is_polarity_inverted(bool): True if the polarity is inverted
+        """
+        return await self._run(self._tza.tza_is_polarity_inverted)
+
+    async def tza_set_polarity(self, invert_polarity: bool) -> bool:
+        """
+        Sets whether the polarity should be inverted or not.
+
+        :param:
+            invert_polarity(bool): Whether the polarity should be inverted or not
+        
+        :return:
+            result(bool): Returns whether the polarity was set successfully
+        """
+        return await self._run(self._tza.tza_set_polarity, invert_polarity)
+
+    async def tza_get_bandwith(self) -> str | None:
+        """
+        Returns the current bandwith.
+
+        :return:
+            bandwith(str): Current bandwith in format: 10 kHz, 1 kHz, ...
+        """
+        return await self._run(self._tza.tza_get_bandwith)
+
+    async def tza_set_bandwith(self, bandwith: str | BANDWITH) -> bool:
+        """
+        Sets the specified bandwith.
+
+        :param:
+            bandwith(str | BANDWITH): Bandwith to set
+        
+        :return:
+            result(bool): Returns whether the bandwith was set successfully
+        """
+        return await self._run(self._tza.tza_set_bandwith, bandwith)
+
+    async def tza_get_gain(self) -> str | None:
+        """
+        Returns the current gain.
+
+        :return:
+            gain(str): Current gain in format: x1, x10, ...
+        """
+        return await self._run(self._tza.tza_get_gain)
+
+    async def tza_set_gain(self, gain: str | GAIN) -> bool:
+        """
+        Sets the specified gain.
+
+        :param:
+            gain(str | GAIN): Gain to set
+        
+        :return:
+            result(bool): Returns whether the gain was set successfully
+        """
+        return await self._run(self._tza.tza_set_gain, gain)
+
+    async def configure(self, **settings) -> bool:
+        """
+        Applies several settings as one transaction, see TZA500.configure().
+
+        :return:
+            result(bool): Returns whether all settings were applied, nothing is changed otherwise
+        """
+        return await self._run(self._tza.configure, **settings)
+
+    async def sweep(self, gains: list[str | GAIN] | None = None, bandwiths: list[str | BANDWITH] | None = None, samples: int = 100) -> np.ndarray:
+        """
+        Measures samples values at every combination of gain and bandwith, see TZA500.sweep().
+
+        :return:
+            records(np.ndarray): SWEEP_RECORD records with bandwith, gain, index, timestamp and value in the selected unit
+        """
+        return await self._run(self._tza.sweep, gains, bandwiths, samples)
+
+    async def refresh(self) -> bool:
+        """
+        Discards the state cache and reads gain, bandwith and polarity from the device.
+
+        :return:
+            result(bool): Returns whether all settings were read successfully
+        """
+        return await self._run(self._tza.refresh)
+
+    async def tza_set_auto_zero(self) -> bool:
+        """
+        Runs the auto zero. Settling afterwards is awaited without blocking the event loop.
+
+        :return:
+            result(bool): Returns whether the auto zero was successful
+        """
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(_get_executor(), self._tza._tza_auto_zero) is None:
+                return False
+            await loop.run_in_executor(_get_executor(), self._tza.wait_settled)
+            return True
+
+    async def tza_set_auto_zero_reset(self) -> bool:
+        """
+        Resets the auto zero. Settling afterwards is awaited without blocking the event loop.
+
+        :return:
+            result(bool): Returns whether the auto zero was reset successfully
+        """
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(_get_executor(), self._tza._tza_auto_zero_reset) is None:
+                return False
+            await loop.run_in_executor(_get_executor(), self._tza.wait_settled)
+            return True
+
+    async def wait_settled(self, timeout: float | None = None, adaptive: bool | None = None) -> bool:
+        """
+        Waits until the output is settled after the last change of bandwith, gain or auto zero.
+
+        :param:
+            timeout(float | None): Maximum time to wait in seconds
+            adaptive(bool | None): Poll readings until stable, as configured by set_settling() if None
+        
+        :return:
+            result(bool): Returns whether the output is settled
+        """
+        return await self._run(self._tza.wait_settled, timeout, adaptive)
+
+    async def tza_get_single_raw_measure(self) -> str:
+        """
+        Returns a single raw measurement result in the format: I1,0nA or I1,0uA
+
+        :return:
+            measurement(str): Raw measurement value in the format: I1,0nA or I1,0uA
+        """
+        return await self._run(self._tza.tza_get_single_raw_measure)
+
+    async def tza_get_measurement(self) -> list[float, str]:
+        """
+        This function returns a single measurement value in the selected unit.
+
+        :return:
+            list[value(float): Measured value, unit(str): Selected unit]
+        """
+        return await self._run(self._tza.tza_get_measurement)
+
+    async def tza_get_measurements(self, n: int, timestamps: bool = False, gains: bool = False, wavelengths: float | np.ndarray | None = None) -> tuple:
+        """
+        Returns n measurement values in the selected unit.
+
+        :param:
+            n(int): Number of measurements
+            timestamps(bool): Also return the Unix timestamp of each measurement
+            gains(bool): Also return the gain code (1 = x1, 2 = x10, ...) of each measurement
+            wavelengths(float | np.ndarray | None): Wavelength in nm of each measurement for watt units, the set wavelength if None
+        
+        :return:
+            tuple[values(np.ndarray): Measured values, unit(str): Selected unit, (timestamps(np.ndarray)), (gains(np.ndarray))]
+        """
+        return await self._run(self._tza.tza_get_measurements, n, timestamps, gains, wavelengths)
+
+    async def tza_get_measurements_for(self, duration: float, timestamps: bool = False, gains: bool = False) -> tuple:
+        """
+        Returns all measurement values in the selected unit taken within duration seconds.
+
+        :param:
+            duration(float): Measurement time in seconds
+            timestamps(bool): Also return the Unix timestamp of each measurement
+            gains(bool): Also return the gain code (1 = x1, 2 = x10, ...) of each measurement
+        
+        :return:
+            tuple[values(np.ndarray): Measured values, unit(str): Selected unit, (timestamps(np.ndarray)), (gains(np.ndarray))]
+        """
+        return await self._run(self._tza.tza_get_measurements_for, duration, timestamps, gains)
+
+    async def measurements(self, rate: float | None = None, batch_size: int = 1) -> AsyncIterator[tuple[np.ndarray, str]]:
+        """
+        Yields measurements continuously for use with async for.
+
+        :param:
+            rate(float | None): Maximum number of batches per second or None to measure as fast as possible
+            batch_size(int): Number of measurements per batch
+        
+        :return:
+            tuple[values(np.ndarray): Measured values, unit(str): Selected unit] for every batch
+        """
+        loop = asyncio.get_running_loop()
+        period = 1.0 / rate if rate else 0.0
+        next_batch = loop.time()
+        while True:
+            yield await self.tza_get_measurements(batch_size)
+            if period > 0.0:
+                next_batch += period
+                await asyncio.sleep(max(0.0, next_batch - loop.time()))
@@ -0,0 +1,371 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import queue
+import pickle
+import threading
+import traceback
+import numpy as np
+import multiprocessing
+from multiprocessing import shared_memory
+from collections.abc import Callable
+from time import sleep, monotonic
+
+
+# Counters at the start of the shared memory, one int64 each:
+# samples written, stop flag, then the samples read by each stage
+_WRITTEN = 0
+_STOP = 1
+_FIRST_STAGE = 2
+
+
+class _SharedRing():
+    def __init__(self, buffer, size: int, stages: int) -> None:
+        """
+        Views of the counters and the timestamp, value and gain arrays in a shared memory buffer.
+        """
+        counters_size = 8 * (_FIRST_STAGE + stages)
+        self.counters: np.ndarray = np.ndarray(_FIRST_STAGE + stages, dtype=np.int64, buffer=buffer)
+        self.timestamps: np.ndarray = np.ndarray(size, dtype=np.float64, buffer=buffer, offset=counters_size)
+        self.values: np.ndarray = np.ndarray(size, dtype=np.float64, buffer=buffer, offset=counters_size + 8 * size)
+        self.gains: np.ndarray = np.ndarray(size, dtype=np.uint8, buffer=buffer, offset=counters_size + 16 * size)
+
+    @staticmethod
+    def nbytes(size: int, stages: int) -> int:
+        return 8 * (_FIRST_STAGE + stages) + 17 * size
+
+
+def _stage_worker(name: str, function: Callable, shm_name: str, size: int, stages: int, index: int, batch_size: int, results, ready) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = _SharedRing(shm.buf, size, stages)
+    ready.release()
+    try:
+        while True:
+            written = int(ring.counters[_WRITTEN])
+            read = int(ring.counters[_FIRST_STAGE + index])
+            if read == written:
+                if ring.counters[_STOP]:
+                    break # Stopped and all samples processed
+                sleep(0.001)
+                continue
+
+            start = read % size
+            count = min(written - read, size - start, batch_size) # Contiguous part up to the end of the ring
+            result = function(ring.timestamps[start:start + count], ring.values[start:start + count], ring.gains[start:start + count])
+            # The queue pickles in a feeder thread, a result viewing the ring must be serialized before the samples are freed
+            payload = pickle.dumps((name, result)) if result is not None else None
+            del result # A live view would also keep shm.close() from releasing the buffer
+            ring.counters[_FIRST_STAGE + index] = read + count # Free the samples after they are processed
+            if payload is not None:
+                results.put(payload)
+    except Exception:
+        results.put(pickle.dumps((name, Exception("Analysis stage {} failed:\n{}".format(name, traceback.format_exc())))))
+    finally:
+        ring.counters[_FIRST_STAGE + index] = np.iinfo(np.int64).max # Never hold back the acquisition after exiting
+        result = None # Release the views before closing the shared memory, also after an exception
+        del ring
+        shm.close()
+
+
+class AnalysisPipeline():
+    def __init__(self, tza=None, size: int = 1 << 20, max_wait: float = 0.1, rate: float | None = None) -> None:
+        """
+        Initializes the AnalysisPipeline class.
+
+        Samples are written into a ring buffer in shared memory. Every stage
+        runs in its own process and is called with NumPy views of the ring,
+        so samples are not copied or pickled and analysis does not compete
+        with acquisition for the GIL. With a device, its stream is written
+        into the ring by a background thread.
+
+        When the slowest stage falls behind by size samples, writing waits up
+        to max_wait seconds for it. Samples that still do not fit are dropped
+        and counted.
+
+        :param:
+            tza(TZA500 | None): Device whose stream feeds the pipeline, None to only use write()
+            size(int): Number of samples the ring can hold
+            max_wait(float): Time in seconds writing waits for the stages before samples are dropped
+            rate(float | None): Sampling rate in Hz of the stream started by the pipeline
+        """
+        if size < 1:
+            raise Exception("Invalid buffer size. The size must be at least 1.")
+
+        self._tza = tza
+        self._size: int = int(size)
+        self._max_wait: float = max_wait
+        self._rate: float | None = rate
+        self._stages: list[tuple[str, Callable, int]] = []
+
+        self._shm: shared_memory.SharedMemory = None
+        self._ring: _SharedRing = None
+        self._processes: list = []
+        self._results = None
+        self._dropped: int = 0
+        self._written: int = 0
+
+        self._feeder: threading.Thread = None
+        self._feeder_stop: threading.Event = threading.Event()
+        self._started_stream: bool = False
+        self._error: Exception = None
+        self._held: list[tuple[str, object]] = [] # Results received after a stage exception, returned by the next call
+
+    def __enter__(self) -> "AnalysisPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._shm is not None
+
+    @property
+    def written(self) -> int:
+        """
+        Number of samples written into the ring.
+        """
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of samples dropped because the stages were too slow.
+        """
+        return self._dropped
+
+    @property
+    def stream_overruns(self) -> int:
+        """
+        Number of samples lost by the stream of the device before they reached the pipeline.
+        """
+        return self._tza.stream_overruns if self._tza is not None else 0
+
+    def add_stage(self, name: str, function: Callable[[np.ndarray, np.ndarray, np.ndarray], object], batch_size: int = 65536) -> None:
+        """
+        Adds a stage. The function is called in its own process with views of
+        the next samples: function(timestamps, values, gains). Results other
+        than None are returned by results(), they are pickled before the
+        samples are freed and may contain views. The views are only valid
+        during the call, copy them to keep samples elsewhere. The function
+        must be picklable, e.g. defined at module level.
+
+        :param:
+            name(str): Name of the stage
+            function(Callable[[np.ndarray, np.ndarray, np.ndarray], object]): Stage function
+            batch_size(int): Maximum number of samples per call
+        """
+        if self.is_running:
+            raise Exception("Stages must be added before the pipeline is started.")
+        if any(stage[0] == name for stage in self._stages):
+            raise Exception("Stage {} already exists.".format(name))
+        self._stages.append((name, function, max(1, int(batch_size))))
+
+    def lag(self) -> dict[str, int]:
+        """
+        Returns the number of samples each stage has not processed yet.
+        """
+        if not self.is_running:
+            return {}
+        written = int(self._ring.counters[_WRITTEN])
+        return {name: max(0, written - int(self._ring.counters[_FIRST_STAGE + i])) for i, (name, _, _) in enumerate(self._stages)}
+
+    def start(self) -> None:
+        """
+        Creates the shared memory, starts a process per stage and, with a
+        device, the stream and the thread writing it into the ring.
+        """
+        if self.is_running:
+            return
+        if len(self._stages) == 0:
+            raise Exception("No analysis stages added.")
+        if self._tza is not None and self._tza.is_streaming:
+            raise Exception("Stream already running. Every sample is read by only one consumer, stop the stream first.")
+
+        context = multiprocessing.get_context("spawn") # Forking a process with running acquisition threads is unsafe
+        self._shm = shared_memory.SharedMemory(create=True, size=_SharedRing.nbytes(self._size, len(self._stages)))
+        self._ring = _SharedRing(self._shm.buf, self._size, len(self._stages))
+        self._ring.counters[:] = 0
+        self._results = context.Queue()
+        self._written = 0
+        self._dropped = 0
+        self._error = None
+        self._held = []
+
+        self._processes = []
+        ready = context.Semaphore(0)
+        for index, (name, function, batch_size) in enumerate(self._stages):
+            process = context.Process(target=_stage_worker, args=(name, function, self._shm.name, self._size, len(self._stages), index, batch_size, self._results, ready),
+                                      name="TZA500 analysis {}".format(name), daemon=True)
+            process.start()
+            self._processes.append(process)
+        for process in self._processes: # Wait until the stages consume, otherwise the first samples are dropped
+            if not ready.acquire(timeout=30.0):
+                self.stop()
+                raise Exception("Analysis stage processes did not start.")
+
+        if self._tza is not None:
+            if not self._tza.start_stream(self._rate):
+                self.stop()
+                raise Exception("Device not connected.")
+            self._started_stream = True
+            self._feeder_stop.clear()
+            self._feeder = threading.Thread(target=self._feed_loop, name="TZA500 analysis feeder", daemon=True)
+            self._feeder.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stops writing, lets the stages process the remaining samples and
+        releases the shared memory. Results are collected while waiting and
+        can still be fetched afterwards. A stage still running after the
+        timeout is terminated and results() raises an exception for it.
+
+        :param:
+            timeout(float): Time in seconds to wait for each stage process
+        """
+        self._feeder_stop.set()
+        if self._feeder is not None:
+            self._feeder.join()
+            self._feeder = None
+        if self._started_stream:
+            self._tza.stop_stream()
+            self._started_stream = False
+        if self._shm is None:
+            return
+
+        self._ring.counters[_STOP] = 1
+        for (name, _, _), process in zip(self._stages, self._processes):
+            deadline = monotonic() + timeout
+            while process.is_alive() and monotonic() < deadline:
+                self._drain() # A worker only exits once its results are read from the pipe
+                process.join(0.01)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                self._held.append((name, Exception("Analysis stage {} did not stop in time and was terminated, its later results are lost.".format(name))))
+                self._results = None # A result may be written partly, the queue cannot be read anymore
+        self._processes = []
+        if self._results is not None:
+            self._drain()
+            self._results = None # All results are held, results() does not wait for more
+
+        self._ring = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def write(self, timestamps: np.ndarray, values: np.ndarray, gains: np.ndarray) -> int:
+        """
+        Writes samples into the ring, waiting up to max_wait seconds for the
+        stages to free space. Samples that do not fit are dropped.
+
+        :param:
+            timestamps(np.ndarray): Unix timestamps
+            values(np.ndarray): Values
+            gains(np.ndarray): Gain codes (1 = x1, 2 = x10, ...)
+        
+        :return:
+            count(int): Number of samples written
+        """
+        if not self.is_running:
+            raise Exception("Analysis pipeline not started.")
+
+        counters = self._ring.counters
+        total = len(values)
+        offset = 0
+        deadline = monotonic() + self._max_wait
+        while offset < total:
+            written = int(counters[_WRITTEN])
+            free = self._size - (written - int(counters[_FIRST_STAGE:].min()))
+            if free <= 0:
+                if monotonic() < deadline:
+                    sleep(0.0005) # Backpressure, wait for the slowest stage
+                    continue
+                break
+
+            start = written % self._size
+            count = min(total - offset, free, self._size - start)
+            self._ring.timestamps[start:start + count] = timestamps[offset:offset + count]
+            self._ring.values[start:start + count] = values[offset:offset + count]
+            self._ring.gains[start:start + count] = gains[offset:offset + count]
+            counters[_WRITTEN] = written + count # Publish the samples after they are written
+            offset += count
+
+        self._written += offset
+        self._dropped += total - offset
+        return offset
+
+    def results(self, timeout: float | None = 0.0) -> list[tuple[str, object]]:
+        """
+        Returns the results of the stages received so far. An exception of a
+        stage is raised after the results received before it are returned,
+        i.e. right away if there are none, otherwise on the next call.
+
+        :param:
+            timeout(float | None): Time in seconds to wait for the first result, forever if None
+        
+        :return:
+            results(list[tuple[str, object]]): (stage name, result) in order of arrival
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        results, self._held = self._held, []
+        try:
+            if len(results) == 0 and self._results is not None: # Stopped pipelines hold all their results
+                results.append(pickle.loads(self._results.get(timeout=timeout) if timeout != 0.0 else self._results.get_nowait()))
+            while self._results is not None:
+                results.append(pickle.loads(self._results.get_nowait()))
+        except queue.Empty:
+            pass
+        for i, (name, result) in enumerate(results):
+            if isinstance(result, Exception):
+                self._held = results[i + 1:]
+                if i == 0:
+                    raise result
+                self._error = result
+                return results[:i]
+        return results
+
+    def _drain(self) -> None:
+        """
+        Moves the results in the queue to the held results without waiting.
+        """
+        try:
+            while self._results is not None:
+                self._held.append(pickle.loads(self._results.get_nowait()))
+        except queue.Empty:
+            pass
+
+    def _feed_loop(self) -> None:
+        try:
+            while not self._feeder_stop.is_set():
+                timestamps, values, gains = self._tza.read_stream()
+                if len(values) == 0:
+                    sleep(0.002)
+                    continue
+                self.write(timestamps, values, gains)
+        except Exception as e:
+            self._error = e
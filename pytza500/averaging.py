@@ -0,0 +1,118 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import math
+import numpy as np
+
+
+WINDOW_RECORD = np.dtype([
+    ("timestamp", "<f8"), # Unix timestamp of the end of the window
+    ("mean", "<f8"),
+    ("std", "<f8"), # Sample standard deviation
+    ("min", "<f8"),
+    ("max", "<f8"),
+    ("count", "<i8")
+])
+
+
+class WindowStatistics():
+    def __init__(self) -> None:
+        """
+        Initializes the WindowStatistics class.
+
+        Online accumulator for count, mean, standard deviation, minimum and
+        maximum (Welford's algorithm). Blocks of samples are merged at once
+        with the parallel variant of the algorithm, so no samples are kept.
+        """
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discards all accumulated samples.
+        """
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0 # Sum of squared differences from the mean
+        self._min: float = math.inf
+        self._max: float = -math.inf
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._count > 0 else math.nan
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self._count - 1) if self._count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        return self._min if self._count > 0 else math.nan
+
+    @property
+    def max(self) -> float:
+        return self._max if self._count > 0 else math.nan
+
+    def add_value(self, value: float) -> None:
+        """
+        Adds a single sample.
+
+        :param:
+            value(float): Sample to add
+        """
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        Adds a block of samples.
+
+        :param:
+            values(np.ndarray): Samples to add
+        """
+        count = len(values)
+        if count == 0:
+            return
+
+        mean = float(np.mean(values))
+        m2 = float(np.sum(np.square(values - mean)))
+
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self._count * count / total
+        self._count = total
+        self._min = min(self._min, float(np.min(values)))
+        self._max = max(self._max, float(np.max(values)))
@@ -0,0 +1,193 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import os
+import json
+import numpy as np
+from dataclasses import dataclass, field
+from time import time
+
+
+@dataclass
+class Calibration():
+    serial: str
+    firmware: str
+    created: float # Unix timestamp
+    temperature: float | None # Ambient temperature in °C when calibrated, if known
+    max_gain: int # Highest usable gain level (1 = x1, 2 = x10, ...)
+    initial_auto_zero: str # Zero state of the device the offsets were measured in
+    offsets: dict[str, dict[int, float]] = field(default_factory=dict) # Offset in nA per bandwith and gain level
+    _tables: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def offset(self, bandwith: str, gain: int) -> float:
+        """
+        Returns the offset in nA at the bandwith and gain level, 0 if not calibrated.
+        """
+        return self.offsets.get(bandwith, {}).get(gain, 0.0)
+
+    def offset_table(self, bandwith: str) -> np.ndarray:
+        """
+        Returns the offsets in nA at the bandwith indexed by gain code, so
+        arrays of measurements are corrected with amplitudes - table[gains].
+        """
+        if bandwith not in self._tables:
+            table = np.zeros(8, dtype=np.float64) # Gain code 0 is used for unknown gains
+            for gain, offset in self.offsets.get(bandwith, {}).items():
+                table[gain] = offset
+            self._tables[bandwith] = table
+        return self._tables[bandwith]
+
+    def to_dict(self) -> dict:
+        return {
+            "serial": self.serial,
+            "firmware": self.firmware,
+            "created": self.created,
+            "temperature": self.temperature,
+            "max_gain": self.max_gain,
+            "initial_auto_zero": self.initial_auto_zero,
+            "offsets": {bandwith: {str(gain): offset for gain, offset in offsets.items()} for bandwith, offsets in self.offsets.items()}
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "Calibration":
+        offsets = {bandwith: {int(gain): float(offset) for gain, offset in gains.items()} for bandwith, gains in data.get("offsets", {}).items()}
+        return Calibration(str(data["serial"]), str(data["firmware"]), float(data["created"]), data.get("temperature"),
+                           int(data["max_gain"]), str(data["initial_auto_zero"]), offsets)
+
+
+class CalibrationStore():
+    def __init__(self, path: str | None = None, max_age: float = 86400.0, max_temperature_drift: float | None = None) -> None:
+        """
+        Initializes the CalibrationStore class.
+
+        Keeps one calibration per serial number and firmware version in a JSON
+        file. A calibration expires after max_age seconds or when the ambient
+        temperature differs by more than max_temperature_drift °C from the
+        temperature at calibration.
+
+        :param:
+            path(str | None): Path of the JSON file, default_path() if None
+            max_age(float | None): Time in seconds a calibration is valid, forever if None
+            max_temperature_drift(float | None): Allowed temperature difference in °C, not checked if None
+        """
+        self.path: str = path if path is not None else CalibrationStore.default_path()
+        self.max_age: float | None = max_age
+        self.max_temperature_drift: float | None = max_temperature_drift
+        self._calibrations: dict[str, Calibration] = {}
+        self.load()
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Returns the path of the calibration file in the user's configuration directory.
+        """
+        base = os.environ.get("APPDATA") or os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+        return os.path.join(base, "pytza500", "calibration.json")
+
+    def __len__(self) -> int:
+        return len(self._calibrations)
+
+    @property
+    def calibrations(self) -> list[Calibration]:
+        return list(self._calibrations.values())
+
+    @staticmethod
+    def _key(serial: str, firmware: str) -> str:
+        return "{}/{}".format(serial, firmware)
+
+    def load(self) -> None:
+        """
+        Reads the calibrations from the file. A missing file is an empty store.
+        """
+        self._calibrations = {}
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        for entry in data.get("calibrations", []):
+            calibration = Calibration.from_dict(entry)
+            self._calibrations[self._key(calibration.serial, calibration.firmware)] = calibration
+
+    def save(self) -> None:
+        """
+        Writes all calibrations to the file. The file is replaced at once, so
+        a crash does not leave a partly written file behind.
+        """
+        directory = os.path.dirname(self.path)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "calibrations": [calibration.to_dict() for calibration in self._calibrations.values()]}, file, indent=2)
+        os.replace(temporary, self.path)
+
+    def is_valid(self, calibration: Calibration, temperature: float | None = None) -> bool:
+        """
+        Returns whether the calibration has not expired.
+
+        :param:
+            calibration(Calibration): Calibration to check
+            temperature(float | None): Current ambient temperature in °C, if known
+        
+        :return:
+            result(bool): Returns whether the calibration can be used
+        """
+        if self.max_age is not None and time() - calibration.created > self.max_age:
+            return False
+        if self.max_temperature_drift is not None and temperature is not None and calibration.temperature is not None:
+            if abs(temperature - calibration.temperature) > self.max_temperature_drift:
+                return False
+        return True
+
+    def get(self, serial: str, firmware: str, temperature: float | None = None) -> Calibration | None:
+        """
+        Returns the calibration of the device if it has not expired.
+
+        :param:
+            serial(str): Serial number of the device
+            firmware(str): Firmware version of the device
+            temperature(float | None): Current ambient temperature in °C, if known
+        
+        :return:
+            calibration(Calibration | None): Valid calibration or None
+        """
+        calibration = self._calibrations.get(self._key(serial, firmware))
+        if calibration is None or not self.is_valid(calibration, temperature):
+            return None
+        return calibration
+
+    def put(self, calibration: Calibration) -> None:
+        """
+        Adds the calibration, replacing an earlier one of the same device and firmware.
+        """
+        self._calibrations[self._key(calibration.serial, calibration.firmware)] = calibration
+
+    def remove(self, serial: str, firmware: str) -> bool:
+        """
+        Removes the calibration of the device.
+
+        :return:
+            result(bool): Returns whether a calibration was removed
+        """
+        return self._calibrations.pop(self._key(serial, firmware), None) is not None
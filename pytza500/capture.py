@@ -0,0 +1,248 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import os
+import struct
+import numpy as np
+from time import time
+
+
+CAPTURE_MAGIC = b"TZA500CP"
+CAPTURE_VERSION = 1
+CAPTURE_HEADER_SIZE = 256
+
+# magic, version, header size, record size, created, serial, firmware, date of manufacturing
+_HEADER_FORMAT = "<8sHHHd32s16s16s"
+
+CAPTURE_RECORD = np.dtype([
+    ("timestamp", "<f8"), # Unix timestamp
+    ("raw", "<f8"), # Measured current in nA without offset correction of a calibration
+    ("gain", "u1"), # Gain code (1 = x1, 2 = x10, ...)
+    ("bandwith", "u1"), # Bandwith code (1 = 10 kHz, 2 = 1 kHz, ...)
+    ("polarity", "u1"), # 1 if the polarity is inverted
+    ("reserved", "u1", (5,))
+])
+
+
+class CaptureWriter():
+    def __init__(self, path: str, tza=None, append: bool = False, chunk_size: int = 65536,
+                 serial: str = "", firmware: str = "", date_of_manufacturing: str = "") -> None:
+        """
+        Initializes the CaptureWriter class.
+
+        Samples are collected in a preallocated chunk and written to a file of
+        fixed size records when the chunk is full. The file header holds the
+        device identity.
+
+        :param:
+            path(str): Path of the capture file
+            tza(TZA500 | None): Connected device to record from. Its identity is written to the header.
+            append(bool): Append to an existing capture file instead of overwriting it
+            chunk_size(int): Number of records written to the file at once
+            serial(str): Serial number for the header if no device is given
+            firmware(str): Firmware version for the header if no device is given
+            date_of_manufacturing(str): Date of manufacturing for the header if no device is given
+        """
+        self._tza = tza
+        if tza is not None:
+            serial = tza.tza_serial_number
+            firmware = tza.tza_firmware_version
+            date_of_manufacturing = tza.tza_date_of_manufacturing
+
+        self._chunk: np.ndarray = np.zeros(max(1, chunk_size), dtype=CAPTURE_RECORD)
+        self._chunk_length: int = 0
+        self._written: int = 0
+
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            header = _read_header(path)
+            if tza is not None and header["serial"] != serial:
+                raise Exception("Cannot append to capture of device {} from device {}.".format(header["serial"], serial))
+            self._file = open(path, "r+b")
+            self._written = (os.path.getsize(path) - CAPTURE_HEADER_SIZE) // CAPTURE_RECORD.itemsize
+            self._file.seek(CAPTURE_HEADER_SIZE + self._written * CAPTURE_RECORD.itemsize) # Drop an incomplete last record
+            self._file.truncate()
+        else:
+            self._file = open(path, "wb")
+            header = struct.pack(_HEADER_FORMAT, CAPTURE_MAGIC, CAPTURE_VERSION, CAPTURE_HEADER_SIZE, CAPTURE_RECORD.itemsize, time(),
+                                 serial.encode()[:32], firmware.encode()[:16], date_of_manufacturing.encode()[:16])
+            self._file.write(header.ljust(CAPTURE_HEADER_SIZE, b"\0"))
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._written + self._chunk_length
+
+    def write(self, timestamps: np.ndarray, raw: np.ndarray, gains: np.ndarray, bandwith: int = 0, polarity: int = 0) -> None:
+        """
+        Adds samples to the capture.
+
+        :param:
+            timestamps(np.ndarray): Unix timestamps
+            raw(np.ndarray): Measured currents in nA
+            gains(np.ndarray): Gain codes (1 = x1, 2 = x10, ...)
+            bandwith(int): Bandwith code (1 = 10 kHz, 2 = 1 kHz, ...)
+            polarity(int): 1 if the polarity is inverted
+        """
+        start = 0
+        while start < len(raw):
+            count = min(len(raw) - start, len(self._chunk) - self._chunk_length)
+            records = self._chunk[self._chunk_length:self._chunk_length + count]
+            records["timestamp"] = timestamps[start:start + count]
+            records["raw"] = raw[start:start + count]
+            records["gain"] = gains[start:start + count]
+            records["bandwith"] = bandwith
+            records["polarity"] = polarity
+            self._chunk_length += count
+            start += count
+
+            if self._chunk_length == len(self._chunk):
+                self.flush()
+
+    def record(self, n: int | None = None, duration: float | None = None) -> int:
+        """
+        Measures n samples or for duration seconds with the device and adds them to the capture.
+
+        :param:
+            n(int | None): Number of measurements
+            duration(float | None): Measurement time in seconds
+        
+        :return:
+            count(int): Number of recorded samples
+        """
+        if self._tza is None:
+            raise Exception("No device to record from.")
+        if n is None and duration is None:
+            raise Exception("Either n or duration must be given.")
+
+        timestamps, raw, gains = self._tza._tza_measure_raw(count=n, duration=duration, corrected=False)
+        bandwith = int(self._tza._bandwith_steps[self._tza._bandwith][1:])
+        self.write(timestamps, raw, gains, bandwith, int(self._tza._invert_input_polarity))
+        return len(raw)
+
+    def flush(self) -> None:
+        """
+        Writes all collected samples to the file.
+        """
+        if self._chunk_length > 0:
+            self._file.write(self._chunk[:self._chunk_length].tobytes())
+            self._written += self._chunk_length
+            self._chunk_length = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        Writes all collected samples and closes the file.
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class CaptureReader():
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the CaptureReader class.
+
+        The records are memory-mapped, so the file is not loaded into memory
+        and all returned arrays are views of the file.
+
+        :param:
+            path(str): Path of the capture file
+        """
+        header = _read_header(path)
+        self._serial: str = header["serial"]
+        self._firmware: str = header["firmware"]
+        self._date_of_manufacturing: str = header["date_of_manufacturing"]
+        self._created: float = header["created"]
+
+        count = (os.path.getsize(path) - CAPTURE_HEADER_SIZE) // CAPTURE_RECORD.itemsize # Ignore an incomplete last record
+        if count > 0:
+            self._records: np.ndarray = np.memmap(path, dtype=CAPTURE_RECORD, mode="r", offset=CAPTURE_HEADER_SIZE, shape=(count,))
+        else:
+            self._records = np.zeros(0, dtype=CAPTURE_RECORD)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def tza_serial_number(self) -> str:
+        return self._serial
+
+    @property
+    def tza_firmware_version(self) -> str:
+        return self._firmware
+
+    @property
+    def tza_date_of_manufacturing(self) -> str:
+        return self._date_of_manufacturing
+
+    @property
+    def created(self) -> float:
+        return self._created
+
+    @property
+    def records(self) -> np.ndarray:
+        return self._records
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._records["timestamp"]
+
+    @property
+    def raw(self) -> np.ndarray:
+        return self._records["raw"]
+
+    @property
+    def gains(self) -> np.ndarray:
+        return self._records["gain"]
+
+    @property
+    def bandwiths(self) -> np.ndarray:
+        return self._records["bandwith"]
+
+    @property
+    def polarities(self) -> np.ndarray:
+        return self._records["polarity"]
+
+
+def _read_header(path: str) -> dict:
+    with open(path, "rb") as f:
+        data = f.read(CAPTURE_HEADER_SIZE)
+    if len(data) < CAPTURE_HEADER_SIZE or data[:len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+        raise Exception("{} is not a TZA500 capture file.".format(path))
+
+    magic, version, header_size, record_size, created, serial, firmware, date_of_manufacturing = struct.unpack_from(_HEADER_FORMAT, data)
+    if version != CAPTURE_VERSION or header_size != CAPTURE_HEADER_SIZE or record_size != CAPTURE_RECORD.itemsize:
+        raise Exception("Unsupported capture file version {}.".format(version))
+
+    return {
+        "created": created,
+        "serial": serial.rstrip(b"\0").decode(errors="ignore"),
+        "firmware": firmware.rstrip(b"\0").decode(errors="ignore"),
+        "date_of_manufacturing": date_of_manufacturing.rstrip(b"\0").decode(errors="ignore")
+    }
@@ -0,0 +1,170 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import sys
+import warnings
+import threading
+from dataclasses import dataclass
+from collections.abc import Callable
+from time import monotonic
+
+
+@dataclass(frozen=True)
+class DeviceInfo():
+    serial: str
+    description: str
+    location: int
+
+    def __str__(self) -> str:
+        return "{} - {}".format(self.description, self.serial) # Format used by TZA500.connect()
+
+
+class DeviceDiscovery():
+    def __init__(self, ttl: float = 1.0) -> None:
+        """
+        Initializes the DeviceDiscovery class.
+
+        The list of found TZA500 devices is cached for ttl seconds. A
+        background monitor can keep the list up to date and report devices
+        that were plugged in or removed.
+
+        :param:
+            ttl(float): Time in seconds a scan result is reused
+        """
+        self.ttl: float = ttl
+        self._lock: threading.Lock = threading.Lock()
+        self._devices: list[DeviceInfo] = []
+        self._scanned: float | None = None
+
+        self._monitor_thread: threading.Thread = None
+        self._monitor_stop: threading.Event = threading.Event()
+        self._on_added: Callable[[DeviceInfo], None] | None = None
+        self._on_removed: Callable[[DeviceInfo], None] | None = None
+
+    @property
+    def is_monitoring(self) -> bool:
+        return self._monitor_thread is not None and self._monitor_thread.is_alive()
+
+    def devices(self, max_age: float | None = None) -> list[DeviceInfo]:
+        """
+        Returns the found TZA500 devices. The devices are only scanned again
+        if the cached list is older than max_age.
+
+        :param:
+            max_age(float | None): Maximum age of the cached list in seconds, ttl if None. 0 forces a new scan.
+        
+        :return:
+            devices(list[DeviceInfo]): Found TZA500 devices
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            if self._scanned is not None and monotonic() - self._scanned <= max_age:
+                return list(self._devices)
+        return self._update()
+
+    def start_monitor(self, interval: float = 1.0, on_added: Callable[[DeviceInfo], None] | None = None,
+                      on_removed: Callable[[DeviceInfo], None] | None = None) -> bool:
+        """
+        Starts scanning for devices in a background thread.
+
+        :param:
+            interval(float): Time in seconds between two scans
+            on_added(Callable[[DeviceInfo], None] | None): Called for every device that was plugged in
+            on_removed(Callable[[DeviceInfo], None] | None): Called for every device that was removed
+        
+        :return:
+            result(bool): Returns whether the monitor was started
+        """
+        if self.is_monitoring:
+            return False
+        self._on_added = on_added
+        self._on_removed = on_removed
+        self._monitor_stop.clear()
+        self._monitor_thread = threading.Thread(target=self._monitor, args=(interval,), name="TZA500 discovery", daemon=True)
+        self._monitor_thread.start()
+        return True
+
+    def stop_monitor(self) -> None:
+        """
+        Stops the background scan.
+        """
+        self._monitor_stop.set()
+        if self._monitor_thread is not None and self._monitor_thread is not threading.current_thread():
+            self._monitor_thread.join()
+        self._monitor_thread = None
+
+    def _monitor(self, interval: float) -> None:
+        while not self._monitor_stop.is_set():
+            try:
+                self._update()
+            except Exception:
+                pass # The device list may be unavailable while devices are plugged in, retry with the next scan
+            self._monitor_stop.wait(interval)
+
+    def _update(self) -> list[DeviceInfo]:
+        devices = _scan()
+        with self._lock:
+            initial = self._scanned is None
+            added = [device for device in devices if device not in self._devices]
+            removed = [device for device in self._devices if device not in devices]
+            self._devices = devices
+            self._scanned = monotonic()
+
+        if not initial:
+            for device in added:
+                self._notify(self._on_added, device)
+            for device in removed:
+                self._notify(self._on_removed, device)
+        return list(devices)
+
+    @staticmethod
+    def _notify(callback: Callable[[DeviceInfo], None] | None, device: DeviceInfo) -> None:
+        """
+        Calls a hot-plug callback. Its exceptions are reported as warnings, so
+        the other devices of the scan are still reported.
+        """
+        if callback is None:
+            return
+        try:
+            callback(device)
+        except Exception as e:
+            warnings.warn("Discovery callback failed for {}: {!r}".format(device, e), RuntimeWarning)
+
+
+def _scan() -> list[DeviceInfo]:
+    import ftd2xx # Loaded on first scan, the D2XX library is not needed to import pytza500
+
+    devices = []
+
+    if sys.platform != "win32":
+        ftd2xx.setVIDPID(0x0403, 0x9a68) # For linux and macOS
+
+    numDevs = ftd2xx.createDeviceInfoList()
+
+    for i in range(0, numDevs):
+        dev = ftd2xx.getDeviceInfoDetail(i)
+        description = dev["description"].decode(errors="ignore")
+        if "TZA500" in description:
+            devices.append(DeviceInfo(dev["serial"].decode(errors="ignore"), description, dev.get("location", 0)))
+    return devices
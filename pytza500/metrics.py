@@ -0,0 +1,198 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import bisect
+import threading
+from collections.abc import Callable
+
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is unbounded
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class CommandMetrics():
+    def __init__(self) -> None:
+        """
+        Counters of a single protocol command.
+        """
+        self.count: int = 0
+        self.replies: int = 0
+        self.latency_sum: float = 0.0
+        self.latency_buckets: list[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.timeouts: int = 0
+        self.retries: int = 0
+        self.bytes_out: int = 0
+        self.bytes_in: int = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "replies": self.replies,
+            "latency_sum": self.latency_sum,
+            "latency_mean": self.latency_sum / self.replies if self.replies > 0 else 0.0,
+            "latency_buckets": dict(zip([*LATENCY_BUCKETS, float("inf")], self.latency_buckets)),
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in
+        }
+
+
+class Metrics():
+    def __init__(self, tracer: Callable[[str, str, bytes, float | None], None] | None = None) -> None:
+        """
+        Initializes the Metrics class.
+
+        Collects per command call counts, latency histograms, timeouts,
+        receive retries and bytes in/out as well as purges and auto-gain
+        steps of a TZA500.
+
+        :param:
+            tracer(Callable[[str, str, bytes, float | None], None] | None): Called with (event, command, data, latency)
+                for every "send", "recv" and "timeout" event. latency is None for "send".
+        """
+        self.tracer: Callable[[str, str, bytes, float | None], None] | None = tracer
+        self._lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets all counters.
+        """
+        with self._lock:
+            self._commands: dict[str, CommandMetrics] = {}
+            self._purges: int = 0
+            self._autogain_steps: int = 0
+
+    def _command(self, command: str) -> CommandMetrics:
+        metrics = self._commands.get(command)
+        if metrics is None:
+            metrics = self._commands[command] = CommandMetrics()
+        return metrics
+
+    def sent(self, command: str, data: bytes) -> None:
+        with self._lock:
+            metrics = self._command(command)
+            metrics.count += 1
+            metrics.bytes_out += len(data)
+        if self.tracer is not None:
+            self.tracer("send", command, data, None)
+
+    def received(self, command: str, data: bytes, latency: float) -> None:
+        with self._lock:
+            metrics = self._command(command)
+            metrics.replies += 1
+            metrics.bytes_in += len(data)
+            metrics.latency_sum += latency
+            metrics.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if self.tracer is not None:
+            self.tracer("recv", command, data, latency)
+
+    def retried(self, command: str, retries: int) -> None:
+        with self._lock:
+            self._command(command).retries += retries
+
+    def timed_out(self, command: str, latency: float) -> None:
+        with self._lock:
+            self._command(command).timeouts += 1
+        if self.tracer is not None:
+            self.tracer("timeout", command, b"", latency)
+
+    def purged(self) -> None:
+        with self._lock:
+            self._purges += 1
+
+    def autogain_step(self) -> None:
+        with self._lock:
+            self._autogain_steps += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns all counters as a dict.
+
+        :return:
+            snapshot(dict): {"commands": {command: counters}, "purges": int, "autogain_steps": int}
+        """
+        with self._lock:
+            return {
+                "commands": {command: metrics.snapshot() for command, metrics in self._commands.items()},
+                "purges": self._purges,
+                "autogain_steps": self._autogain_steps
+            }
+
+    def to_prometheus(self, prefix: str = "pytza500", labels: dict[str, str] | None = None) -> str:
+        """
+        Returns all counters in the Prometheus text exposition format.
+
+        :param:
+            prefix(str): Prefix of the metric names
+            labels(dict[str, str] | None): Additional labels for all metrics, e.g. {"serial": "12345"}
+        
+        :return:
+            text(str): Metrics in the Prometheus text format
+        """
+        base_labels = ",".join('{}="{}"'.format(key, _escape(value)) for key, value in (labels or {}).items())
+
+        def label_string(*extra: str) -> str:
+            parts = [part for part in (base_labels, *extra) if part != ""]
+            return "{" + ",".join(parts) + "}" if len(parts) > 0 else ""
+
+        snapshot = self.snapshot()
+        lines = []
+        counters = (
+            ("commands_total", "count", "Commands sent"),
+            ("timeouts_total", "timeouts", "Commands without reply"),
+            ("retries_total", "retries", "Blocking reads without data while waiting for a reply"),
+            ("bytes_out_total", "bytes_out", "Bytes sent"),
+            ("bytes_in_total", "bytes_in", "Bytes received")
+        )
+        for name, key, description in counters:
+            lines.append("# HELP {}_{} {}".format(prefix, name, description))
+            lines.append("# TYPE {}_{} counter".format(prefix, name))
+            for command, metrics in snapshot["commands"].items():
+                lines.append("{}_{}{} {}".format(prefix, name, label_string('command="{}"'.format(_escape(command))), metrics[key]))
+
+        lines.append("# HELP {}_command_latency_seconds Time from sending a command to receiving its reply".format(prefix))
+        lines.append("# TYPE {}_command_latency_seconds histogram".format(prefix))
+        for command, metrics in snapshot["commands"].items():
+            command_label = 'command="{}"'.format(_escape(command))
+            cumulative = 0
+            for bound, count in metrics["latency_buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append("{}_command_latency_seconds_bucket{} {}".format(prefix, label_string(command_label, 'le="{}"'.format(le)), cumulative))
+            lines.append("{}_command_latency_seconds_sum{} {}".format(prefix, label_string(command_label), metrics["latency_sum"]))
+            lines.append("{}_command_latency_seconds_count{} {}".format(prefix, label_string(command_label), metrics["replies"]))
+
+        lines.append("# HELP {}_purges_total Purges of the device buffers".format(prefix))
+        lines.append("# TYPE {}_purges_total counter".format(prefix))
+        lines.append("{}_purges_total{} {}".format(prefix, label_string(), snapshot["purges"]))
+        lines.append("# HELP {}_autogain_steps_total Gain changes made by auto-gain".format(prefix))
+        lines.append("# TYPE {}_autogain_steps_total counter".format(prefix))
+        lines.append("{}_autogain_steps_total{} {}".format(prefix, label_string(), snapshot["autogain_steps"]))
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,114 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import numpy as np
+
+
+# Factor from the unit prefix of a measurement frame to nA, 0 marks an invalid prefix
+_UNIT_FACTORS = np.zeros(256, dtype=np.float64)
+_UNIT_FACTORS[ord("p")] = 0.001
+_UNIT_FACTORS[ord("n")] = 1.0
+_UNIT_FACTORS[ord("u")] = 1000.0
+_UNIT_FACTORS[ord("m")] = 1000000.0
+
+_POWERS_OF_TEN = 10.0 ** np.arange(16) # Exact in float64
+_MAX_DIGITS = 15 # Integer mantissas up to 15 digits are exact in float64, longer numbers are parsed with float()
+
+
+def count_frames(data: bytes | bytearray) -> int:
+    """
+    Returns the number of complete '\r' terminated frames in data.
+    """
+    return data.count(b"\r") - data.count(b"\r\n")
+
+
+def parse_measurement_frames(data: bytes | bytearray | memoryview, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Decodes all complete measurement frames in the format I<num>,<frac>nA\r
+    or I<num>,<frac>uA\r at once into values in nA. The bytes are processed
+    as one NumPy array, no Python objects are created per frame. The results
+    are identical to float() of the number times the unit factor. Numbers
+    with more than 15 digits are rare and parsed with float() one by one.
+
+    :param:
+        data(bytes | bytearray | memoryview): Received bytes. Bytes after the last '\r' are ignored.
+        out(np.ndarray | None): Preallocated float64 array for the values
+    
+    :return:
+        values(np.ndarray): Values in nA, a view of out if given
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    is_end = buffer == 13 # '\r'
+    ends = np.flatnonzero(is_end)
+    count = len(ends)
+
+    if out is None:
+        out = np.empty(count, dtype=np.float64)
+    elif len(out) < count:
+        raise Exception("Output array too small for {} measurement frames.".format(count))
+    if count == 0:
+        return out[:0]
+
+    buffer = buffer[:ends[-1] + 1]
+    is_end = is_end[:len(buffer)]
+    frame = np.cumsum(is_end) - is_end # Frame index of every byte
+
+    # Unit prefix in front of the trailing 'A'
+    if np.any(ends < 2) or np.any(buffer[ends - 1] != 65):
+        raise Exception("Invalid measurement frame.")
+    factors = _UNIT_FACTORS[buffer[ends - 2]]
+    if np.any(factors == 0.0):
+        raise Exception("Invalid unit in measurement frame.")
+
+    # Decimal separator ',' or '.', frames without one are integers
+    separators = ends - 2
+    separator_positions = np.flatnonzero((buffer == 44) | (buffer == 46))
+    separators[frame[separator_positions]] = separator_positions
+
+    # Integer mantissa of all digits and number of fraction digits per frame
+    digit_positions = np.flatnonzero((buffer >= 48) & (buffer <= 57))
+    digit_frame = frame[digit_positions]
+    digits_per_frame = np.bincount(digit_frame, minlength=count)
+    if np.any(digits_per_frame == 0):
+        raise Exception("Invalid number in measurement frame.")
+
+    first_digit = np.cumsum(digits_per_frame) - digits_per_frame
+    place = digits_per_frame[digit_frame] - 1 - (np.arange(len(digit_positions)) - first_digit[digit_frame])
+    place = np.minimum(place, _MAX_DIGITS) # Long numbers are replaced below
+    mantissa = np.bincount(digit_frame, weights=(buffer[digit_positions] - 48) * _POWERS_OF_TEN[place], minlength=count)
+    fraction_digits = np.bincount(digit_frame, weights=digit_positions > separators[digit_frame], minlength=count).astype(np.intp)
+
+    values = out[:count]
+    np.divide(mantissa, _POWERS_OF_TEN[np.minimum(fraction_digits, _MAX_DIGITS)], out=values)
+    values[frame[np.flatnonzero(buffer == 45)]] *= -1.0 # '-'
+    values *= factors
+
+    for index in np.flatnonzero(digits_per_frame > _MAX_DIGITS):
+        start = ends[index - 1] + 1 if index > 0 else 0
+        text = bytes(buffer[start:ends[index] - 2]).decode(errors="ignore").strip().lstrip("I").replace(",", ".")
+        try:
+            values[index] = float(text) * factors[index]
+        except ValueError:
+            raise Exception("Invalid number in measurement frame.")
+    return values
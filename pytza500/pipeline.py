@@ -0,0 +1,197 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from collections import deque
+from collections.abc import Callable
+
+
+class CommandPipeline():
+    def __init__(self, write: Callable[[str], None], read_reply: Callable[[], str], purge: Callable[[], None], depth: int = 8,
+                 read_frames: Callable[[int], tuple[bytes, int]] | None = None) -> None:
+        """
+        Initializes the CommandPipeline class.
+
+        Commands are tagged and written without waiting for the replies of
+        previous commands. Up to depth commands are kept in flight and the
+        '\r' terminated replies are matched to the commands in order.
+
+        :param:
+            write(Callable[[str], None]): Writes a command to the device
+            read_reply(Callable[[], str]): Reads the next reply from the device
+            purge(Callable[[], None]): Purges the receive/transmit buffers of the device
+            depth(int): Maximum number of commands in flight
+            read_frames(Callable[[int], tuple[bytes, int]] | None): Reads at least one and at most the given number of raw '\r' terminated replies
+        """
+        self._write = write
+        self._read_reply = read_reply
+        self._purge = purge
+        self._read_frames = read_frames
+        self._depth: int = 1
+        self.depth = depth
+
+        self._next_tag: int = 0
+        self._in_flight: deque[tuple[int, str]] = deque() # (tag, command) in the order of the replies
+        self._replies: dict[int, str] = {} # Received replies not yet collected
+        self._discarded: set[int] = set() # Tags in flight whose replies are dropped on arrival
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+    
+    @depth.setter
+    def depth(self, value: int) -> None:
+        if value < 1:
+            raise Exception("Invalid pipeline depth. The depth must be at least 1.")
+        self._depth = int(value)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def receiving(self) -> str | None:
+        """
+        Command whose reply is received next.
+        """
+        return self._in_flight[0][1] if len(self._in_flight) > 0 else None
+
+    def submit(self, command: str) -> int:
+        """
+        Writes a command without waiting for its reply. If the window is
+        full, replies of the oldest commands are received first.
+
+        :param:
+            command(str): Command to send
+        
+        :return:
+            tag(int): Tag to collect the reply with result()
+        """
+        while len(self._in_flight) >= self._depth:
+            self._receive_next()
+
+        tag = self._next_tag
+        self._next_tag += 1
+        self._write(command)
+        self._in_flight.append((tag, command))
+        return tag
+
+    def result(self, tag: int) -> str:
+        """
+        Returns the reply of a submitted command, receiving replies of older
+        commands on the way. Replies of discarded commands are dropped.
+
+        :param:
+            tag(int): Tag returned by submit()
+        
+        :return:
+            reply(str): Reply of the command
+        """
+        while tag not in self._replies:
+            if len(self._in_flight) == 0 or self._in_flight[0][0] > tag or tag in self._discarded:
+                raise Exception("No reply pending for tag {}.".format(tag))
+            self._receive_next()
+        return self._replies.pop(tag)
+
+    def query(self, command: str) -> str:
+        """
+        Sends a command and returns its reply. Replies of commands submitted
+        before and not collected yet are discarded, so collect pipelined
+        replies with result() before the next query.
+
+        :param:
+            command(str): Command to send
+        
+        :return:
+            reply(str): Reply of the command
+        """
+        tag = self.submit(command)
+        self.discard([pending for pending, _ in self._in_flight if pending < tag] + [pending for pending in self._replies if pending < tag])
+        return self.result(tag)
+
+    def collect_raw(self, max_count: int) -> tuple[bytes, int]:
+        """
+        Receives the raw replies of the oldest commands in flight as one block
+        of bytes. At least one and at most max_count replies are returned,
+        depending on how many have already arrived. Earlier replies must have
+        been collected with result() before. Replies of discarded commands
+        are received and dropped first.
+
+        :param:
+            max_count(int): Maximum number of replies
+        
+        :return:
+            tuple[data(bytes): '\r' terminated replies, count(int): Number of replies]
+        """
+        if self._read_frames is None:
+            raise Exception("Raw replies are not supported.")
+        if len(self._replies) > 0:
+            raise Exception("Replies pending, collect them with result() first.")
+
+        while len(self._in_flight) > 0 and self._in_flight[0][0] in self._discarded:
+            self._receive_next()
+        max_count = min(max_count, len(self._in_flight))
+        if max_count < 1:
+            raise Exception("No reply pending.")
+
+        try:
+            data, count = self._read_frames(max_count)
+        except TimeoutError:
+            self.resync() # Replies can no longer be matched to commands
+            raise
+        for _ in range(count):
+            self._in_flight.popleft()
+        return data, count
+
+    def discard(self, tags) -> None:
+        """
+        Discards the replies of submitted commands that will not be collected.
+        Replies still in flight are received and dropped when a later reply is needed.
+
+        :param:
+            tags(Iterable[int]): Tags returned by submit()
+        """
+        for tag in tags:
+            if self._replies.pop(tag, None) is None and any(pending == tag for pending, _ in self._in_flight):
+                self._discarded.add(tag)
+
+    def resync(self) -> None:
+        """
+        Purges the device buffers and discards all commands in flight and uncollected replies.
+        """
+        self._purge()
+        self._in_flight.clear()
+        self._replies.clear()
+        self._discarded.clear()
+
+    def _receive_next(self) -> None:
+        try:
+            reply = self._read_reply()
+        except TimeoutError:
+            self.resync() # Replies can no longer be matched to commands
+            raise
+        tag, _ = self._in_flight.popleft()
+        if tag in self._discarded:
+            self._discarded.discard(tag)
+        else:
+            self._replies[tag] = reply
@@ -0,0 +1,229 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from . import TZA500, UNITS, GAIN, BANDWITH
+
+
+class TZA500Pool():
+    def __init__(self) -> None:
+        """
+        Initializes the TZA500Pool class.
+
+        The pool connects to many TZA500 devices at once, applies settings to
+        all of them in parallel and triggers synchronized measurements.
+        """
+        self._devices: dict[str, TZA500] = {}
+        self._executor: ThreadPoolExecutor = None
+
+    def __enter__(self) -> "TZA500Pool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disconnect()
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    @property
+    def devices(self) -> dict[str, TZA500]:
+        return dict(self._devices)
+
+    def connect(self, devices: list[str] | None = None) -> dict[str, bool]:
+        """
+        Connects to and initializes all devices concurrently.
+
+        :param:
+            devices(list[str] | None): Device strings in the format "TZA500 - serial_number". All found devices are used if None.
+        
+        :return:
+            results(dict[str, bool]): Whether each device was successfully connected and initialized
+        """
+        if devices is None:
+            devices = TZA500.find_devices()
+        devices = [device for device in devices if device not in self._devices]
+        if len(devices) == 0:
+            return {}
+
+        instances = {device: TZA500() for device in devices}
+        with ThreadPoolExecutor(max_workers=len(instances)) as executor:
+            futures = {device: executor.submit(tza.connect, device) for device, tza in instances.items()}
+
+        results = {}
+        for device, future in futures.items():
+            try:
+                results[device] = bool(future.result())
+            except Exception:
+                results[device] = False
+            if results[device]:
+                self._devices[device] = instances[device]
+
+        self._create_executor()
+        return results
+
+    def disconnect(self) -> None:
+        """
+        Disconnects all devices.
+        """
+        self._broadcast(TZA500.disconnect)
+        self._devices = {}
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _create_executor(self) -> None:
+        # One worker per device, synchronized measurements need all devices running at once
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self._devices)), thread_name_prefix="TZA500Pool")
+
+    def _broadcast(self, function, *args) -> dict:
+        """
+        Calls function(tza, *args) for every device in parallel and returns the results by device.
+        """
+        if len(self._devices) == 0:
+            return {}
+        futures = {device: self._executor.submit(function, tza, *args) for device, tza in self._devices.items()}
+        return {device: future.result() for device, future in futures.items()}
+
+    def set_unit(self, unit: UNITS) -> dict[str, bool]:
+        """
+        Sets the specified unit on all devices.
+
+        :param:
+            unit(UNITS): Unit to use for measurements
+        
+        :return:
+            results(dict[str, bool]): Whether the unit was set on each device
+        """
+        return {device: tza.set_unit(unit) for device, tza in self._devices.items()}
+
+    def configure(self, **settings) -> dict[str, bool]:
+        """
+        Applies the settings as one transaction on all devices in parallel, see TZA500.configure().
+
+        :return:
+            results(dict[str, bool]): Whether all settings were applied on each device
+        """
+        return self._broadcast(lambda tza: tza.configure(**settings))
+
+    def tza_set_gain(self, gain: str | GAIN) -> dict[str, bool]:
+        """
+        Sets the specified gain on all devices in parallel.
+
+        :param:
+            gain(str | GAIN): Gain to set
+        
+        :return:
+            results(dict[str, bool]): Whether the gain was set on each device
+        """
+        return self._broadcast(TZA500.tza_set_gain, gain)
+
+    def tza_set_bandwith(self, bandwith: str | BANDWITH) -> dict[str, bool]:
+        """
+        Sets the specified bandwith on all devices in parallel.
+
+        :param:
+            bandwith(str | BANDWITH): Bandwith to set
+        
+        :return:
+            results(dict[str, bool]): Whether the bandwith was set on each device
+        """
+        return self._broadcast(TZA500.tza_set_bandwith, bandwith)
+
+    def tza_set_polarity(self, invert_polarity: bool) -> dict[str, bool]:
+        """
+        Sets the polarity on all devices in parallel.
+
+        :param:
+            invert_polarity(bool): Whether the polarity should be inverted or not
+        
+        :return:
+            results(dict[str, bool]): Whether the polarity was set on each device
+        """
+        return self._broadcast(TZA500.tza_set_polarity, invert_polarity)
+
+    def tza_set_auto_zero(self) -> dict[str, bool]:
+        """
+        Runs the auto zero on all devices in parallel.
+
+        :return:
+            results(dict[str, bool]): Whether the auto zero was successful on each device
+        """
+        return self._broadcast(TZA500.tza_set_auto_zero)
+
+    def tza_set_auto_zero_reset(self) -> dict[str, bool]:
+        """
+        Resets the auto zero on all devices in parallel.
+
+        :return:
+            results(dict[str, bool]): Whether the auto zero was reset on each device
+        """
+        return self._broadcast(TZA500.tza_set_auto_zero_reset)
+
+    def tza_get_measurements(self, n: int = 1) -> tuple[np.ndarray, np.ndarray, str]:
+        """
+        Triggers n synchronized measurements on all devices. For every sample
+        all devices wait for each other before the measurement is requested.
+
+        :param:
+            n(int): Number of measurements per device
+        
+        :return:
+            tuple[timestamps(np.ndarray): Mean Unix timestamp of each sample, values(np.ndarray): Values with shape (n, number of devices) in the order of devices, unit(str): Selected unit]
+        """
+        if len(self._devices) == 0:
+            raise Exception("No devices connected.")
+
+        units = set(tza._unit for tza in self._devices.values())
+        if len(units) != 1:
+            raise Exception("Devices use different units. Use set_unit() to select the same unit on all devices.")
+
+        barrier = threading.Barrier(len(self._devices))
+        results = self._broadcast(TZA500Pool._measure_synchronized, barrier, n)
+
+        timestamps = np.column_stack([result[0] for result in results.values()])
+        values = np.column_stack([result[1] for result in results.values()])
+        return timestamps.mean(axis=1), values, units.pop()
+
+    @staticmethod
+    def _measure_synchronized(tza: TZA500, barrier: threading.Barrier, n: int) -> tuple[np.ndarray, np.ndarray]:
+        timestamps = np.empty(n, dtype=np.float64)
+        amplitudes = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                raise Exception("Synchronized measurement aborted by another device.")
+            try:
+                sample_timestamps, sample_amplitudes, _ = tza._tza_measure_raw(count=1)
+            except Exception:
+                barrier.abort() # Do not leave the other devices waiting
+                raise
+            timestamps[i] = sample_timestamps[0]
+            amplitudes[i] = sample_amplitudes[0]
+        return timestamps, tza._tza_convert_array(amplitudes)
@@ -0,0 +1,134 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import numpy as np
+
+
+class ResponsivityCurve():
+    def __init__(self, wavelengths: np.ndarray, responsivities: np.ndarray) -> None:
+        """
+        Initializes the ResponsivityCurve class.
+
+        Calibration curve of a photodiode. Between the calibration points the
+        responsivity is interpolated linearly. Arrays are interpolated in one
+        vectorized call, single wavelengths are cached.
+
+        :param:
+            wavelengths(np.ndarray): Calibration wavelengths in nm, strictly increasing
+            responsivities(np.ndarray): Responsivity in A/W at each wavelength
+        """
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        responsivities = np.asarray(responsivities, dtype=np.float64)
+        if wavelengths.ndim != 1 or wavelengths.shape != responsivities.shape or len(wavelengths) < 2:
+            raise Exception("Invalid calibration curve. At least two pairs of wavelength and responsivity are needed.")
+        if np.any(np.diff(wavelengths) <= 0.0):
+            raise Exception("Invalid calibration curve. The wavelengths must be strictly increasing.")
+        if np.any(responsivities <= 0.0):
+            raise Exception("Invalid calibration curve. The responsivities must be greater than 0.")
+
+        self._wavelengths: np.ndarray = wavelengths
+        self._responsivities: np.ndarray = responsivities
+        self._cache: dict[float, float] = {}
+
+    @staticmethod
+    def from_csv(path: str, delimiter: str | None = None) -> "ResponsivityCurve":
+        """
+        Loads a calibration curve from a file with one wavelength in nm and
+        responsivity in A/W per line. Header lines and lines starting with #
+        are skipped.
+
+        :param:
+            path(str): Path of the file
+            delimiter(str | None): Column delimiter, "," ";" tab or whitespace are detected if None
+        
+        :return:
+            curve(ResponsivityCurve): Loaded calibration curve
+        """
+        rows = []
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.split("#")[0].strip()
+                if line == "":
+                    continue
+                if delimiter is not None:
+                    columns = line.split(delimiter)
+                elif ";" in line:
+                    columns = [column.replace(",", ".") for column in line.split(";")] # Decimal comma
+                elif "," in line:
+                    columns = line.split(",")
+                else:
+                    columns = line.split()
+                try:
+                    rows.append((float(columns[0]), float(columns[1])))
+                except (ValueError, IndexError):
+                    continue # Header
+        if len(rows) == 0:
+            raise Exception("No calibration data in {}.".format(path))
+        data = np.array(rows)
+        return ResponsivityCurve(data[:, 0], data[:, 1])
+
+    @property
+    def wavelengths(self) -> np.ndarray:
+        return self._wavelengths
+
+    @property
+    def responsivities(self) -> np.ndarray:
+        return self._responsivities
+
+    @property
+    def range(self) -> tuple[float, float]:
+        """
+        Calibrated wavelength range in nm.
+        """
+        return float(self._wavelengths[0]), float(self._wavelengths[-1])
+
+    def __call__(self, wavelength: float | np.ndarray) -> float | np.ndarray:
+        return self.responsivity(wavelength)
+
+    def responsivity(self, wavelength: float | np.ndarray) -> float | np.ndarray:
+        """
+        Returns the responsivity at one or many wavelengths.
+
+        :param:
+            wavelength(float | np.ndarray): Wavelength in nm
+        
+        :return:
+            responsivity(float | np.ndarray): Responsivity in A/W
+        """
+        if np.ndim(wavelength) == 0:
+            wavelength = float(wavelength)
+            if wavelength not in self._cache:
+                self._check_range(wavelength, wavelength)
+                self._cache[wavelength] = float(np.interp(wavelength, self._wavelengths, self._responsivities))
+            return self._cache[wavelength]
+
+        wavelength = np.asarray(wavelength, dtype=np.float64)
+        if wavelength.size == 0:
+            return np.empty(wavelength.shape)
+        self._check_range(wavelength.min(), wavelength.max())
+        return np.interp(wavelength, self._wavelengths, self._responsivities)
+
+    def _check_range(self, lowest: float, highest: float) -> None:
+        if lowest < self._wavelengths[0] or highest > self._wavelengths[-1]:
+            raise Exception("Wavelength outside the calibrated range of {} to {} nm.".format(*self.range))
@@ -0,0 +1,137 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import numpy as np
+
+
+class RingBuffer():
+    def __init__(self, size: int) -> None:
+        """
+        Preallocated single producer / single consumer ring buffer for
+        (timestamp, value, gain) records.
+
+        The producer only advances the write counter and the consumer only
+        advances the read counter, so no lock is needed between them.
+
+        :param:
+            size(int): Maximum number of records held by the buffer
+        """
+        if size < 1:
+            raise Exception("Invalid buffer size. The size must be at least 1.")
+
+        self._size: int = int(size)
+        self._timestamps: np.ndarray = np.zeros(self._size, dtype=np.float64)
+        self._values: np.ndarray = np.zeros(self._size, dtype=np.float64)
+        self._gains: np.ndarray = np.zeros(self._size, dtype=np.uint8)
+
+        self._written: int = 0 # Only changed by the producer
+        self._read: int = 0 # Only changed by the consumer
+        self._overruns: int = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    def __len__(self) -> int:
+        return self._written - self._read
+
+    def push(self, timestamp: float, value: float, gain: int) -> bool:
+        """
+        Appends a single record.
+
+        :param:
+            timestamp(float): Time of the record
+            value(float): Value of the record
+            gain(int): Gain code of the record
+        
+        :return:
+            result(bool): Returns False if the buffer was full and the record was dropped
+        """
+        if self._written - self._read >= self._size:
+            self._overruns += 1
+            return False
+
+        i = self._written % self._size
+        self._timestamps[i] = timestamp
+        self._values[i] = value
+        self._gains[i] = gain
+        self._written += 1 # Publish the record after it is written
+        return True
+
+    def push_many(self, timestamps: np.ndarray, values: np.ndarray, gains: np.ndarray) -> int:
+        """
+        Appends multiple records at once. Records that do not fit are dropped.
+
+        :param:
+            timestamps(np.ndarray): Times of the records
+            values(np.ndarray): Values of the records
+            gains(np.ndarray): Gain codes of the records
+        
+        :return:
+            count(int): Number of records appended
+        """
+        count = min(len(values), self._size - (self._written - self._read))
+        self._overruns += len(values) - count
+        if count <= 0:
+            return 0
+
+        indices = (self._written + np.arange(count)) % self._size
+        self._timestamps[indices] = timestamps[:count]
+        self._values[indices] = values[:count]
+        self._gains[indices] = gains[:count]
+        self._written += count
+        return count
+
+    def drain(self, max_records: int | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Removes and returns all (or at most max_records) buffered records in order.
+
+        :param:
+            max_records(int | None): Maximum number of records to return
+        
+        :return:
+            tuple[timestamps(np.ndarray), values(np.ndarray), gains(np.ndarray)]
+        """
+        count = self._written - self._read
+        if max_records is not None:
+            count = max(0, min(count, max_records))
+
+        indices = range(self._read, self._read + count)
+        records = (
+            np.take(self._timestamps, indices, mode="wrap"),
+            np.take(self._values, indices, mode="wrap"),
+            np.take(self._gains, indices, mode="wrap")
+        )
+        self._read += count # Free the slots after they are copied
+        return records
+
+    def clear(self) -> None:
+        """
+        Discards all buffered records.
+        """
+        self._read = self._written
@@ -0,0 +1,733 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import os
+import sys
+import hmac
+import json
+import queue
+import socket
+import struct
+import hashlib
+import argparse
+import threading
+import numpy as np
+from enum import Enum
+from time import sleep
+
+from . import TZA500, UNITS, GAIN, BANDWITH, DeviceInfo, LoopbackTransport, ResponsivityCurve
+from .ringbuffer import RingBuffer
+
+
+# Every message is a 5 byte header (message type, payload length) followed by the payload
+FRAME_HEADER = struct.Struct("<BI")
+
+MESSAGE_HELLO = 1 # Server to client, JSON: protocol version, auth nonce and device state
+MESSAGE_AUTH = 2 # Client to server, HMAC-SHA256 of the nonce with the shared key
+MESSAGE_COMMAND = 3 # Client to server, JSON: id, method, args
+MESSAGE_REPLY = 4 # Server to client, JSON: id, result or error, device state
+MESSAGE_SAMPLES = 5 # Server to client, array of SAMPLE_RECORD
+
+PROTOCOL_VERSION = 1
+
+# Sample as sent to the clients, values in nA
+SAMPLE_RECORD = np.dtype([
+    ("timestamp", "<f8"),
+    ("value", "<f8"),
+    ("gain", "u1")
+])
+
+# Commands every client may send
+READ_COMMANDS = {"tza_get_info", "tza_get_gain", "tza_get_bandwith", "tza_is_polarity_inverted", "state"}
+# Commands that change the device configuration, only for authorized clients
+CONFIG_COMMANDS = {"tza_set_gain", "tza_set_bandwith", "tza_set_polarity", "tza_set_auto_zero", "tza_set_auto_zero_reset", "refresh"}
+
+MAX_MESSAGE_SIZE = 1 << 20
+
+
+def _create_socket(address: str | tuple[str, int]) -> socket.socket:
+    if isinstance(address, str):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock = socket.socket(socket.AF_INET6 if ":" in address[0] else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _frame(message_type: int, payload: bytes) -> bytes:
+    return FRAME_HEADER.pack(message_type, len(payload)) + payload
+
+
+def _json_frame(message_type: int, message: dict) -> bytes:
+    return _frame(message_type, json.dumps(message).encode())
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None # Connection closed
+        data += chunk
+    return bytes(data)
+
+
+def _recv_frame(sock: socket.socket) -> tuple[int, bytes] | None:
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    message_type, length = FRAME_HEADER.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise ConnectionError("Message of {} bytes exceeds the maximum size.".format(length))
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        return None
+    return message_type, payload
+
+
+class _ServerClient():
+    def __init__(self, server: "TZA500Server", sock: socket.socket, queue_size: int) -> None:
+        self._server: TZA500Server = server
+        self._sock: socket.socket = sock
+        self._queue: queue.Queue = queue.Queue(queue_size) # Frames to send
+        self._nonce: bytes = os.urandom(16)
+        self.authorized: bool = server.key is None
+        self.dropped: int = 0 # Sample frames dropped because the client reads too slowly
+        self._closed: threading.Event = threading.Event()
+
+    def start(self) -> None:
+        self.send(_json_frame(MESSAGE_HELLO, {"version": PROTOCOL_VERSION, "nonce": self._nonce.hex(), "auth": not self.authorized, "state": self._server.state()}))
+        threading.Thread(target=self._write_loop, name="TZA500 server writer", daemon=True).start()
+        threading.Thread(target=self._read_loop, name="TZA500 server reader", daemon=True).start()
+
+    def send(self, frame: bytes) -> None:
+        try:
+            self._queue.put(frame, timeout=5.0)
+        except queue.Full:
+            self.close() # The client does not read at all
+
+    def send_samples(self, frame: bytes) -> None:
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        try:
+            self._queue.put_nowait(None) # Wake up the writer
+        except queue.Full:
+            pass
+        self._server._remove_client(self)
+
+    def _write_loop(self) -> None:
+        try:
+            while not self._closed.is_set():
+                frame = self._queue.get()
+                if frame is None:
+                    break
+                self._sock.sendall(frame)
+        except OSError:
+            pass
+        self.close()
+
+    def _read_loop(self) -> None:
+        try:
+            while not self._closed.is_set():
+                message = _recv_frame(self._sock)
+                if message is None:
+                    break
+                message_type, payload = message
+                if message_type == MESSAGE_AUTH:
+                    self._authorize(payload)
+                elif message_type == MESSAGE_COMMAND:
+                    self.send(_json_frame(MESSAGE_REPLY, self._server._execute(self, json.loads(payload))))
+                else:
+                    break # Protocol error
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.close() # Never keep sending samples to a client that is not read from
+
+    def _authorize(self, digest: bytes) -> None:
+        if self._server.key is not None:
+            expected = hmac.new(self._server.key, self._nonce, hashlib.sha256).digest()
+            self.authorized = hmac.compare_digest(expected, digest)
+        self.send(_json_frame(MESSAGE_REPLY, {"id": 0, "result": self.authorized}))
+
+
+class TZA500Server():
+    def __init__(self, tza: TZA500, address: str | tuple[str, int], key: bytes | None = None, rate: float | None = None, queue_size: int = 1024) -> None:
+        """
+        Initializes the TZA500Server class.
+
+        The server owns the connected device and runs one acquisition stream.
+        Samples are sent to all clients over TCP or a Unix socket. Clients
+        that read too slowly lose sample frames instead of slowing down the
+        others. Configuration commands are only accepted from clients that
+        proved knowledge of the shared key. Without a key all clients may
+        configure the device.
+
+        :param:
+            tza(TZA500): Connected device
+            address(str | tuple[str, int]): Path of a Unix socket or (host, port) of a TCP socket
+            key(bytes | None): Shared key of the clients allowed to configure the device
+            rate(float | None): Sampling rate in Hz or None to sample as fast as possible
+            queue_size(int): Number of frames buffered per client
+        """
+        self._tza: TZA500 = tza
+        self._address: str | tuple[str, int] = address
+        self.key: bytes | None = key
+        self._rate: float | None = rate
+        self._queue_size: int = queue_size
+        self._sock: socket.socket = None
+        self._clients: set[_ServerClient] = set()
+        self._clients_lock: threading.Lock = threading.Lock()
+        self._stop: threading.Event = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._error: Exception = None
+
+    def __enter__(self) -> "TZA500Server":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        """
+        Bound address, with the actual port if port 0 was given.
+        """
+        return self._sock.getsockname() if self._sock is not None else self._address
+
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of sample frames dropped for the connected clients.
+        """
+        with self._clients_lock:
+            return sum(client.dropped for client in self._clients)
+
+    def state(self) -> dict:
+        """
+        Returns the device state sent to the clients.
+        """
+        tza = self._tza
+        return {
+            "serial": tza.tza_serial_number,
+            "firmware": tza.tza_firmware_version,
+            "date_of_manufacturing": tza.tza_date_of_manufacturing,
+            "initial_auto_zero": tza.initial_auto_zero,
+            "invert_input_polarity": tza.invert_input_polarity,
+            "bandwith": tza._bandwith,
+            "gain": tza._gain
+        }
+
+    def start(self) -> None:
+        """
+        Binds the socket and starts acquisition and fan-out in background
+        threads. A stream that is already running is not shared.
+        """
+        if self._sock is not None:
+            return
+
+        if self._tza.is_streaming:
+            raise Exception("Stream already running. Every sample is read by only one consumer, stop the stream first.")
+        self._tza.set_unit(UNITS.NANOAMPERE) # Clients convert to their own unit
+        if not self._tza.start_stream(self._rate):
+            raise Exception("Device not connected.")
+
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.unlink(self._address) # Stale socket of a previous server
+        self._sock = _create_socket(self._address)
+        if not isinstance(self._address, str):
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(self._address)
+        self._sock.listen()
+
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._accept_loop, name="TZA500 server accept", daemon=True),
+            threading.Thread(target=self._fan_out_loop, name="TZA500 server fan-out", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """
+        Disconnects all clients, closes the socket and stops acquisition.
+        """
+        self._stop.set()
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+            if isinstance(self._address, str) and os.path.exists(self._address):
+                os.unlink(self._address)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.close()
+        self._tza.stop_stream()
+
+    def serve_forever(self) -> None:
+        """
+        Starts the server and blocks until stop() is called or acquisition fails.
+        """
+        self.start()
+        try:
+            while not self._stop.wait(0.5):
+                pass
+        finally:
+            self.stop()
+        if self._error is not None:
+            raise self._error
+
+    def _accept_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                break # Socket closed by stop()
+            client = _ServerClient(self, sock, self._queue_size)
+            with self._clients_lock:
+                self._clients.add(client)
+            client.start()
+
+    def _fan_out_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                timestamps, values, gains = self._tza.read_stream()
+            except Exception as e:
+                self._error = e
+                self._stop.set()
+                break
+            if len(values) == 0:
+                sleep(0.002)
+                continue
+
+            samples = np.empty(len(values), dtype=SAMPLE_RECORD)
+            samples["timestamp"] = timestamps
+            samples["value"] = values
+            samples["gain"] = gains
+            frame = _frame(MESSAGE_SAMPLES, samples.tobytes())
+            with self._clients_lock:
+                clients = list(self._clients)
+            for client in clients:
+                client.send_samples(frame)
+
+    def _remove_client(self, client: _ServerClient) -> None:
+        with self._clients_lock:
+            self._clients.discard(client)
+
+    def _execute(self, client: _ServerClient, command: dict) -> dict:
+        reply = {"id": command.get("id") if isinstance(command, dict) else None}
+        try:
+            if not isinstance(command, dict):
+                raise Exception("Invalid command. A command must be a JSON object.")
+            method = command.get("method")
+            args = command.get("args", [])
+            if not isinstance(args, list):
+                raise Exception("Invalid arguments. The arguments must be a JSON array.")
+            if method in CONFIG_COMMANDS and not client.authorized:
+                raise Exception("Not authorized.")
+            if method == "state":
+                reply["result"] = None
+            elif method in READ_COMMANDS or method in CONFIG_COMMANDS:
+                reply["result"] = getattr(self._tza, method)(*args)
+            else:
+                raise Exception("Unknown command {}.".format(method))
+        except Exception as e:
+            reply["error"] = str(e)
+        reply["state"] = self.state()
+        return reply
+
+
+class TZA500Client():
+    def __init__(self, address: str | tuple[str, int], key: bytes | None = None, buffer_size: int = 65536, timeout: float = 10.0) -> None:
+        """
+        Initializes the TZA500Client class.
+
+        Connects to a TZA500Server and mirrors the TZA500 API. Samples sent by
+        the server are buffered locally. Unit and sensitivity are applied by
+        each client.
+
+        :param:
+            address(str | tuple[str, int]): Path of a Unix socket or (host, port) of a TCP socket
+            key(bytes | None): Shared key to configure the device
+            buffer_size(int): Number of samples the local buffer can hold
+            timeout(float): Time in seconds to wait for the reply to a command
+        """
+        self._address: str | tuple[str, int] = address
+        self._key: bytes | None = key
+        self._buffer_size: int = buffer_size
+        self._timeout: float = timeout
+        self._sock: socket.socket = None
+        self._converter: TZA500 = TZA500() # Holds unit and sensitivity, never connected
+        self._state: dict = {}
+        self._authorized: bool = False
+        self._buffer: RingBuffer = RingBuffer(buffer_size)
+        self._samples: threading.Condition = threading.Condition()
+        self._replies: dict[int, dict] = {}
+        self._replies_ready: threading.Condition = threading.Condition()
+        self._next_id: int = 1
+        self._reader: threading.Thread = None
+
+    def __enter__(self) -> "TZA500Client":
+        self.connect()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disconnect()
+
+    @property
+    def sensitivity(self) -> float:
+        return self._converter.sensitivity
+
+    @sensitivity.setter
+    def sensitivity(self, value: float) -> None:
+        self._converter.sensitivity = value
+
+    @property
+    def unit(self) -> str:
+        return self._converter.unit
+
+    @property
+    def authorized(self) -> bool:
+        return self._authorized
+
+    @property
+    def initial_auto_zero(self) -> str:
+        return self._state.get("initial_auto_zero")
+
+    @property
+    def invert_input_polarity(self) -> bool:
+        return self._state.get("invert_input_polarity")
+
+    @property
+    def tza_firmware_version(self) -> str:
+        return self._state.get("firmware")
+
+    @property
+    def tza_serial_number(self) -> str:
+        return self._state.get("serial")
+
+    @property
+    def tza_date_of_manufacturing(self) -> str:
+        return self._state.get("date_of_manufacturing")
+
+    @property
+    def stream_overruns(self) -> int:
+        return self._buffer.overruns
+
+    def connect(self) -> bool:
+        """
+        Connects to the server and authorizes with the key if one was given.
+
+        :return:
+            result(bool): Returns whether the client is connected and, if a key was given, authorized
+        """
+        if self._sock is not None:
+            return False
+
+        self._sock = _create_socket(self._address)
+        self._sock.connect(self._address)
+        message = _recv_frame(self._sock)
+        if message is None or message[0] != MESSAGE_HELLO:
+            self.disconnect()
+            raise Exception("Invalid reply from server.")
+        hello = json.loads(message[1])
+        if hello["version"] != PROTOCOL_VERSION:
+            self.disconnect()
+            raise Exception("Unsupported protocol version {}.".format(hello["version"]))
+        self._state = hello["state"]
+        self._authorized = not hello["auth"]
+
+        self._reader = threading.Thread(target=self._read_loop, name="TZA500 client reader", daemon=True)
+        self._reader.start()
+
+        if hello["auth"] and self._key is not None:
+            digest = hmac.new(self._key, bytes.fromhex(hello["nonce"]), hashlib.sha256).digest()
+            self._sock.sendall(_frame(MESSAGE_AUTH, digest))
+            self._authorized = bool(self._wait_reply(0)["result"])
+            return self._authorized
+        return True
+
+    def disconnect(self) -> None:
+        """
+        Disconnects from the server.
+        """
+        if self._sock is None:
+            return
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join()
+        self._reader = None
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                message = _recv_frame(self._sock)
+                if message is None:
+                    break
+                message_type, payload = message
+                if message_type == MESSAGE_SAMPLES:
+                    samples = np.frombuffer(payload, dtype=SAMPLE_RECORD)
+                    with self._samples:
+                        self._buffer.push_many(samples["timestamp"], samples["value"], samples["gain"])
+                        self._samples.notify_all()
+                elif message_type == MESSAGE_REPLY:
+                    reply = json.loads(payload)
+                    with self._replies_ready:
+                        self._replies[reply["id"]] = reply
+                        self._replies_ready.notify_all()
+        except (OSError, AttributeError):
+            pass # Socket closed by disconnect()
+        with self._replies_ready:
+            self._replies_ready.notify_all()
+        with self._samples:
+            self._samples.notify_all()
+
+    def _wait_reply(self, id: int) -> dict:
+        with self._replies_ready:
+            if not self._replies_ready.wait_for(lambda: id in self._replies or self._sock is None or not self._reader.is_alive(), self._timeout):
+                raise Exception("Communication error: No reply from server.")
+            if id not in self._replies:
+                raise Exception("Server not connected.")
+            return self._replies.pop(id)
+
+    def _call(self, method: str, *args):
+        if self._sock is None:
+            raise Exception("Server not connected.")
+        args = [arg.value if isinstance(arg, Enum) else arg for arg in args]
+        with self._replies_ready:
+            id = self._next_id
+            self._next_id += 1
+        self._sock.sendall(_json_frame(MESSAGE_COMMAND, {"id": id, "method": method, "args": args}))
+        reply = self._wait_reply(id)
+        self._state = reply.get("state", self._state)
+        if "error" in reply:
+            raise Exception(reply["error"])
+        return reply["result"]
+
+    def state(self) -> dict:
+        """
+        Returns the device state reported by the server.
+
+        :return:
+            state(dict): Serial number, firmware, bandwith, gain, ...
+        """
+        self._call("state")
+        return dict(self._state)
+
+    def set_unit(self, unit: UNITS) -> bool:
+        """
+        Sets the specified unit as the unit used for measurements of this client.
+
+        :param:
+            unit(UNITS): Unit to use for measurements
+        
+        :return:
+            result(bool): Returns whether the unit was set successfully
+        """
+        return self._converter.set_unit(unit)
+
+    def set_responsivity(self, curve: ResponsivityCurve | None) -> None:
+        """
+        Sets the calibration curve of the photodiode used for watt units.
+
+        :param:
+            curve(ResponsivityCurve | None): Calibration curve
+        """
+        self._converter.set_responsivity(curve)
+
+    def tza_set_wavelength(self, wavelength: float) -> bool:
+        """
+        Sets the sensitivity to the responsivity of the calibration curve at the wavelength.
+
+        :param:
+            wavelength(float): Wavelength in nm
+        
+        :return:
+            result(bool): Returns whether a calibration curve is set and covers the wavelength
+        """
+        return self._converter.tza_set_wavelength(wavelength)
+
+    def tza_get_wavelength(self) -> float | None:
+        return self._converter.tza_get_wavelength()
+
+    def tza_get_info(self) -> str:
+        return self._call("tza_get_info")
+
+    def tza_is_polarity_inverted(self) -> bool | None:
+        return self._call("tza_is_polarity_inverted")
+
+    def tza_set_polarity(self, invert_polarity: bool) -> bool:
+        return self._call("tza_set_polarity", invert_polarity)
+
+    def tza_get_bandwith(self) -> str | None:
+        return self._call("tza_get_bandwith")
+
+    def tza_set_bandwith(self, bandwith: str | BANDWITH) -> bool:
+        return self._call("tza_set_bandwith", bandwith)
+
+    def tza_get_gain(self) -> str | None:
+        return self._call("tza_get_gain")
+
+    def tza_set_gain(self, gain: str | GAIN) -> bool:
+        return self._call("tza_set_gain", gain)
+
+    def refresh(self) -> bool:
+        return self._call("refresh")
+
+    def tza_set_auto_zero(self) -> bool:
+        return self._call("tza_set_auto_zero")
+
+    def tza_set_auto_zero_reset(self) -> bool:
+        return self._call("tza_set_auto_zero_reset")
+
+    def read_stream(self, max_samples: int | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Removes and returns the buffered samples in order.
+
+        :param:
+            max_samples(int | None): Maximum number of samples to return
+        
+        :return:
+            tuple[timestamps(np.ndarray): Unix timestamps, values(np.ndarray): Values in the selected unit, gains(np.ndarray): Gain codes (1 = x1, 2 = x10, ...)]
+        """
+        with self._samples:
+            timestamps, values, gains = self._buffer.drain(max_samples)
+        return timestamps, self._converter._tza_convert_array(values), gains
+
+    def tza_get_measurements(self, n: int, timestamps: bool = False, gains: bool = False, wavelengths: float | np.ndarray | None = None) -> tuple:
+        """
+        Waits for the next n samples from the server. Samples buffered before the call are discarded.
+
+        :param:
+            n(int): Number of measurements
+            timestamps(bool): Also return the Unix timestamp of each measurement
+            gains(bool): Also return the gain code (1 = x1, 2 = x10, ...) of each measurement
+            wavelengths(float | np.ndarray | None): Wavelength in nm of each measurement for watt units, the set wavelength if None
+        
+        :return:
+            tuple[values(np.ndarray): Measured values, unit(str): Selected unit, (timestamps(np.ndarray)), (gains(np.ndarray))]
+        """
+        if n < 0:
+            raise Exception("Invalid number of measurements.")
+        if n > self._buffer_size:
+            raise Exception("Invalid number of measurements. At most {} samples are buffered.".format(self._buffer_size))
+
+        with self._samples:
+            self._buffer.clear()
+            if not self._samples.wait_for(lambda: len(self._buffer) >= n or self._reader is None or not self._reader.is_alive(), self._timeout + n * 0.01):
+                raise Exception("Communication error: No samples from server.")
+            if len(self._buffer) < n:
+                raise Exception("Server not connected.")
+            sample_timestamps, values, sample_gains = self._buffer.drain(n)
+        return self._converter._tza_measurements_result(sample_timestamps, values, sample_gains, timestamps, gains, wavelengths)
+
+    def tza_get_measurement(self) -> list[float, str]:
+        """
+        Waits for the next sample from the server.
+
+        :return:
+            list[value(float): Measured value, unit(str): Selected unit]
+        """
+        values, unit = self.tza_get_measurements(1)
+        return [float(values[0]), unit]
+
+
+def _parse_address(tcp: str | None, unix: str | None) -> str | tuple[str, int]:
+    if unix is not None:
+        return unix
+    host, _, port = (tcp or "127.0.0.1:5500").rpartition(":")
+    return (host.strip("[]") or "127.0.0.1", int(port))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="pytza500-server", description="Shares one TZA500 with many clients over TCP or a Unix socket")
+    parser.add_argument("--device", help="Serial number or device string \"TZA500 - serial_number\", the first device found if not given")
+    parser.add_argument("--tcp", metavar="HOST:PORT", help="TCP address to listen on (default 127.0.0.1:5500)")
+    parser.add_argument("--unix", metavar="PATH", help="Unix socket to listen on instead of TCP")
+    parser.add_argument("--key-file", help="File with the shared key of clients allowed to configure the device, PYTZA500_SERVER_KEY is used if not given")
+    parser.add_argument("--rate", type=float, default=None, help="Sampling rate in Hz, as fast as possible if not given")
+    parser.add_argument("--simulate", action="store_true", help="Serve a simulated device")
+    args = parser.parse_args(argv)
+
+    key = os.environ.get("PYTZA500_SERVER_KEY", "").encode() or None
+    if args.key_file is not None:
+        with open(args.key_file, "rb") as file:
+            key = file.read().strip()
+
+    tza = TZA500()
+    if args.simulate:
+        connected = tza.connect_transport(LoopbackTransport())
+    else:
+        device = args.device
+        if device is None:
+            devices = TZA500.discover_devices()
+            if len(devices) == 0:
+                sys.exit("No TZA500 found.")
+            device = devices[0]
+        elif " - " not in device:
+            device = DeviceInfo(device, "TZA500", 0)
+        connected = tza.connect(device)
+    if not connected:
+        sys.exit("Cannot initialize device.")
+    tza.enable_auto_reconnect()
+
+    server = TZA500Server(tza, _parse_address(args.tcp, args.unix), key=key, rate=args.rate)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        tza.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import math
+from collections import deque
+
+
+# Cutoff frequency in Hz of the output filter of each bandwith
+BANDWITH_CUTOFF: dict = {
+    "10 kHz": 10000.0,
+    "1 kHz": 1000.0,
+    "100 Hz": 100.0,
+    "10 Hz": 10.0
+}
+
+
+class SettlingModel():
+    def __init__(self, tolerance: float = 1e-3, gain_cutoff: dict | None = None, dead_time: float = 0.0) -> None:
+        """
+        Initializes the SettlingModel class.
+
+        Models the front end as first order low passes with the time
+        constant tau = 1 / (2 pi f) of the selected bandwith and, optionally,
+        of the selected gain stage. After a step the output is within
+        tolerance of the final value after ln(1 / tolerance) time constants.
+
+        :param:
+            tolerance(float): Remaining relative error after settling, e.g. 1e-3 for 0.1 %
+            gain_cutoff(dict | None): Cutoff frequency in Hz of each gain level (1 = x1, 2 = x10, ...), unlimited if not given
+            dead_time(float): Time in seconds added to every settling time, e.g. for relay switching
+        """
+        if not 0.0 < tolerance < 1.0:
+            raise Exception("Invalid tolerance. The tolerance must be between 0 and 1.")
+        self._tolerance: float = tolerance
+        self._gain_cutoff: dict = dict(gain_cutoff or {})
+        self._dead_time: float = dead_time
+        self._cache: dict = {}
+
+    @property
+    def tolerance(self) -> float:
+        return self._tolerance
+
+    def set_gain_cutoff(self, gain: int, cutoff: float | None) -> None:
+        """
+        Sets the cutoff frequency of a gain stage, e.g. from a measured step response.
+
+        :param:
+            gain(int): Gain level (1 = x1, 2 = x10, ...)
+            cutoff(float | None): Cutoff frequency in Hz, None for unlimited
+        """
+        if cutoff is None:
+            self._gain_cutoff.pop(gain, None)
+        else:
+            self._gain_cutoff[gain] = float(cutoff)
+        self._cache.clear()
+
+    def time_constant(self, bandwith: str, gain: int | None = None) -> float:
+        """
+        Returns the time constant in seconds of the combined filters.
+
+        :param:
+            bandwith(str): Bandwith in format: 10 kHz, 1 kHz, ...
+            gain(int | None): Gain level (1 = x1, 2 = x10, ...)
+        
+        :return:
+            tau(float): Time constant in seconds
+        """
+        tau = 1.0 / (2.0 * math.pi * BANDWITH_CUTOFF[bandwith])
+        if gain in self._gain_cutoff:
+            tau_gain = 1.0 / (2.0 * math.pi * self._gain_cutoff[gain])
+            tau = math.sqrt(tau * tau + tau_gain * tau_gain) # Rise times of cascaded stages add quadratically
+        return tau
+
+    def settle_time(self, bandwith: str, gain: int | None = None) -> float:
+        """
+        Returns the time in seconds the output needs to settle within the tolerance after a step.
+
+        :param:
+            bandwith(str): Bandwith in format: 10 kHz, 1 kHz, ...
+            gain(int | None): Gain level (1 = x1, 2 = x10, ...)
+        
+        :return:
+            settle_time(float): Settling time in seconds
+        """
+        key = (bandwith, gain)
+        if key not in self._cache:
+            self._cache[key] = self._dead_time + self.time_constant(bandwith, gain) * math.log(1.0 / self._tolerance)
+        return self._cache[key]
+
+
+class StabilityDetector():
+    def __init__(self, window: int = 3, tolerance: float = 0.1) -> None:
+        """
+        Initializes the StabilityDetector class.
+
+        Readings are stable once the spread of the last window readings is
+        within tolerance percent of the measuring range.
+
+        :param:
+            window(int): Number of consecutive readings compared
+            tolerance(float): Allowed spread in percent of the measuring range
+        """
+        if window < 2:
+            raise Exception("Invalid window. At least two readings must be compared.")
+        self._window: int = window
+        self._tolerance: float = tolerance
+        self._readings: deque = deque(maxlen=window)
+
+    def reset(self) -> None:
+        """
+        Discards all readings, e.g. after the gain was changed.
+        """
+        self._readings.clear()
+
+    def add(self, value: float, full_scale: float) -> bool:
+        """
+        Adds a reading and returns whether the readings are stable.
+
+        :param:
+            value(float): Reading in nA
+            full_scale(float): Measuring range of the current gain in nA
+        
+        :return:
+            stable(bool): Returns whether the last window readings are within the tolerance
+        """
+        self._readings.append(value)
+        if len(self._readings) < self._window:
+            return False
+        return (max(self._readings) - min(self._readings)) * 100.0 / full_scale <= self._tolerance
@@ -0,0 +1,273 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import math
+import random
+import threading
+from collections import deque
+from collections.abc import Callable
+from time import sleep, perf_counter
+
+
+def sine_signal(amplitude: float, frequency: float, offset: float = 0.0) -> Callable[[float], float]:
+    """
+    Returns a sine signal for FakeTZA500Device.
+
+    :param:
+        amplitude(float): Amplitude in nA
+        frequency(float): Frequency in Hz
+        offset(float): Offset in nA
+    
+    :return:
+        signal(Callable[[float], float]): Current in nA at a time in seconds
+    """
+    return lambda t: offset + amplitude * math.sin(2.0 * math.pi * frequency * t)
+
+
+def step_signal(levels: list[float], period: float) -> Callable[[float], float]:
+    """
+    Returns a signal for FakeTZA500Device that steps through levels, e.g. decades to exercise auto-gain.
+
+    :param:
+        levels(list[float]): Currents in nA
+        period(float): Time in seconds each level is held
+    
+    :return:
+        signal(Callable[[float], float]): Current in nA at a time in seconds
+    """
+    return lambda t: levels[int(t / period) % len(levels)]
+
+
+class FakeTZA500Device():
+    def __init__(self, signal: float | Callable[[float], float] = 1000.0, noise: float = 0.0, latency: float = 0.001,
+                 processing_time: float = 0.0002, baudrate: int = 115200, zero_offset: float = 0.0, max_gain: int | None = None,
+                 serial: str = "12345", firmware: str = "1.0", date_of_manufacturing: str = "01/2025", line_break: str = "\n") -> None:
+        """
+        Initializes the FakeTZA500Device class.
+
+        The simulated device provides the methods of an ftd2xx device handle
+        used by TZA500 and answers the TZA500 protocol. It can be connected
+        with TZA500.connect_handle().
+
+        :param:
+            signal(float | Callable[[float], float]): Input current in nA or a function returning it for a time in seconds
+            noise(float): Standard deviation of gaussian noise added to the input current in nA
+            latency(float): USB round trip latency in seconds. Overlaps for pipelined commands.
+            processing_time(float): Time in seconds the device needs per command. Does not overlap.
+            baudrate(int): Baudrate used to calculate the transfer time of replies
+            zero_offset(float): Offset current in nA removed by auto zero
+            max_gain(int | None): Maximum gain level reported by auto zero or None to not report one
+            serial(str): Serial number
+            firmware(str): Firmware version
+            date_of_manufacturing(str): Date of manufacturing in the format MM/YYYY
+            line_break(str): Separator of the lines of multi-line replies, "\n" or "\r\n"
+        """
+        self._signal: Callable[[float], float] = signal if callable(signal) else (lambda t, value=float(signal): value)
+        self.noise: float = noise
+        self.latency: float = latency
+        self.processing_time: float = processing_time
+        self._byte_time: float = 10.0 / baudrate # 8 data bits, 1 start bit, 1 stop bit
+        self.zero_offset: float = zero_offset
+        self._max_gain: int | None = max_gain
+
+        self._line_break: str = line_break
+        self._info: str = line_break.join(["TZA500 FW {}".format(firmware), "Serial: {}".format(serial), "Date of manufacturing: {}".format(date_of_manufacturing)])
+        self._event_char: int | None = None # The chip sends a packet to the host after this byte
+
+        self._gain: int = 1
+        self._bandwith: int = 1
+        self._inverted: bool = False
+        self._zero_compensation: float = 0.0
+        self._output: float | None = None # Output of the bandwith filter in nA
+        self._output_time: float = 0.0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._start: float = perf_counter()
+        self._read_timeout: float = 1.0
+        self._busy_until: float = 0.0
+        self._pending: deque[tuple[float, bytes]] = deque() # Replies with the time they arrive at the host
+        self._rx: bytearray = bytearray()
+        self._unplugged_until: float = 0.0
+
+        self.commands: int = 0 # Number of commands received
+
+    # ftd2xx device handle methods
+
+    def setBaudRate(self, baud: int) -> None:
+        self._byte_time = 10.0 / baud
+
+    def setDataCharacteristics(self, wordlen: int, stopbits: int, parity: int) -> None:
+        pass
+
+    def setFlowControl(self, flowcontrol: int, xon: int = -1, xoff: int = -1) -> None:
+        pass
+
+    def setTimeouts(self, read: int, write: int) -> None:
+        self._read_timeout = read / 1000.0
+
+    def setLatencyTimer(self, latency: int) -> None:
+        pass
+
+    def setUSBParameters(self, in_tx_size: int, out_tx_size: int = 0) -> None:
+        pass
+
+    def setChars(self, event: int, event_en: int, error: int, error_en: int) -> None:
+        self._event_char = event if event_en else None
+
+    def resetDevice(self) -> None:
+        self._check_connection()
+
+    def purge(self, mask: int = 0) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._rx.clear()
+
+    def close(self) -> None:
+        self.purge()
+
+    def unplug(self, duration: float) -> None:
+        """
+        Simulates a lost USB connection. All I/O fails for duration seconds.
+
+        :param:
+            duration(float): Time in seconds until the device is reachable again
+        """
+        with self._lock:
+            self._unplugged_until = perf_counter() + duration
+            self._pending.clear()
+            self._rx.clear()
+
+    def _check_connection(self) -> None:
+        if perf_counter() < self._unplugged_until:
+            raise OSError("Device not connected.")
+
+    def getQueueStatus(self) -> int:
+        self._check_connection()
+        with self._lock:
+            self._deliver(perf_counter())
+            return len(self._rx)
+
+    def write(self, data: bytes) -> int:
+        self._check_connection()
+        now = perf_counter()
+        text = data.decode(errors="ignore")
+        with self._lock:
+            for i in range(0, len(text) - 1, 2): # All commands are two characters long
+                reply = (self._execute(text[i:i + 2], now - self._start) + "\r").encode()
+                done = max(now, self._busy_until) + self.processing_time
+                for packet in self._packets(reply):
+                    done += len(packet) * self._byte_time
+                    self._pending.append((done + self.latency, packet))
+                self._busy_until = done
+                self.commands += 1
+        return len(data)
+
+    def read(self, nchars: int, raw: bool = True) -> bytes:
+        self._check_connection()
+        deadline = perf_counter() + self._read_timeout
+        while True:
+            with self._lock:
+                now = perf_counter()
+                self._deliver(now)
+                if len(self._rx) >= nchars or now >= deadline:
+                    data = bytes(self._rx[:nchars])
+                    del self._rx[:nchars]
+                    return data
+                next_reply = self._pending[0][0] if len(self._pending) > 0 else deadline
+            sleep(max(0.0, min(next_reply, deadline) - now)) # Block like the driver until data arrives or the timeout expires
+
+    def _packets(self, reply: bytes) -> list[bytes]:
+        """
+        Splits a reply after every event character, like the chip flushes its buffer to the host.
+        """
+        if self._event_char is None:
+            return [reply]
+        packets = []
+        start = 0
+        end = reply.find(self._event_char)
+        while end >= 0:
+            packets.append(reply[start:end + 1])
+            start = end + 1
+            end = reply.find(self._event_char, start)
+        if start < len(reply):
+            packets.append(reply[start:])
+        return packets
+
+    def _deliver(self, now: float) -> None:
+        while len(self._pending) > 0 and self._pending[0][0] <= now:
+            self._rx += self._pending.popleft()[1]
+
+    # Device behaviour
+
+    def _execute(self, command: str, t: float) -> str:
+        if command == "$U":
+            return "U OK"
+        elif command == "$I":
+            return self._info
+        elif command == "$E":
+            return "I" + self._measure(t)
+        elif command == "V?":
+            return "V? OK{}V{}".format(self._line_break, self._gain)
+        elif command == "B?":
+            return "B{}".format(self._bandwith)
+        elif command[0] == "V" and command[1] in "123456":
+            self._gain = int(command[1])
+            return "{} OK".format(command)
+        elif command[0] == "B" and command[1] in "1234":
+            self._bandwith = int(command[1])
+            return "{} OK".format(command)
+        elif command == "$F":
+            return "F1" if self._inverted else "F0"
+        elif command in ("$N", "$C"):
+            self._inverted = command == "$C"
+            return "{} OK".format(command[1])
+        elif command == "$A":
+            self._zero_compensation = self.zero_offset
+            return "A OK Gain: {}".format(self._max_gain) if self._max_gain is not None else "A OK"
+        elif command == "$R":
+            self._zero_compensation = 0.0
+            return "R OK"
+        return "ERR"
+
+    def _measure(self, t: float) -> str:
+        current = self._signal(t) + self.zero_offset - self._zero_compensation
+        if self.noise > 0.0:
+            current += random.gauss(0.0, self.noise)
+        if self._inverted:
+            current = -current
+
+        # First order low pass with the cutoff frequency of the selected bandwith
+        tau = 1.0 / (2.0 * math.pi * 10.0 ** (5 - self._bandwith))
+        if self._output is None:
+            self._output = current
+        else:
+            self._output += (current - self._output) * (1.0 - math.exp(-max(0.0, t - self._output_time) / tau))
+        self._output_time = t
+
+        full_scale = 12285000.0 / 10 ** (self._gain - 1)
+        value = max(-full_scale, min(full_scale, self._output)) # Saturate at the end of the range
+
+        if self._gain <= 3:
+            return "{:.4f}uA".format(value / 1000.0).replace(".", ",")
+        return "{:.3f}nA".format(value).replace(".", ",")
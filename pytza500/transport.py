@@ -0,0 +1,343 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import os
+import glob
+import select
+from abc import ABC, abstractmethod
+from time import monotonic
+
+
+class Transport(ABC):
+    """
+    Base class of the byte transports between TZA500 and the device.
+    """
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        ...
+
+    @abstractmethod
+    def open(self) -> None:
+        """
+        Opens the connection. Raises ConnectionError if the device cannot be opened.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Closes the connection.
+        """
+
+    @abstractmethod
+    def configure(self, read_timeout: int, latency_timer: int) -> None:
+        """
+        Sets up the connection for the TZA500: 115200 baud, 8 data bits, 1
+        stop bit, no parity, no flow control. Purges all buffers.
+
+        :param:
+            read_timeout(int): Time in ms a blocking read waits for new data
+            latency_timer(int): Time in ms the USB chip buffers data before sending it to the host
+        """
+
+    @abstractmethod
+    def set_latency(self, read_timeout: int, latency_timer: int) -> None:
+        """
+        Changes the read timeout and the latency timer of an open connection.
+        """
+
+    @abstractmethod
+    def write(self, data: bytes) -> int:
+        ...
+
+    @abstractmethod
+    def read(self, size: int) -> bytes:
+        """
+        Reads up to size bytes, blocking until size bytes arrived or the read timeout expired.
+        """
+
+    @abstractmethod
+    def queue_status(self) -> int:
+        """
+        Returns the number of received bytes that can be read without blocking.
+        """
+
+    @abstractmethod
+    def purge(self) -> None:
+        """
+        Discards all bytes in the receive and transmit buffers.
+        """
+
+
+class HandleTransport(Transport):
+    def __init__(self, handle) -> None:
+        """
+        Initializes the HandleTransport class.
+
+        Transport through an already opened object providing the methods of
+        an ftd2xx device handle, e.g. FakeTZA500Device.
+
+        :param:
+            handle: Opened ftd2xx compatible device handle
+        """
+        self._handle = handle
+        self._errors: tuple = () # Driver errors translated to ConnectionError
+
+    @property
+    def is_open(self) -> bool:
+        return self._handle is not None
+
+    @property
+    def handle(self):
+        return self._handle
+
+    def open(self) -> None:
+        pass # Already opened by the caller
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._call(self._handle.close)
+
+    def configure(self, read_timeout: int, latency_timer: int) -> None:
+        self._call(self._configure, read_timeout, latency_timer)
+
+    def _configure(self, read_timeout: int, latency_timer: int) -> None:
+        self._handle.setBaudRate(115200)
+        self._handle.setDataCharacteristics(8, 0, 0) # 8 data bits, 1 stop bit, no parity
+        self._handle.setFlowControl(0, 0, 0) # No flow control
+        self._handle.setTimeouts(read_timeout, 0)
+        self._handle.setLatencyTimer(latency_timer)
+        self._handle.setChars(13, 1, 0, 0) # Flush to the host as soon as a reply terminator '\r' is received
+        self._handle.resetDevice()
+        self._handle.purge() # Purge receive/transmit buffers
+
+    def set_latency(self, read_timeout: int, latency_timer: int) -> None:
+        self._call(self._handle.setTimeouts, read_timeout, 0)
+        self._call(self._handle.setLatencyTimer, latency_timer)
+
+    def write(self, data: bytes) -> int:
+        return self._call(self._handle.write, data)
+
+    def read(self, size: int) -> bytes:
+        return self._call(self._handle.read, size)
+
+    def queue_status(self) -> int:
+        return self._call(self._handle.getQueueStatus)
+
+    def purge(self) -> None:
+        self._call(self._handle.purge)
+
+    def _call(self, function, *args):
+        if self._handle is None:
+            raise ConnectionError("Device not open.")
+        try:
+            return function(*args)
+        except (ConnectionError, TimeoutError):
+            raise
+        except (OSError,) + self._errors as e: # E.g. a simulated device that was unplugged
+            raise ConnectionError(str(e)) from e
+
+
+class FTD2XXTransport(HandleTransport):
+    def __init__(self, serial: str, usb_transfer_size: int = 65536) -> None:
+        """
+        Initializes the FTD2XXTransport class.
+
+        Transport through the FTDI D2XX driver. The ftd2xx package is only
+        imported when the device is opened.
+
+        :param:
+            serial(str): Serial number of the device
+            usb_transfer_size(int): USB IN transfer size in bytes (multiple of 64, max. 65536) used for bulk reads
+        """
+        super().__init__(None)
+        self._serial: str = serial
+        self._usb_transfer_size: int = usb_transfer_size
+
+    def open(self) -> None:
+        import ftd2xx # Loaded on first connect, the D2XX library is not needed to import pytza500
+        self._errors = (ftd2xx.DeviceError,)
+        try:
+            self._handle = ftd2xx.openEx(self._serial.encode())
+        except ftd2xx.DeviceError as e:
+            raise ConnectionError("Cannot open Device with serial number {}.".format(self._serial)) from e
+
+    def close(self) -> None:
+        super().close()
+        self._handle = None
+
+    def _configure(self, read_timeout: int, latency_timer: int) -> None:
+        super()._configure(read_timeout, latency_timer)
+        self._handle.setUSBParameters(self._usb_transfer_size, 0)
+
+
+class LoopbackTransport(HandleTransport):
+    def __init__(self, device=None, **options) -> None:
+        """
+        Initializes the LoopbackTransport class.
+
+        In-process transport to a simulated device.
+
+        :param:
+            device(FakeTZA500Device | None): Simulated device. A new one is created with options if None.
+            options: Arguments of FakeTZA500Device
+        """
+        if device is None:
+            from .simulator import FakeTZA500Device
+            device = FakeTZA500Device(**options)
+        super().__init__(device)
+
+    @property
+    def device(self):
+        return self._handle
+
+
+class SerialTransport(Transport):
+    def __init__(self, port: str, latency_timer: bool = True) -> None:
+        """
+        Initializes the SerialTransport class.
+
+        Transport through the ftdi_sio kernel driver and its tty device
+        (Linux and macOS). No D2XX library is needed.
+
+        :param:
+            port(str): Path of the tty, e.g. /dev/ttyUSB0
+            latency_timer(bool): Set the latency timer of the kernel driver (needs write access to sysfs)
+        """
+        self._port: str = port
+        self._set_latency_timer: bool = latency_timer
+        self._fd: int | None = None
+        self._read_timeout: float = 0.01
+
+    @staticmethod
+    def find_ports() -> list[str]:
+        """
+        Returns the tty paths of connected TZA500 devices.
+
+        :return:
+            ports(list[str]): Paths of the ttys
+        """
+        return sorted(glob.glob("/dev/serial/by-id/*TZA500*"))
+
+    @property
+    def is_open(self) -> bool:
+        return self._fd is not None
+
+    def open(self) -> None:
+        try:
+            self._fd = os.open(self._port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError as e:
+            raise ConnectionError("Cannot open {}.".format(self._port)) from e
+
+    def close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            finally:
+                self._fd = None
+
+    def configure(self, read_timeout: int, latency_timer: int) -> None:
+        import termios # Not available on Windows
+
+        attributes = termios.tcgetattr(self._fd)
+        attributes[0] = 0 # iflag: raw input
+        attributes[1] = 0 # oflag: raw output
+        attributes[2] = termios.CS8 | termios.CREAD | termios.CLOCAL # 8 data bits, 1 stop bit, no parity, no flow control
+        attributes[3] = 0 # lflag: no echo, non-canonical
+        attributes[4] = termios.B115200
+        attributes[5] = termios.B115200
+        attributes[6][termios.VMIN] = 0
+        attributes[6][termios.VTIME] = 0
+        termios.tcsetattr(self._fd, termios.TCSANOW, attributes)
+        self.set_latency(read_timeout, latency_timer)
+        self.purge()
+
+    def set_latency(self, read_timeout: int, latency_timer: int) -> None:
+        self._read_timeout = read_timeout / 1000.0
+        if not self._set_latency_timer:
+            return
+        name = os.path.basename(os.path.realpath(self._port))
+        try:
+            with open("/sys/class/tty/{}/device/latency_timer".format(name), "w") as f:
+                f.write(str(latency_timer))
+        except OSError:
+            pass # No permission or not an FTDI device, keep the driver default
+
+    def write(self, data: bytes) -> int:
+        written = 0
+        while written < len(data):
+            self._wait(select_write=True)
+            try:
+                written += os.write(self._fd, data[written:])
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                raise ConnectionError(str(e)) from e
+        return written
+
+    def read(self, size: int) -> bytes:
+        data = b""
+        deadline = monotonic() + self._read_timeout
+        while len(data) < size:
+            remaining = deadline - monotonic()
+            if remaining <= 0.0 or not self._wait(timeout=remaining):
+                break
+            try:
+                chunk = os.read(self._fd, size - len(data))
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                raise ConnectionError(str(e)) from e
+            if len(chunk) == 0: # Readable without data: the tty was hung up
+                raise ConnectionError("Device disconnected.")
+            data += chunk
+        return data
+
+    def queue_status(self) -> int:
+        import fcntl
+        import termios
+        import struct
+        return struct.unpack("I", self._io(fcntl.ioctl, termios.FIONREAD, b"\0\0\0\0"))[0]
+
+    def purge(self) -> None:
+        import termios
+        self._io(termios.tcflush, termios.TCIOFLUSH)
+
+    def _wait(self, timeout: float | None = None, select_write: bool = False) -> bool:
+        if self._fd is None:
+            raise ConnectionError("Device not open.")
+        if select_write:
+            ready = select.select([], [self._fd], [], timeout)[1]
+        else:
+            ready = select.select([self._fd], [], [], timeout)[0]
+        return len(ready) > 0
+
+    def _io(self, function, *args):
+        if self._fd is None:
+            raise ConnectionError("Device not open.")
+        try:
+            return function(self._fd, *args)
+        except OSError as e:
+            raise ConnectionError(str(e)) from e
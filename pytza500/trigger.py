@@ -0,0 +1,414 @@
+# MIT License
+#
+# Copyright (c) 2025 Artifex Engineering GmbH & Co KG.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import queue
+import threading
+import numpy as np
+from abc import ABC, abstractmethod
+from enum import Enum
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import Callable
+from time import sleep
+
+
+class EDGE(Enum):
+    RISING = "rising"
+    FALLING = "falling"
+    BOTH = "both"
+
+
+@dataclass(frozen=True)
+class Segment():
+    trigger_time: float # Unix timestamp of the trigger sample
+    trigger_index: int # Index of the trigger sample in the arrays, the number of pre-trigger samples
+    timestamps: np.ndarray
+    values: np.ndarray # Values in the unit selected when the capture was started
+    gains: np.ndarray
+    unit: str | None
+
+
+class Trigger(ABC):
+    """
+    Base class of the trigger conditions. find() is called with consecutive
+    blocks of samples and returns the indices of the samples that fulfil the
+    condition. State needed across blocks is kept until reset().
+    """
+    def reset(self) -> None:
+        pass
+
+    @abstractmethod
+    def find(self, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        ...
+
+
+class ThresholdTrigger(Trigger):
+    def __init__(self, level: float, edge: EDGE = EDGE.RISING) -> None:
+        """
+        Fires on every sample above (RISING) or below (FALLING) the level, or
+        beyond it in either direction (BOTH). While the condition lasts, the
+        capture fires again as soon as the previous segment is complete.
+
+        :param:
+            level(float): Threshold in the selected unit
+            edge(EDGE): Direction of the threshold
+        """
+        self.level: float = level
+        self.edge: EDGE = edge
+
+    def find(self, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        if self.edge == EDGE.RISING:
+            return np.flatnonzero(values > self.level)
+        elif self.edge == EDGE.FALLING:
+            return np.flatnonzero(values < self.level)
+        return np.flatnonzero(np.abs(values) > abs(self.level))
+
+
+def _crossings(values: np.ndarray, level: float, hysteresis: float, last_high: bool | None) -> tuple[np.ndarray, bool | None]:
+    """
+    Returns the indices at which the values reach the level after having
+    been below level - hysteresis, and whether the last of these events was high.
+    """
+    low = values < level - hysteresis
+    high = values >= level
+    events = np.flatnonzero(low | high)
+    if len(events) == 0:
+        return events, last_high
+
+    kinds = high[events]
+    previous = np.empty_like(kinds)
+    previous[0] = True if last_high is None else last_high # Not armed at the start of the capture
+    previous[1:] = kinds[:-1]
+    return events[kinds & ~previous], bool(kinds[-1])
+
+
+class EdgeTrigger(Trigger):
+    def __init__(self, level: float, edge: EDGE = EDGE.RISING, hysteresis: float = 0.0) -> None:
+        """
+        Fires when the values cross the level. The trigger is armed again
+        only after the values went back beyond the hysteresis, so noise on a
+        slow edge does not fire repeatedly.
+
+        :param:
+            level(float): Level in the selected unit
+            edge(EDGE): Direction of the crossing
+            hysteresis(float): Distance in the selected unit the values must return to rearm
+        """
+        self.level: float = level
+        self.edge: EDGE = edge
+        self.hysteresis: float = abs(hysteresis)
+        self.reset()
+
+    def reset(self) -> None:
+        self._rising_high: bool | None = None
+        self._falling_high: bool | None = None
+
+    def find(self, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        indices = []
+        if self.edge in (EDGE.RISING, EDGE.BOTH):
+            rising, self._rising_high = _crossings(values, self.level, self.hysteresis, self._rising_high)
+            indices.append(rising)
+        if self.edge in (EDGE.FALLING, EDGE.BOTH):
+            falling, self._falling_high = _crossings(-values, -self.level, self.hysteresis, self._falling_high)
+            indices.append(falling)
+        return np.unique(np.concatenate(indices)) if len(indices) > 1 else indices[0]
+
+
+class WindowTrigger(Trigger):
+    def __init__(self, lower: float, upper: float, inside: bool = False) -> None:
+        """
+        Fires when the values leave the window between lower and upper, or
+        enter it if inside is True.
+
+        :param:
+            lower(float): Lower limit in the selected unit
+            upper(float): Upper limit in the selected unit
+            inside(bool): Fire on entering instead of leaving the window
+        """
+        if lower >= upper:
+            raise Exception("Invalid window. The lower limit must be below the upper limit.")
+        self.lower: float = lower
+        self.upper: float = upper
+        self.inside: bool = inside
+        self.reset()
+
+    def reset(self) -> None:
+        self._last: bool = True # Condition met before the first sample, so the start does not fire
+
+    def find(self, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        if len(values) == 0:
+            return np.flatnonzero(values)
+        condition = (values >= self.lower) & (values <= self.upper)
+        if not self.inside:
+            condition = ~condition
+        previous = np.empty_like(condition)
+        previous[0] = self._last
+        previous[1:] = condition[:-1]
+        self._last = bool(condition[-1])
+        return np.flatnonzero(condition & ~previous)
+
+
+class SlopeTrigger(Trigger):
+    def __init__(self, rate: float, edge: EDGE = EDGE.RISING) -> None:
+        """
+        Fires on samples at which the values change faster than rate per
+        second compared to the previous sample.
+
+        :param:
+            rate(float): Rate of change in the selected unit per second
+            edge(EDGE): Direction of the change
+        """
+        self.rate: float = abs(rate)
+        self.edge: EDGE = edge
+        self.reset()
+
+    def reset(self) -> None:
+        self._last: tuple[float, float] | None = None # Timestamp and value of the previous sample
+
+    def find(self, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        if len(values) == 0:
+            return np.flatnonzero(values)
+        if self._last is None:
+            t, v, first = timestamps, values, 1 # The first sample has no slope
+        else:
+            t, v, first = np.concatenate(([self._last[0]], timestamps)), np.concatenate(([self._last[1]], values)), 0
+        self._last = (float(timestamps[-1]), float(values[-1]))
+
+        dt = np.diff(t)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(dt > 0.0, np.diff(v) / dt, 0.0)
+        if self.edge == EDGE.RISING:
+            condition = slope >= self.rate
+        elif self.edge == EDGE.FALLING:
+            condition = slope <= -self.rate
+        else:
+            condition = np.abs(slope) >= self.rate
+        return np.flatnonzero(condition) + first
+
+
+class TriggeredCapture():
+    def __init__(self, tza, trigger: Trigger, pre_samples: int = 100, post_samples: int = 100, callback: Callable[[Segment], None] | None = None,
+                 rate: float | None = None, holdoff: int = 0, queue_size: int = 0) -> None:
+        """
+        Initializes the TriggeredCapture class.
+
+        Runs the trigger on the continuous stream of a TZA500. The last
+        pre_samples samples are kept, so every segment contains the samples
+        before the trigger, the trigger sample and post_samples samples after
+        it. A new trigger is accepted once the previous segment is complete
+        and another holdoff samples have passed. Segments are passed to the
+        callback or, without a callback, can be fetched with get().
+
+        :param:
+            tza(TZA500 | None): Device to capture from, None to only use process()
+            trigger(Trigger): Trigger condition on the values in the selected unit
+            pre_samples(int): Number of samples before the trigger sample
+            post_samples(int): Number of samples after the trigger sample
+            callback(Callable[[Segment], None] | None): Called with every segment from the capture thread
+            rate(float | None): Sampling rate in Hz of the stream started by the capture
+            holdoff(int): Number of samples after a segment during which triggers are ignored
+            queue_size(int): Number of segments held for get(), unlimited if 0
+        """
+        if pre_samples < 0 or post_samples < 0 or holdoff < 0:
+            raise Exception("Invalid number of samples. The number of samples must not be negative.")
+
+        self._tza = tza
+        self._trigger: Trigger = trigger
+        self._pre: int = int(pre_samples)
+        self._post: int = int(post_samples)
+        self._holdoff: int = int(holdoff)
+        self._callback: Callable[[Segment], None] | None = callback
+        self._rate: float | None = rate
+        self._segments: queue.Queue = queue.Queue(queue_size)
+        self._dropped: int = 0 # Segments that did not fit into the queue
+        self._count: int = 0
+
+        self._thread: threading.Thread = None
+        self._stop: threading.Event = threading.Event()
+        self._started_stream: bool = False
+        self._error: Exception = None
+        self.reset()
+
+    def __enter__(self) -> "TriggeredCapture":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def segments(self) -> int:
+        """
+        Number of captured segments.
+        """
+        return self._count
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of segments dropped because the queue was full.
+        """
+        return self._dropped
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def reset(self) -> None:
+        """
+        Discards the pre-trigger history and incomplete segments.
+        """
+        # History of the last pre + post + 1 samples, indexed by sample number modulo its size
+        size = self._pre + self._post + 1
+        self._timestamps: np.ndarray = np.zeros(size, dtype=np.float64)
+        self._values: np.ndarray = np.zeros(size, dtype=np.float64)
+        self._gains: np.ndarray = np.zeros(size, dtype=np.uint8)
+        self._total: int = 0 # Number of processed samples
+        self._next_trigger: int = 0 # First sample number at which a trigger is accepted
+        self._pending: deque = deque() # Sample numbers of triggers waiting for their post-trigger samples
+        self._trigger.reset()
+
+    def process(self, timestamps: np.ndarray, values: np.ndarray, gains: np.ndarray) -> list[Segment]:
+        """
+        Runs the trigger on the next block of samples, e.g. from a capture
+        file, and returns the completed segments.
+
+        :param:
+            timestamps(np.ndarray): Unix timestamps
+            values(np.ndarray): Values in the selected unit
+            gains(np.ndarray): Gain codes (1 = x1, 2 = x10, ...)
+        
+        :return:
+            segments(list[Segment]): Segments completed by this block
+        """
+        start = self._total
+        for index in self._trigger.find(timestamps, values):
+            index = int(index) + start
+            if index >= self._next_trigger:
+                self._pending.append(index)
+                self._next_trigger = index + self._post + 1 + self._holdoff
+
+        # Write the block into the history up to the last sample of each completed segment,
+        # the segment is copied out before its first samples are overwritten
+        unit = self._tza._unit if self._tza is not None else None
+        segments = []
+        position = 0
+        while position < len(values):
+            end = len(values)
+            if len(self._pending) > 0:
+                end = min(end, self._pending[0] + self._post + 1 - start)
+            self._write(timestamps, values, gains, position, end)
+            position = end
+
+            if len(self._pending) > 0 and self._pending[0] + self._post < self._total:
+                index = self._pending.popleft()
+                first = max(0, index - self._pre) # Fewer pre-trigger samples right after the start
+                positions = np.arange(first, index + self._post + 1) % len(self._values)
+                segments.append(Segment(float(self._timestamps[index % len(self._values)]), index - first, self._timestamps[positions],
+                                        self._values[positions], self._gains[positions], unit))
+
+        self._count += len(segments)
+        return segments
+
+    def _write(self, timestamps: np.ndarray, values: np.ndarray, gains: np.ndarray, first: int, last: int) -> None:
+        """
+        Appends the samples first to last of the block to the history without allocating.
+        """
+        size = len(self._values)
+        self._total += last - first
+        first = max(first, last - size) # Older samples would be overwritten right away
+        offset = (self._total - (last - first)) % size
+        count = min(last - first, size - offset) # Contiguous part up to the end of the history
+        for history, block in ((self._timestamps, timestamps), (self._values, values), (self._gains, gains)):
+            history[offset:offset + count] = block[first:first + count]
+            history[:last - first - count] = block[first + count:last]
+
+    def start(self) -> None:
+        """
+        Starts the stream of the device and the capture thread. Samples of
+        a stream are read by only one consumer, so a stream that is already
+        running, e.g. of a TZA500Server or AnalysisPipeline, is not shared.
+        """
+        if self._tza is None:
+            raise Exception("No device to capture from.")
+        if self.is_running:
+            return
+
+        if self._tza.is_streaming:
+            raise Exception("Stream already running. Every sample is read by only one consumer, stop the stream first.")
+        if not self._tza.start_stream(self._rate):
+            raise Exception("Device not connected.")
+        self._started_stream = True
+        self._error = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._capture_loop, name="TZA500 trigger", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the capture thread and the stream.
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        if self._started_stream:
+            self._tza.stop_stream()
+            self._started_stream = False
+
+    def get(self, timeout: float | None = None) -> Segment | None:
+        """
+        Returns the next segment, waiting at most timeout seconds.
+
+        :param:
+            timeout(float | None): Time in seconds to wait, forever if None
+        
+        :return:
+            segment(Segment | None): Next segment or None if no segment was captured in time
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        try:
+            return self._segments.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _capture_loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                timestamps, values, gains = self._tza.read_stream()
+                if len(values) == 0:
+                    sleep(0.002)
+                    continue
+                for segment in self.process(timestamps, values, gains):
+                    if self._callback is not None:
+                        self._callback(segment)
+                        continue
+                    try:
+                        self._segments.put_nowait(segment)
+                    except queue.Full:
+                        self._dropped += 1
+        except Exception as e:
+            self._error = e
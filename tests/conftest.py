@@ -0,0 +1,44 @@
+import pytest
+
+from pytza500 import TZA500, FakeTZA500Device, LoopbackTransport, UNITS
+
+
+@pytest.fixture
+def connect():
+    """
+    Connects TZA500 instances to simulated devices and disconnects them after the test.
+
+    connect(device=None, unit=None, tza=None, **options) connects tza, a new
+    TZA500 if None, to device or a new FakeTZA500Device(**options) and
+    selects the unit if given.
+    """
+    connected = []
+
+    def connect(device: FakeTZA500Device | None = None, unit: UNITS | None = None, tza: TZA500 | None = None, **options) -> TZA500:
+        tza = tza if tza is not None else TZA500()
+        assert tza.connect_transport(LoopbackTransport(device if device is not None else FakeTZA500Device(**options)))
+        connected.append(tza)
+        if unit is not None:
+            tza.set_unit(unit)
+        return tza
+
+    yield connect
+    for tza in connected:
+        try:
+            tza.disconnect()
+        except ConnectionError:
+            pass # Unplugged by the test
+
+
+@pytest.fixture
+def connect_cached(connect):
+    """
+    Like connect, then enables or disables the state cache and reads the state from the device.
+    """
+    def connect_cached(device: FakeTZA500Device | None = None, state_cache: bool = True, **options) -> TZA500:
+        tza = connect(device, **options)
+        tza.state_cache = state_cache
+        assert tza.refresh()
+        return tza
+
+    return connect_cached
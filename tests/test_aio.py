@@ -0,0 +1,48 @@
+import asyncio
+import numpy as np
+
+from pytza500 import AsyncTZA500, GAIN, UNITS
+
+
+def test_commands_are_awaitable(connect):
+    async def run() -> None:
+        async with AsyncTZA500(connect(signal=250.0, unit=UNITS.NANOAMPERE)) as tza:
+            assert tza.tza_serial_number == "12345"
+            assert await tza.tza_set_gain(GAIN.X100)
+            assert await tza.tza_get_gain() == "x100"
+            assert await tza.tza_get_measurement() == [250.0, "nA"]
+            values, unit = await tza.tza_get_measurements(10)
+            assert unit == "nA" and np.all(values == 250.0)
+    asyncio.run(run())
+
+
+def test_devices_are_serviced_concurrently(connect):
+    async def run() -> None:
+        devices = [AsyncTZA500(connect(signal=float(i), latency=0.01, unit=UNITS.NANOAMPERE)) for i in range(4)]
+        results = await asyncio.gather(*(tza.tza_get_measurement() for tza in devices))
+        assert [value for value, _ in results] == [0.0, 1.0, 2.0, 3.0]
+        for tza in devices:
+            await tza.close()
+    asyncio.run(run())
+
+
+def test_commands_of_one_device_keep_their_order(connect):
+    async def run() -> None:
+        tza = AsyncTZA500(connect(unit=UNITS.NANOAMPERE))
+        results = await asyncio.gather(tza.tza_set_gain(GAIN.X10), tza.tza_get_gain(), tza.tza_set_gain(GAIN.X1000), tza.tza_get_gain())
+        assert results == [True, "x10", True, "x1000"]
+        await tza.close()
+    asyncio.run(run())
+
+
+def test_measurements_iterator(connect):
+    async def run() -> None:
+        tza = AsyncTZA500(connect(signal=5.0, unit=UNITS.NANOAMPERE))
+        batches = []
+        async for values, _ in tza.measurements(batch_size=3):
+            batches.append(values)
+            if len(batches) == 2:
+                break
+        assert [len(values) for values in batches] == [3, 3]
+        await tza.close()
+    asyncio.run(run())
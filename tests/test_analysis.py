@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+from time import sleep, monotonic
+
+from pytza500 import AnalysisPipeline
+
+
+# Stages run in spawned processes and must be importable
+def total(timestamps, values, gains):
+    return float(values.sum())
+
+
+def view(timestamps, values, gains):
+    return values
+
+
+def slow(timestamps, values, gains):
+    sleep(0.01 if len(values) < 4 else 0.5)
+    return len(values)
+
+
+def failing(timestamps, values, gains):
+    if np.any(values < 0.0):
+        raise ValueError("negative value")
+    return len(values)
+
+
+def samples(values):
+    values = np.asarray(values, dtype=np.float64)
+    return np.arange(len(values), dtype=np.float64), values, np.ones(len(values), dtype=np.uint8)
+
+
+def test_stages_get_every_sample_in_order():
+    pipeline = AnalysisPipeline(size=8, max_wait=10.0)
+    pipeline.add_stage("total", total, batch_size=3)
+    pipeline.add_stage("view", view, batch_size=3)
+    with pytest.raises(Exception):
+        pipeline.add_stage("total", total)
+    with pipeline:
+        with pytest.raises(Exception):
+            pipeline.add_stage("late", total)
+        assert pipeline.write(*samples(np.arange(100.0))) == 100
+    results = pipeline.results()
+    assert sum(result for name, result in results if name == "total") == sum(range(100))
+    # Views returned by a stage are serialized before the ring is overwritten
+    assert np.concatenate([result for name, result in results if name == "view"]).tolist() == list(range(100))
+    assert pipeline.written == 100 and pipeline.dropped == 0
+
+
+def test_writing_waits_for_the_slowest_stage():
+    pipeline = AnalysisPipeline(size=4, max_wait=10.0)
+    pipeline.add_stage("slow", slow, batch_size=1)
+    with pipeline:
+        assert pipeline.write(*samples(np.zeros(20))) == 20
+        assert pipeline.lag()["slow"] <= 4
+    assert sum(result for _, result in pipeline.results()) == 20
+    assert pipeline.dropped == 0
+
+
+def test_samples_are_dropped_and_counted_after_max_wait():
+    pipeline = AnalysisPipeline(size=4, max_wait=0.0)
+    pipeline.add_stage("slow", slow, batch_size=4)
+    with pipeline:
+        assert pipeline.write(*samples(np.zeros(10))) == 4
+        assert pipeline.write(*samples(np.zeros(3))) == 0
+    assert pipeline.written == 4
+    assert pipeline.dropped == 9
+    assert [result for _, result in pipeline.results()] == [4]
+
+
+def test_stage_errors_are_raised_after_earlier_results():
+    pipeline = AnalysisPipeline(size=16, max_wait=10.0)
+    pipeline.add_stage("failing", failing, batch_size=2)
+    with pipeline:
+        pipeline.write(*samples([1.0, 2.0, -1.0, 3.0]))
+        sleep(0.5)
+        assert pipeline.write(*samples(np.ones(32))) == 32 # The failed stage does not hold back writing
+    assert pipeline.results(timeout=5.0) == [("failing", 2)]
+    with pytest.raises(Exception, match="Analysis stage failing failed"):
+        pipeline.results()
+    assert pipeline.results() == []
+
+
+def test_pipeline_without_stages_or_start():
+    pipeline = AnalysisPipeline()
+    with pytest.raises(Exception, match="No analysis stages"):
+        pipeline.start()
+    with pytest.raises(Exception, match="not started"):
+        pipeline.write(*samples([1.0]))
+
+
+def large(timestamps, values, gains):
+    return np.zeros(100000) # 800 kB, more than the pipe holds
+
+
+def hanging(timestamps, values, gains):
+    sleep(60.0)
+
+
+def test_stop_collects_large_results_nobody_read():
+    pipeline = AnalysisPipeline(size=1024, max_wait=10.0)
+    pipeline.add_stage("large", large, batch_size=64)
+    pipeline.start()
+    assert pipeline.write(*samples(np.zeros(512))) == 512
+    sleep(0.5)
+    start = monotonic()
+    pipeline.stop(timeout=10.0)
+    assert monotonic() - start < 5.0
+    results = pipeline.results(timeout=1.0)
+    assert len(results) == 8 and all(len(result) == 100000 for _, result in results)
+    assert pipeline.results(timeout=1.0) == []
+
+
+def test_terminated_stages_are_reported_instead_of_blocking():
+    pipeline = AnalysisPipeline(size=16, max_wait=10.0)
+    pipeline.add_stage("hanging", hanging)
+    pipeline.start()
+    pipeline.write(*samples([1.0]))
+    pipeline.stop(timeout=0.5)
+    with pytest.raises(Exception, match="terminated"):
+        pipeline.results(timeout=None)
+    assert pipeline.results(timeout=None) == []
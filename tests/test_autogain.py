@@ -0,0 +1,46 @@
+import pytest
+
+from pytza500 import TZA500, FakeTZA500Device, GAIN, UNITS
+
+
+@pytest.fixture
+def connect_autogain(connect):
+    def connect_autogain(signal: float) -> tuple[TZA500, FakeTZA500Device]:
+        device = FakeTZA500Device(signal=signal, latency=0.0002)
+        tza = connect(device, UNITS.NANOAMPERE)
+        tza.set_settling(adaptive=True) # Settle on stable readings instead of the modelled time
+        assert tza.tza_set_gain(GAIN.AUTO)
+        return tza, device
+
+    return connect_autogain
+
+
+def test_auto_gain_jumps_to_the_target_gain_in_one_step(connect_autogain):
+    tza, device = connect_autogain(50.0)
+    assert tza.tza_get_measurement() == [50.0, "nA"]
+    assert device._gain == 6
+    assert tza.autogain_statistics["range_changes"] == 1
+    assert tza.tza_get_gain() == "Auto: x100000"
+
+
+def test_auto_gain_leaves_a_saturated_range(connect_autogain):
+    tza, device = connect_autogain(50.0)
+    tza.tza_get_measurement()
+    device._signal = lambda t: 5000000.0
+    assert tza.tza_get_measurement() == [5000000.0, "nA"]
+    assert device._gain == 1
+
+
+def test_auto_gain_keeps_the_gain_between_the_thresholds(connect_autogain):
+    tza, device = connect_autogain(50.0)
+    tza.tza_get_measurement()
+    tza.reset_autogain_statistics()
+    device._signal = lambda t: 20.0 # 16 % of the range
+    assert tza.tza_get_measurement() == [20.0, "nA"]
+    assert tza.autogain_statistics == {"range_changes": 0, "extra_round_trips": 0}
+
+
+def test_auto_gain_thresholds(connect_autogain):
+    tza, _ = connect_autogain(50.0)
+    assert not tza.set_autogain_thresholds(50.0, 10.0)
+    assert tza.set_autogain_thresholds(1.0, 99.0)
@@ -0,0 +1,115 @@
+import os
+import numpy as np
+from time import time
+
+import pytest
+
+from pytza500 import TZA500, UNITS, GAIN, BANDWITH, Calibration, CalibrationStore
+
+
+@pytest.fixture
+def connect_stored(connect):
+    def connect_stored(store: CalibrationStore, temperature: float | None = None, **options) -> TZA500:
+        tza = TZA500()
+        tza.set_calibration_store(store, temperature)
+        return connect(tza=tza, unit=UNITS.NANOAMPERE, **options)
+
+    return connect_stored
+
+
+def calibration(created: float | None = None, temperature: float | None = 22.0, max_gain: int = 3) -> Calibration:
+    return Calibration("12345", "1.0", time() if created is None else created, temperature, max_gain, "Auto zero",
+                       {BANDWITH.KHZ_10.value: {1: 5.0, 2: 7.0}})
+
+
+def test_calibration_records_and_restores_the_maximum_gain(connect_stored, tmp_path):
+    path = str(tmp_path / "calibration.json")
+    tza = connect_stored(CalibrationStore(path), signal=0.0, zero_offset=5.0, max_gain=3)
+    result = tza.tza_calibrate(bandwiths=[BANDWITH.KHZ_10], samples=8)
+    assert result.max_gain == 3
+    assert result.offsets == {"10 kHz": {1: 5.0, 2: 5.0, 3: 5.0}} # Only up to the maximum gain
+    assert tza.calibration is result
+    tza.disconnect()
+
+    store = CalibrationStore(path)
+    assert store.get(result.serial, result.firmware) == result
+    tza = connect_stored(store, signal=100.0, zero_offset=5.0, max_gain=3)
+    assert tza.calibration == result
+    assert tza._max_gain == 3
+    assert tza.tza_get_measurement() == [100.0, "nA"]
+    tza.disconnect()
+
+
+def test_offsets_are_subtracted_per_gain(connect_stored, tmp_path):
+    store = CalibrationStore(str(tmp_path / "calibration.json"))
+    store.put(calibration())
+    tza = connect_stored(store, signal=100.0, zero_offset=5.0)
+    assert tza.tza_set_bandwith(BANDWITH.KHZ_10)
+    assert tza.tza_set_gain(GAIN.X1)
+    assert tza.tza_get_measurement() == [100.0, "nA"]
+    values, _ = tza.tza_get_measurements(4)
+    assert np.all(values == 100.0)
+
+    assert tza.tza_set_gain(GAIN.X10)
+    assert tza.tza_get_measurement() == [98.0, "nA"]
+    values, _ = tza.tza_get_measurements(4)
+    assert np.all(values == 98.0)
+
+    assert tza.tza_set_gain(GAIN.X100) # Not calibrated
+    assert tza.tza_get_measurement() == [105.0, "nA"]
+    tza.disconnect()
+
+
+def test_auto_zero_discards_the_calibration(connect_stored, tmp_path):
+    store = CalibrationStore(str(tmp_path / "calibration.json"))
+    store.put(calibration())
+    tza = connect_stored(store, signal=100.0, zero_offset=5.0)
+    assert tza.calibration is not None
+    tza._tza_auto_zero()
+    assert tza.calibration is None
+    tza.disconnect()
+
+
+def test_calibrations_expire_by_age(connect_stored, tmp_path):
+    store = CalibrationStore(str(tmp_path / "calibration.json"), max_age=3600.0)
+    store.put(calibration(created=time() - 7200.0))
+    assert store.get("12345", "1.0") is None
+    tza = connect_stored(store)
+    assert tza.calibration is None
+    assert tza._max_gain == 6
+    tza.disconnect()
+
+    store.max_age = None
+    assert store.get("12345", "1.0") is not None
+
+
+def test_calibrations_expire_by_temperature(connect_stored, tmp_path):
+    store = CalibrationStore(str(tmp_path / "calibration.json"), max_temperature_drift=2.0)
+    store.put(calibration(temperature=22.0))
+    assert store.get("12345", "1.0", 23.5) is not None
+    assert store.get("12345", "1.0", 24.5) is None
+    assert store.get("12345", "1.0") is not None # Unknown temperature
+    store.put(calibration(temperature=None))
+    assert store.get("12345", "1.0", 40.0) is not None
+
+    store.put(calibration(temperature=22.0))
+    for temperature, valid in ((30.0, False), (21.0, True)):
+        tza = connect_stored(store, temperature)
+        assert (tza.calibration is not None) == valid
+        tza.disconnect()
+
+
+def test_store_round_trip(tmp_path):
+    path = str(tmp_path / "pytza500" / "calibration.json")
+    store = CalibrationStore(path)
+    assert len(store) == 0
+    store.put(calibration())
+    store.put(Calibration("54321", "1.0", time(), None, 6, "None"))
+    store.save()
+    assert not os.path.exists(path + ".tmp")
+
+    loaded = CalibrationStore(path)
+    assert len(loaded) == 2
+    assert loaded.get("12345", "1.0") == calibration(created=loaded.get("12345", "1.0").created)
+    assert loaded.remove("54321", "1.0")
+    assert not loaded.remove("54321", "1.0")
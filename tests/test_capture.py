@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from pytza500 import CaptureWriter, CaptureReader, GAIN
+from pytza500.capture import CAPTURE_HEADER_SIZE, CAPTURE_RECORD
+
+
+def samples(n: int, start: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return start + np.arange(n, dtype=np.float64), np.arange(n, dtype=np.float64) * 2.0, np.full(n, 3, dtype=np.uint8)
+
+
+def test_records_are_read_back_memory_mapped(tmp_path):
+    path = str(tmp_path / "capture.tza")
+    with CaptureWriter(path, chunk_size=4, serial="42", firmware="1.2", date_of_manufacturing="03/2025") as writer:
+        writer.write(*samples(10), bandwith=2, polarity=1)
+        assert len(writer) == 10
+    reader = CaptureReader(path)
+    assert len(reader) == 10
+    assert isinstance(reader.records, np.memmap)
+    assert (reader.tza_serial_number, reader.tza_firmware_version, reader.tza_date_of_manufacturing) == ("42", "1.2", "03/2025")
+    assert reader.raw.tolist() == (np.arange(10) * 2.0).tolist()
+    assert np.all(reader.gains == 3) and np.all(reader.bandwiths == 2) and np.all(reader.polarities == 1)
+
+
+def test_append_drops_an_incomplete_last_record(tmp_path):
+    path = str(tmp_path / "capture.tza")
+    with CaptureWriter(path, serial="42") as writer:
+        writer.write(*samples(5))
+    with open(path, "ab") as file:
+        file.write(b"\1" * (CAPTURE_RECORD.itemsize // 2)) # Interrupted write
+    assert len(CaptureReader(path)) == 5
+    with CaptureWriter(path, append=True) as writer:
+        writer.write(*samples(3, start=5.0))
+    reader = CaptureReader(path)
+    assert reader.timestamps.tolist() == list(range(8))
+
+
+def test_record_from_device(connect, tmp_path):
+    path = str(tmp_path / "capture.tza")
+    tza = connect(signal=123.0)
+    assert tza.tza_set_gain(GAIN.X1000)
+    with CaptureWriter(path, tza) as writer:
+        assert writer.record(n=20) == 20
+    reader = CaptureReader(path)
+    assert reader.tza_serial_number == "12345"
+    assert np.all(reader.raw == 123.0)
+    assert np.all(reader.gains == 4)
+    assert np.all(reader.bandwiths == 1)
+
+
+def test_invalid_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * CAPTURE_HEADER_SIZE)
+    with pytest.raises(Exception, match="not a TZA500 capture file"):
+        CaptureReader(str(path))
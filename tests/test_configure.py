@@ -0,0 +1,146 @@
+import pytest
+
+from pytza500 import FakeTZA500Device, GAIN, BANDWITH, UNITS, ResponsivityCurve
+
+
+class RejectingDevice(FakeTZA500Device):
+    """
+    Answers ERR to the given gain command.
+    """
+    def __init__(self, rejected: bytes, **options) -> None:
+        super().__init__(**options)
+        self.rejected: bytes = rejected
+
+    def write(self, data: bytes) -> int:
+        return super().write(data.replace(self.rejected, b"V9"))
+
+
+class FailingDevice(FakeTZA500Device):
+    """
+    Loses the connection on the next read after fail is set.
+    """
+    fail: bool = False
+
+    def read(self, nchars: int, raw: bool = True) -> bytes:
+        if self.fail:
+            self.fail = False
+            raise OSError("Device not connected.")
+        return super().read(nchars, raw)
+
+
+def test_configure_applies_all_settings(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device)
+    assert tza.configure(bandwith=BANDWITH.KHZ_1, gain=GAIN.X100000, polarity=True, unit=UNITS.NANOAMPERE)
+    assert (device._bandwith, device._gain, device._inverted) == (2, 6, True)
+    assert tza.tza_get_measurement()[1] == "nA"
+
+
+def test_configure_skips_settings_already_set(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device)
+    assert tza.configure(bandwith=BANDWITH.KHZ_1, gain=GAIN.X100)
+    commands = device.commands
+    assert tza.configure(bandwith=BANDWITH.KHZ_1, gain=GAIN.X100)
+    assert device.commands == commands
+
+
+def test_configure_rolls_back_when_a_setting_is_rejected(connect_cached):
+    device = RejectingDevice(b"V3")
+    tza = connect_cached(device)
+    assert not tza.configure(bandwith=BANDWITH.HZ_100, gain=GAIN.X100, unit=UNITS.NANOAMPERE)
+    assert (device._bandwith, device._gain) == (1, 1)
+    assert tza.tza_get_measurement()[1] == "µA"
+    assert tza.tza_get_bandwith() == "10 kHz"
+    assert tza.tza_get_gain() == "x1"
+
+
+def test_configure_raises_and_invalidates_cache_on_connection_loss(connect_cached):
+    device = FailingDevice()
+    tza = connect_cached(device)
+    device.fail = True
+    with pytest.raises(OSError):
+        tza.configure(bandwith=BANDWITH.HZ_10, gain=GAIN.X1000)
+    assert tza.tza_set_bandwith(BANDWITH.HZ_10)
+    assert tza.tza_set_gain(GAIN.X1)
+    assert (device._bandwith, device._gain) == (4, 1)
+
+
+def test_configure_reverts_after_reconnect(connect_cached):
+    device = FailingDevice()
+    tza = connect_cached(device)
+    tza.enable_auto_reconnect(max_attempts=3, initial_delay=0.01)
+    device.fail = True
+    assert not tza.configure(bandwith=BANDWITH.HZ_10, gain=GAIN.X1000)
+    assert (device._bandwith, device._gain) == (1, 1)
+    assert tza.tza_get_bandwith() == "10 kHz"
+    assert tza.tza_get_gain() == "x1"
+
+
+def test_sweep_skips_auto_gain(connect_cached):
+    device = FakeTZA500Device(signal=100.0)
+    tza = connect_cached(device)
+    records = tza.sweep(gains=[GAIN.X1, GAIN.AUTO, GAIN.X10], bandwiths=[BANDWITH.KHZ_10], samples=3)
+    assert sorted(set(records["gain"])) == [1, 2]
+    assert len(records) == 6
+    with pytest.raises(Exception, match="Invalid gain"):
+        tza.sweep(gains=[GAIN.AUTO])
+
+
+def test_configure_validates_everything_before_sending(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device)
+    commands = device.commands
+    with pytest.raises(Exception, match="Invalid setting"):
+        tza.configure(bandwith=BANDWITH.HZ_10, offset=1.0)
+    with pytest.raises(Exception, match="Invalid gain"):
+        tza.configure(bandwith=BANDWITH.HZ_10, gain="x3")
+    with pytest.raises(Exception, match="No responsivity curve"):
+        tza.configure(bandwith=BANDWITH.HZ_10, wavelength=500.0)
+    tza.set_responsivity(ResponsivityCurve([400.0, 900.0], [0.1, 0.2]))
+    with pytest.raises(Exception, match="outside the calibrated range"):
+        tza.configure(bandwith=BANDWITH.HZ_10, wavelength=1000.0)
+    assert device.commands == commands
+    assert tza.tza_get_bandwith() == "10 kHz"
+
+
+def test_configure_sets_the_sensitivity_from_the_wavelength(connect_cached):
+    tza = connect_cached(FakeTZA500Device(signal=500.0))
+    tza.set_responsivity(ResponsivityCurve([400.0, 900.0], [0.1, 0.2]))
+    assert tza.configure(unit=UNITS.NANOWATTS, wavelength=650.0)
+    assert tza.tza_get_measurement() == [pytest.approx(500.0 / 0.15), "nW"]
+    assert tza.configure(sensitivity=0.5)
+    assert tza.tza_get_measurement() == [1000.0, "nW"]
+
+
+def test_sweep_walks_the_gains_back_and_forth_and_restores_the_settings(connect_cached):
+    tza = connect_cached(FakeTZA500Device(signal=100.0))
+    tza.set_unit(UNITS.NANOAMPERE)
+    assert tza.tza_set_gain(GAIN.X10)
+    records = tza.sweep(gains=[GAIN.X1, GAIN.X10, GAIN.X100], bandwiths=[BANDWITH.KHZ_1, BANDWITH.KHZ_10], samples=2)
+    steps = [(int(record["bandwith"]), int(record["gain"])) for record in records[::2]]
+    assert steps == [(1, 1), (1, 2), (1, 3), (2, 3), (2, 2), (2, 1)]
+    assert records["index"].tolist() == [0, 1] * 6
+    assert records["value"].tolist() == [100.0] * 12
+    assert tza.tza_get_bandwith() == "10 kHz"
+    assert tza.tza_get_gain() == "x10"
+
+
+def test_sweep_reports_its_error_when_restoring_fails(connect_cached, monkeypatch):
+    device = FakeTZA500Device(signal=100.0)
+    tza = connect_cached(device)
+    measure = tza._tza_measure_raw
+    calls = []
+
+    def failing_measure(*args, **kwargs):
+        calls.append(None)
+        if len(calls) == 2:
+            device.unplug(60.0)
+            raise ValueError("measurement failed")
+        return measure(*args, **kwargs)
+
+    monkeypatch.setattr(tza, "_tza_measure_raw", failing_measure)
+    with pytest.raises(ValueError, match="measurement failed") as error:
+        tza.sweep(gains=[GAIN.X1, GAIN.X10], samples=2)
+    assert isinstance(error.value.__cause__, OSError)
+    assert tza._gain == "x1"
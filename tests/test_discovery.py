@@ -0,0 +1,78 @@
+import threading
+import pytest
+
+from pytza500 import DeviceInfo, DeviceDiscovery
+from pytza500 import discovery as discovery_module
+
+
+FIRST = DeviceInfo("12345", "TZA500", 1)
+SECOND = DeviceInfo("67890", "TZA500", 2)
+
+
+@pytest.fixture
+def scans(monkeypatch) -> tuple[list, list]:
+    scans = [[FIRST]]
+    calls = []
+
+    def scan() -> list[DeviceInfo]:
+        calls.append(None)
+        return list(scans[-1])
+
+    monkeypatch.setattr(discovery_module, "_scan", scan)
+    return scans, calls
+
+
+def test_scans_are_cached(scans):
+    results, calls = scans
+    discovery = DeviceDiscovery(ttl=60.0)
+    assert discovery.devices() == [FIRST]
+    results.append([FIRST, SECOND])
+    assert discovery.devices() == [FIRST]
+    assert len(calls) == 1
+    assert discovery.devices(max_age=0.0) == [FIRST, SECOND]
+    assert len(calls) == 2
+
+
+def test_device_string_format():
+    assert str(FIRST) == "TZA500 - 12345"
+
+
+def test_monitor_reports_added_and_removed_devices(scans):
+    results, _ = scans
+    added, removed = [], []
+    scanned = threading.Event()
+    discovery = DeviceDiscovery()
+    assert discovery.devices() == [FIRST] # Devices found before are not reported
+    assert discovery.start_monitor(0.01, added.append, lambda device: (removed.append(device), scanned.set()))
+    assert not discovery.start_monitor(0.01)
+    try:
+        results.append([SECOND])
+        assert scanned.wait(5.0)
+    finally:
+        discovery.stop_monitor()
+    assert added == [SECOND]
+    assert removed == [FIRST]
+    assert not discovery.is_monitoring
+
+
+def test_failing_callback_does_not_hide_other_devices(scans):
+    results, _ = scans
+    third = DeviceInfo("11111", "TZA500", 3)
+    added = []
+    scanned = threading.Event()
+
+    def on_added(device: DeviceInfo) -> None:
+        added.append(device)
+        if device == SECOND:
+            raise ValueError("callback failed")
+
+    discovery = DeviceDiscovery()
+    assert discovery.devices() == [FIRST]
+    with pytest.warns(RuntimeWarning, match="callback failed"):
+        assert discovery.start_monitor(0.01, on_added, lambda device: scanned.set())
+        try:
+            results.append([SECOND, third])
+            assert scanned.wait(5.0)
+        finally:
+            discovery.stop_monitor()
+    assert added == [SECOND, third]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from time import time
+
+from pytza500 import GAIN, UNITS
+
+
+def test_measurements_are_returned_as_array_in_the_selected_unit(connect):
+    tza = connect(signal=1500.0)
+    values, unit = tza.tza_get_measurements(20)
+    assert unit == "µA"
+    assert isinstance(values, np.ndarray)
+    assert values.shape == (20,)
+    assert np.all(values == 1.5)
+    assert tza.set_unit(UNITS.NANOAMPERE)
+    assert tza.tza_get_measurements(5)[0].tolist() == [1500.0] * 5
+
+
+def test_measurements_with_timestamps_and_gains(connect):
+    tza = connect()
+    assert tza.tza_set_gain(GAIN.X10)
+    values, _, timestamps, gains = tza.tza_get_measurements(10, timestamps=True, gains=True)
+    assert len(values) == len(timestamps) == len(gains) == 10
+    assert np.all(np.diff(timestamps) >= 0.0)
+    assert np.all(gains == 2)
+
+
+def test_replies_read_at_once_get_their_own_timestamps(connect):
+    tza = connect(latency=0.005)
+    start = time()
+    _, _, timestamps = tza.tza_get_measurements(200, timestamps=True)
+    assert np.all(np.diff(timestamps) > 0.0)
+    assert start < timestamps[0] and timestamps[-1] <= time()
+
+
+def test_measurements_match_single_measurements(connect):
+    tza = connect(signal=-42.0)
+    tza.set_unit(UNITS.NANOAMPERE)
+    assert tza.tza_get_measurements(3)[0].tolist() == [tza.tza_get_measurement()[0]] * 3
+
+
+def test_invalid_number_of_measurements(connect):
+    tza = connect()
+    assert len(tza.tza_get_measurements(0)[0]) == 0
+    with pytest.raises(Exception, match="Invalid number"):
+        tza.tza_get_measurements(-1)
+
+
+def test_measurements_for_a_duration(connect):
+    tza = connect()
+    values, _ = tza.tza_get_measurements_for(0.05)
+    assert len(values) > 5
@@ -0,0 +1,41 @@
+
+
+def test_commands_are_counted_with_their_latency(connect):
+    tza = connect()
+    metrics = tza.enable_metrics()
+    tza.tza_get_gain()
+    tza.tza_get_measurements(10)
+    snapshot = metrics.snapshot()
+    assert snapshot["commands"]["V?"]["count"] == snapshot["commands"]["V?"]["replies"] == 1
+    assert snapshot["commands"]["V?"]["bytes_out"] == 2
+    assert snapshot["commands"]["$E"]["replies"] == 10
+    assert sum(snapshot["commands"]["$E"]["latency_buckets"].values()) == 10
+    assert snapshot["commands"]["$E"]["latency_mean"] > 0.0
+
+
+def test_tracer_sees_every_send_and_reply(connect):
+    events = []
+    tza = connect()
+    tza.enable_metrics(lambda event, command, data, latency: events.append((event, command, data)))
+    tza.tza_get_bandwith()
+    assert events == [("send", "B?", b"B?"), ("recv", "B?", b"B1\r")]
+
+
+def test_disabled_metrics_are_not_collected(connect):
+    tza = connect()
+    metrics = tza.enable_metrics()
+    tza.disable_metrics()
+    tza.tza_get_gain()
+    assert tza.metrics is None
+    assert metrics.snapshot()["commands"] == {}
+
+
+def test_prometheus_format(connect):
+    tza = connect()
+    metrics = tza.enable_metrics()
+    tza.tza_get_gain()
+    tza.resync()
+    text = metrics.to_prometheus(labels={"serial": "12345"})
+    assert 'pytza500_commands_total{serial="12345",command="V?"} 1' in text
+    assert 'pytza500_command_latency_seconds_bucket{serial="12345",command="V?",le="+Inf"} 1' in text
+    assert 'pytza500_purges_total{serial="12345"} 1' in text
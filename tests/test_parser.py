@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from pytza500 import TZA500
+from pytza500.parser import count_frames, parse_measurement_frames
+
+
+FRAMES = ["I1,5000uA", "I-0,0012uA", "I1500,000nA", "I-12,345nA", "I0nA", "I12.5nA"]
+
+
+def test_frames_parse_like_single_measurements():
+    data = "".join(frame + "\r" for frame in FRAMES).encode()
+    assert parse_measurement_frames(data).tolist() == [TZA500()._tza_parse_raw(frame[1:]) for frame in FRAMES]
+    assert parse_measurement_frames(b"I1,000mA\rI250pA\r").tolist() == [1000000.0, 0.25]
+
+
+def test_long_numbers_parse_like_float():
+    frames = ["I9007199254740993nA", "I-1234567,8901234567uA", "I0,12345678901234567nA", "I123456789012345nA"]
+    data = "".join(frame + "\r" for frame in frames).encode()
+    assert parse_measurement_frames(data).tolist() == [TZA500()._tza_parse_raw(frame[1:]) for frame in frames]
+    with pytest.raises(Exception, match="Invalid number"):
+        parse_measurement_frames(b"I1,2,34567890123456789nA\r")
+
+
+def test_bytes_after_the_last_frame_are_ignored():
+    assert parse_measurement_frames(b"I1,0nA\rI2,0nA\rI3,").tolist() == [1.0, 2.0]
+    assert len(parse_measurement_frames(b"I1,0")) == 0
+
+
+def test_values_are_written_into_the_output_array():
+    out = np.full(4, np.nan)
+    values = parse_measurement_frames(b"I1nA\rI2nA\r", out=out)
+    assert values.base is out
+    assert out[:2].tolist() == [1.0, 2.0]
+    with pytest.raises(Exception, match="too small"):
+        parse_measurement_frames(b"I1nA\rI2nA\r", out=np.empty(1))
+
+
+@pytest.mark.parametrize("data", [b"ERR\r", b"I1,0xA\r", b"InA\r"])
+def test_invalid_frames(data: bytes):
+    with pytest.raises(Exception, match="Invalid"):
+        parse_measurement_frames(data)
+
+
+def test_count_frames_ignores_line_breaks():
+    assert count_frames(b"V? OK\r\nV1\rI1nA\rI2") == 2
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from pytza500 import FakeTZA500Device, GAIN, BANDWITH, UNITS
+
+
+def test_pipelined_measurements_match_sent_requests(connect):
+    device = FakeTZA500Device(signal=1000.0)
+    tza = connect(device, UNITS.NANOAMPERE)
+    tza.pipeline_depth = 8
+    commands = device.commands
+    values, unit = tza.tza_get_measurements(100)
+    assert unit == "nA"
+    assert len(values) == 100
+    assert np.all(values == 1000.0)
+    assert device.commands - commands == 100
+    assert tza._pipeline.in_flight == 0
+
+
+def test_replies_are_matched_to_their_commands_out_of_order(connect):
+    tza = connect(unit=UNITS.NANOAMPERE)
+    tza.tza_set_gain(GAIN.X100)
+    tza.tza_set_bandwith(BANDWITH.HZ_100)
+    gain = tza._pipeline.submit("V?")
+    bandwith = tza._pipeline.submit("B?")
+    polarity = tza._pipeline.submit("$F")
+    assert tza._pipeline.result(polarity) == "F0"
+    assert tza._pipeline.result(gain).endswith("V3")
+    assert tza._pipeline.result(bandwith) == "B3"
+
+
+def test_queries_after_pipelined_measurements(connect):
+    tza = connect(unit=UNITS.NANOAMPERE)
+    tza.pipeline_depth = 16
+    tza.tza_get_measurements(50)
+    assert tza.tza_get_gain() == "x1"
+    assert tza.tza_get_bandwith() == "10 kHz"
+
+
+def test_query_discards_replies_that_are_not_collected(connect):
+    tza = connect(unit=UNITS.NANOAMPERE)
+    for _ in range(4):
+        tza._pipeline.submit("$E")
+    assert tza.tza_get_info().startswith("TZA500")
+    assert len(tza.tza_get_measurements(5)[0]) == 5
+    assert tza.tza_get_gain() == "x1"
+
+
+def test_discarded_replies_are_dropped_on_arrival(connect):
+    tza = connect(unit=UNITS.NANOAMPERE)
+    tza.tza_set_gain(GAIN.X10)
+    measurement = tza._pipeline.submit("$E")
+    gain = tza._pipeline.submit("V?")
+    tza._pipeline.discard([measurement])
+    assert tza._pipeline.result(gain).endswith("V2")
+    assert tza._pipeline.in_flight == 0
+
+
+def test_aborted_measurement_does_not_leave_replies_in_flight(connect, monkeypatch):
+    tza = connect(unit=UNITS.NANOAMPERE)
+    tza.pipeline_depth = 8
+
+    def interrupt(*args):
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(tza, "_tza_measure_step", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        tza.tza_get_measurements(20)
+    monkeypatch.undo()
+    assert tza._pipeline.in_flight == 0
+    assert len(tza.tza_get_measurements(20)[0]) == 20
+    assert tza.tza_get_bandwith() == "10 kHz"
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pytza500 import TZA500, TZA500Pool, FakeTZA500Device, GAIN, BANDWITH, UNITS
+
+
+DEVICES = ["TZA500 - 1", "TZA500 - 2", "TZA500 - 3"]
+
+
+@pytest.fixture
+def pool(monkeypatch) -> TZA500Pool:
+    def connect(tza: TZA500, device: str) -> bool:
+        serial = device.split("- ")[1]
+        if serial == "0":
+            raise Exception("Cannot open Device with serial number 0.")
+        return tza.connect_handle(FakeTZA500Device(signal=100.0 * int(serial), serial=serial))
+
+    monkeypatch.setattr(TZA500, "connect", connect)
+    with TZA500Pool() as pool:
+        yield pool
+
+
+def test_connect_reports_each_device(pool: TZA500Pool):
+    assert pool.connect(DEVICES + ["TZA500 - 0"]) == {"TZA500 - 1": True, "TZA500 - 2": True, "TZA500 - 3": True, "TZA500 - 0": False}
+    assert len(pool) == 3
+    assert pool.connect(DEVICES) == {}
+
+
+def test_settings_are_applied_to_all_devices(pool: TZA500Pool):
+    pool.connect(DEVICES)
+    assert pool.tza_set_gain(GAIN.X100) == dict.fromkeys(DEVICES, True)
+    assert pool.configure(bandwith=BANDWITH.HZ_100) == dict.fromkeys(DEVICES, True)
+    assert all(tza.tza_get_gain() == "x100" and tza.tza_get_bandwith() == "100 Hz" for tza in pool.devices.values())
+
+
+def test_synchronized_measurements(pool: TZA500Pool):
+    pool.connect(DEVICES)
+    pool.set_unit(UNITS.NANOAMPERE)
+    timestamps, values, unit = pool.tza_get_measurements(5)
+    assert unit == "nA"
+    assert timestamps.shape == (5,)
+    assert values.shape == (5, 3)
+    assert np.all(values == [100.0, 200.0, 300.0])
+
+
+def test_measurements_need_the_same_unit(pool: TZA500Pool):
+    pool.connect(DEVICES)
+    pool.devices["TZA500 - 1"].set_unit(UNITS.NANOAMPERE)
+    with pytest.raises(Exception, match="different units"):
+        pool.tza_get_measurements()
@@ -0,0 +1,34 @@
+import pytest
+from time import perf_counter
+
+from pytza500 import FakeTZA500Device
+
+
+INFO = "TZA500 FW 1.0\nSerial: 12345\nDate of manufacturing: 01/2025"
+
+
+def test_multi_line_replies_with_crlf_line_breaks(connect):
+    tza = connect(line_break="\r\n")
+    assert tza.tza_serial_number == "12345"
+    assert tza.tza_firmware_version == "1.0"
+    assert tza.tza_get_gain() == "x1"
+    assert tza.tza_get_info() == INFO
+    assert tza.tza_get_bandwith() == "10 kHz"
+    assert len(tza.tza_get_measurements(10)[0]) == 10
+
+
+@pytest.mark.parametrize("line_break", ["\n", "\r\n"])
+def test_info_does_not_wait_for_the_read_timeout(connect, line_break: str):
+    tza = connect(line_break=line_break)
+    assert tza.set_receive_latency(read_timeout=500)
+    start = perf_counter()
+    assert tza.tza_get_info() == INFO
+    assert perf_counter() - start < 0.25
+
+
+def test_info_of_unknown_firmware_ends_after_an_idle_read(connect):
+    device = FakeTZA500Device(line_break="\r\n")
+    device._info = "TZA500 FW 9.9\r\nSerial: 12345\r\nOptions: none"
+    tza = connect(device)
+    assert tza.tza_get_info() == "TZA500 FW 9.9\nSerial: 12345\nOptions: none"
+    assert tza.tza_get_gain() == "x1"
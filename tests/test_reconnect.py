@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from pytza500 import TZA500, FakeTZA500Device, GAIN, BANDWITH, UNITS
+
+
+@pytest.fixture
+def configured(connect) -> tuple[TZA500, FakeTZA500Device]:
+    device = FakeTZA500Device(signal=1000.0, latency=0.0005)
+    tza = connect(device, UNITS.NANOAMPERE)
+    assert tza.tza_set_gain(GAIN.X100)
+    assert tza.tza_set_bandwith(BANDWITH.HZ_100)
+    return tza, device
+
+
+def test_reconnect_restores_settings(configured):
+    tza, device = configured
+    tza.enable_auto_reconnect(max_attempts=10, initial_delay=0.01)
+    device.unplug(0.05)
+    device._gain, device._bandwith = 1, 1 # Power cycled
+    assert tza.tza_get_measurement() == [1000.0, "nA"]
+    assert tza.reconnects == 1
+    assert (device._gain, device._bandwith) == (3, 3)
+
+
+def test_measurements_continue_after_reconnect(configured):
+    tza, device = configured
+    tza.enable_auto_reconnect(max_attempts=10, initial_delay=0.01)
+    timer = threading.Timer(0.02, device.unplug, (0.05,))
+    timer.start()
+    values, _ = tza.tza_get_measurements(300)
+    timer.join()
+    assert len(values) == 300
+    assert tza.reconnects >= 1
+
+
+def test_connection_loss_raises_without_auto_reconnect(configured):
+    tza, device = configured
+    device.unplug(0.05)
+    with pytest.raises(OSError):
+        tza.tza_get_measurement()
+    assert tza.reconnects == 0
+
+
+def test_reconnect_resumes_the_session_without_initializing(configured):
+    tza, device = configured
+    device.zero_offset = 50.0
+    assert tza.tza_set_polarity(True)
+    assert tza.tza_set_auto_zero(wait=False)
+    device.unplug(0.01)
+    device._inverted = False # Power cycled
+    commands = device.commands
+    assert tza.reconnect(max_attempts=20, initial_delay=0.005)
+    assert device.commands - commands == 4 # $U, bandwith, polarity and gain, no $I or auto zero reset
+    assert device._inverted
+    assert device._zero_compensation == 50.0
+    assert tza.tza_serial_number == "12345"
+    assert tza.initial_auto_zero == "Auto zero"
+
+
+def test_reconnect_gives_up_after_max_attempts(configured):
+    tza, device = configured
+    device.unplug(10.0)
+    assert not tza.reconnect(max_attempts=2, initial_delay=0.001)
+    with pytest.raises(Exception, match="port not open"):
+        tza.tza_get_gain()
+
+
+class SilentDevice(FakeTZA500Device):
+    """
+    Does not answer while silent is set, the connection stays up.
+    """
+    silent: bool = False
+
+    def write(self, data: bytes) -> int:
+        return len(data) if self.silent else super().write(data)
+
+
+def test_timeouts_do_not_reconnect(connect):
+    device = SilentDevice(signal=1000.0)
+    tza = connect(device, UNITS.NANOAMPERE)
+    tza.enable_auto_reconnect(max_attempts=10, initial_delay=0.01)
+    tza._tza_comm_max_retries = 10 # Time out after 0.1 s instead of 8 s
+    device.silent = True
+    commands = device.commands
+    with pytest.raises(TimeoutError):
+        tza.tza_get_measurement()
+    with pytest.raises(TimeoutError):
+        tza.tza_get_measurements(5)
+    assert tza.reconnects == 0
+    assert device.commands == commands # Nothing was repeated
+    device.silent = False
+    assert tza.tza_get_measurement() == [1000.0, "nA"]
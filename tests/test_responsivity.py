@@ -0,0 +1,67 @@
+import asyncio
+import numpy as np
+import pytest
+
+from pytza500 import AsyncTZA500, UNITS, ResponsivityCurve
+
+
+def test_arrays_and_single_wavelengths_agree():
+    curve = ResponsivityCurve([400.0, 500.05, 900.0], [0.1, 0.5, 0.2])
+    wavelengths = np.array([400.0, 450.0, 500.05, 500.1, 777.7, 900.0])
+    assert curve(wavelengths).tolist() == [curve(wavelength) for wavelength in wavelengths]
+    assert curve(np.array([500.05]))[0] == 0.5
+    assert curve(np.empty(0)).shape == (0,)
+
+
+def test_wavelengths_outside_the_range_are_rejected():
+    curve = ResponsivityCurve([400.0, 900.0], [0.1, 0.2])
+    assert curve.range == (400.0, 900.0)
+    with pytest.raises(Exception, match="outside the calibrated range"):
+        curve(399.9)
+    with pytest.raises(Exception, match="outside the calibrated range"):
+        curve(np.array([500.0, 900.1]))
+
+
+def test_invalid_curves_are_rejected():
+    with pytest.raises(Exception):
+        ResponsivityCurve([400.0], [0.1])
+    with pytest.raises(Exception):
+        ResponsivityCurve([500.0, 400.0], [0.1, 0.2])
+    with pytest.raises(Exception):
+        ResponsivityCurve([400.0, 500.0], [0.1, 0.0])
+
+
+def test_curve_from_csv(tmp_path):
+    path = tmp_path / "photodiode.csv"
+    path.write_text("# Photodiode\nWavelength;Responsivity\n400;0,1\n500;0,5 # peak\n\n900;0,2\n", encoding="utf-8")
+    curve = ResponsivityCurve.from_csv(str(path))
+    assert curve.wavelengths.tolist() == [400.0, 500.0, 900.0]
+    assert curve.responsivities.tolist() == [0.1, 0.5, 0.2]
+
+    path.write_text("nm\tA/W\n", encoding="utf-8")
+    with pytest.raises(Exception, match="No calibration data"):
+        ResponsivityCurve.from_csv(str(path))
+
+
+def test_measurements_in_watts_per_wavelength(connect):
+    tza = connect(signal=500.0)
+    tza.set_responsivity(ResponsivityCurve([400.0, 500.0, 900.0], [0.1, 0.5, 0.2]))
+    assert tza.tza_set_wavelength(500.0)
+    assert not tza.tza_set_wavelength(1000.0)
+    tza.set_unit(UNITS.NANOWATTS)
+    assert tza.tza_get_measurement() == [1000.0, "nW"]
+
+    values, unit = tza.tza_get_measurements(3, wavelengths=np.array([400.0, 500.0, 900.0]))
+    assert unit == "nW" and values.tolist() == [5000.0, 1000.0, 2500.0]
+    with pytest.raises(Exception):
+        tza.tza_get_measurements(2, wavelengths=np.array([400.0, 500.0, 900.0]))
+
+
+def test_async_measurements_forward_the_wavelengths(connect):
+    async def run() -> None:
+        async with AsyncTZA500(connect(signal=500.0)) as tza:
+            tza.set_responsivity(ResponsivityCurve([400.0, 500.0, 900.0], [0.1, 0.5, 0.2]))
+            tza.set_unit(UNITS.NANOWATTS)
+            values, unit = await tza.tza_get_measurements(2, wavelengths=np.array([400.0, 900.0]))
+            assert unit == "nW" and values.tolist() == [5000.0, 2500.0]
+    asyncio.run(run())
@@ -0,0 +1,86 @@
+import json
+import socket
+import pytest
+from time import sleep, monotonic
+
+from pytza500 import TZA500Server, TZA500Client, GAIN, UNITS
+from pytza500.server import MESSAGE_COMMAND, MESSAGE_HELLO, MESSAGE_REPLY, _frame, _recv_frame
+
+
+KEY = b"secret"
+
+
+@pytest.fixture
+def server(connect):
+    tza = connect(signal=2000.0, latency=0.0002)
+    with TZA500Server(tza, ("127.0.0.1", 0), key=KEY, rate=500.0) as server:
+        yield server
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = monotonic() + timeout
+    while not condition():
+        if monotonic() > deadline:
+            return False
+        sleep(0.005)
+    return True
+
+
+def raw_connection(server: TZA500Server) -> socket.socket:
+    sock = socket.create_connection(server.address, timeout=5.0)
+    message_type, _ = _recv_frame(sock)
+    assert message_type == MESSAGE_HELLO
+    return sock
+
+
+def test_clients_receive_samples_in_their_own_unit(server: TZA500Server):
+    with TZA500Client(server.address) as first, TZA500Client(server.address) as second:
+        assert wait_for(lambda: server.clients == 2)
+        second.set_unit(UNITS.NANOAMPERE)
+        assert first.tza_get_measurements(5)[0].tolist() == [2.0] * 5
+        assert second.tza_get_measurements(5)[0].tolist() == [2000.0] * 5
+        assert second.tza_get_measurement() == [2000.0, "nA"]
+        assert first.tza_serial_number == "12345"
+
+
+def test_configuration_needs_the_key(server: TZA500Server):
+    with TZA500Client(server.address) as reader:
+        assert not reader.authorized
+        assert reader.tza_get_gain() == "x1"
+        with pytest.raises(Exception, match="Not authorized"):
+            reader.tza_set_gain(GAIN.X100)
+    with TZA500Client(server.address, key=b"wrong") as intruder:
+        assert not intruder.authorized
+        with pytest.raises(Exception, match="Not authorized"):
+            intruder.tza_set_gain(GAIN.X100)
+    with TZA500Client(server.address, key=KEY) as writer:
+        assert writer.authorized
+        assert writer.tza_set_gain(GAIN.X100)
+        assert writer.state()["gain"] == "x100"
+        assert writer.tza_get_gain() == "x100"
+
+
+def test_commands_that_are_not_objects_are_rejected(server: TZA500Server):
+    sock = raw_connection(server)
+    try:
+        assert wait_for(lambda: server.clients == 1)
+        for payload in (b"[1, 2]", b'{"id": 7, "method": "tza_get_gain", "args": 5}'):
+            sock.sendall(_frame(MESSAGE_COMMAND, payload))
+            message_type, reply = _recv_frame(sock)
+            while message_type != MESSAGE_REPLY:
+                message_type, reply = _recv_frame(sock)
+            assert "Invalid" in json.loads(reply)["error"]
+        assert server.clients == 1
+    finally:
+        sock.close()
+    assert wait_for(lambda: server.clients == 0)
+
+
+def test_client_is_removed_after_a_protocol_error(server: TZA500Server):
+    sock = raw_connection(server)
+    try:
+        assert wait_for(lambda: server.clients == 1)
+        sock.sendall(_frame(MESSAGE_COMMAND, b"not json"))
+        assert wait_for(lambda: server.clients == 0)
+    finally:
+        sock.close()
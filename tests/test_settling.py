@@ -0,0 +1,51 @@
+import math
+import pytest
+from time import perf_counter
+
+from pytza500 import BANDWITH
+from pytza500.settling import SettlingModel, StabilityDetector
+
+
+def test_settle_time_of_a_first_order_low_pass():
+    model = SettlingModel(tolerance=1e-3)
+    assert model.settle_time("10 Hz") == pytest.approx(math.log(1000.0) / (2.0 * math.pi * 10.0))
+    model.set_gain_cutoff(6, 10.0)
+    assert model.settle_time("10 Hz", 6) == pytest.approx(math.sqrt(2.0) * model.settle_time("10 Hz"))
+    assert model.settle_time("10 Hz", 5) == model.settle_time("10 Hz")
+
+
+def test_stability_detector():
+    detector = StabilityDetector(window=3, tolerance=1.0)
+    assert not detector.add(0.0, 100.0)
+    assert not detector.add(5.0, 100.0)
+    assert not detector.add(0.5, 100.0)
+    assert not detector.add(0.9, 100.0)
+    assert detector.add(0.8, 100.0)
+    with pytest.raises(Exception, match="Invalid window"):
+        StabilityDetector(window=1)
+
+
+def test_wait_settled_waits_the_modelled_time(connect):
+    tza = connect(latency=0.0002)
+    assert tza.tza_set_bandwith(BANDWITH.HZ_10)
+    assert not tza.is_settled
+    start = perf_counter()
+    assert tza.wait_settled()
+    assert perf_counter() - start >= tza.tza_get_settle_time() * 0.5
+    assert tza.is_settled
+
+
+def test_adaptive_settling_ends_on_stable_readings(connect):
+    tza = connect(latency=0.0002)
+    tza.set_settling(adaptive=True)
+    start = perf_counter()
+    assert tza.tza_set_auto_zero()
+    assert perf_counter() - start < 0.2 # The device answers A OK, modelled as 0.5 s
+    assert tza.is_settled
+
+
+def test_wait_settled_timeout(connect):
+    tza = connect(latency=0.0002)
+    assert tza.tza_set_auto_zero(wait=False)
+    assert not tza.wait_settled(timeout=0.01)
+    assert tza.settled_future().result(timeout=5.0)
@@ -0,0 +1,66 @@
+import os
+import sys
+import subprocess
+import pytest
+from time import perf_counter
+
+from pytza500 import FakeTZA500Device
+from pytza500.simulator import sine_signal, step_signal
+
+
+def query(device: FakeTZA500Device, command: str) -> str:
+    device.write(command.encode())
+    reply = bytearray()
+    while not reply.endswith(b"\r"):
+        reply += device.read(1)
+    return reply[:-1].decode()
+
+
+def test_device_answers_the_protocol():
+    device = FakeTZA500Device(signal=1500.0, max_gain=5)
+    assert query(device, "$U") == "U OK"
+    assert query(device, "$I").startswith("TZA500 FW 1.0\nSerial: 12345")
+    assert query(device, "$E") == "I1,5000uA"
+    assert query(device, "V4") == "V4 OK"
+    assert query(device, "V?") == "V? OK\nV4"
+    assert query(device, "$E") == "I1500,000nA"
+    assert query(device, "$C") == "C OK"
+    assert query(device, "$F") == "F1"
+    assert query(device, "$A") == "A OK Gain: 5"
+    assert query(device, "X1") == "ERR"
+    assert device.commands == 10
+
+
+def test_pipelined_commands_overlap_the_latency():
+    device = FakeTZA500Device(latency=0.05, processing_time=0.0)
+    start = perf_counter()
+    device.write(b"$E" * 10)
+    reply = bytearray()
+    while reply.count(b"\r") < 10:
+        reply += device.read(1)
+    assert perf_counter() - start < 0.25
+
+
+def test_unplugged_device_raises_until_it_is_back():
+    device = FakeTZA500Device()
+    device.unplug(0.05)
+    with pytest.raises(OSError):
+        device.write(b"$U")
+    while True:
+        try:
+            assert query(device, "$U") == "U OK"
+            break
+        except OSError:
+            pass
+
+
+def test_signals():
+    assert sine_signal(2.0, 1.0, 1.0)(0.25) == pytest.approx(3.0)
+    assert [step_signal([1.0, 10.0], 0.5)(t) for t in (0.0, 0.6, 1.1)] == [1.0, 10.0, 1.0]
+
+
+def test_benchmark_runs_from_a_checkout():
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "benchmark.py")
+    result = subprocess.run([sys.executable, script, "--samples", "50", "--latency", "0.0001"], capture_output=True, text=True, timeout=120, cwd=os.path.dirname(script))
+    assert result.returncode == 0, result.stderr
+    assert "tza_get_measurements" in result.stdout
@@ -0,0 +1,40 @@
+from pytza500 import FakeTZA500Device, GAIN, BANDWITH
+
+
+def test_getters_answer_from_the_cache(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device)
+    commands = device.commands
+    assert tza.tza_get_gain() == "x1"
+    assert tza.tza_get_bandwith() == "10 kHz"
+    assert tza.tza_is_polarity_inverted() is False
+    assert device.commands == commands
+
+
+def test_setters_skip_values_already_set(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device)
+    assert tza.tza_set_gain(GAIN.X1000)
+    commands = device.commands
+    assert tza.tza_set_gain(GAIN.X1000)
+    assert tza.tza_set_bandwith(BANDWITH.KHZ_10)
+    assert tza.tza_set_polarity(False)
+    assert device.commands == commands
+    assert tza.tza_get_gain() == "x1000"
+
+
+def test_auto_zero_clears_the_cache(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device)
+    assert tza.tza_set_auto_zero_reset(wait=False)
+    device._gain = 4 # Changed by the device
+    assert tza.tza_get_gain() == "x1000"
+
+
+def test_without_cache_every_getter_queries(connect_cached):
+    device = FakeTZA500Device()
+    tza = connect_cached(device, state_cache=False)
+    commands = device.commands
+    tza.tza_get_gain()
+    tza.tza_get_bandwith()
+    assert device.commands == commands + 2
@@ -0,0 +1,50 @@
+import numpy as np
+from time import sleep
+
+from pytza500 import UNITS
+from pytza500.ringbuffer import RingBuffer
+
+
+def test_ring_buffer_keeps_order_across_the_wrap():
+    buffer = RingBuffer(4)
+    for i in range(3):
+        assert buffer.push(float(i), i * 10.0, 1)
+    assert buffer.drain(2)[1].tolist() == [0.0, 10.0]
+    assert buffer.push_many(np.array([3.0, 4.0, 5.0]), np.array([30.0, 40.0, 50.0]), np.ones(3, dtype=np.uint8)) == 3
+    timestamps, values, gains = buffer.drain()
+    assert timestamps.tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert values.tolist() == [20.0, 30.0, 40.0, 50.0]
+    assert len(buffer) == 0
+
+
+def test_ring_buffer_drops_and_counts_records_when_full():
+    buffer = RingBuffer(2)
+    assert buffer.push(0.0, 0.0, 1)
+    assert buffer.push_many(np.zeros(3), np.arange(3.0), np.ones(3, dtype=np.uint8)) == 1
+    assert not buffer.push(1.0, 1.0, 1)
+    assert buffer.overruns == 3
+    assert buffer.drain()[1].tolist() == [0.0, 0.0]
+
+
+def test_stream_delivers_measurements_in_the_selected_unit(connect):
+    tza = connect(signal=1000.0, unit=UNITS.NANOAMPERE)
+    tza.set_unit(UNITS.MICROAMPERE)
+    assert tza.start_stream()
+    assert not tza.start_stream()
+    sleep(0.1)
+    tza.stop_stream()
+    assert not tza.is_streaming
+    timestamps, values, gains = tza.read_stream()
+    assert len(values) > 10
+    assert np.all(values == 1.0)
+    assert np.all(gains == 1)
+    assert np.all(np.diff(timestamps) >= 0.0)
+    assert tza.stream_overruns == 0
+
+
+def test_stream_rate_limits_the_sampling(connect):
+    tza = connect(unit=UNITS.NANOAMPERE)
+    assert tza.start_stream(rate=50.0)
+    sleep(0.2)
+    tza.stop_stream()
+    assert 5 <= len(tza.read_stream()[1]) <= 15
@@ -0,0 +1,103 @@
+import os
+import sys
+import subprocess
+import pytest
+
+import pytza500
+from pytza500 import TZA500, Transport, HandleTransport, SerialTransport, FakeTZA500Device
+
+
+def test_import_does_not_load_optional_modules():
+    code = "import sys, pytza500; print(sorted(name for name in ('ftd2xx', 'pytza500.aio', 'pytza500.server', 'pytza500.simulator', 'pytza500.analysis') if name in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_star_import_exports_only_the_public_api():
+    namespace = {"time": None}
+    exec("from pytza500 import *", namespace)
+    assert namespace["time"] is None
+    assert not any(name in namespace for name in ("np", "re", "sleep", "threading", "parser", "importlib"))
+    assert all(name in namespace for name in ("TZA500", "GAIN", "DeviceDiscovery", "LoopbackTransport", "AsyncTZA500", "AnalysisPipeline"))
+
+
+def test_transports_implement_the_whole_interface():
+    class Incomplete(Transport):
+        def open(self) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_driver_errors_become_connection_errors():
+    class DriverError(Exception):
+        pass
+
+    class BrokenDevice(FakeTZA500Device):
+        def write(self, data: bytes) -> int:
+            raise DriverError("USB transfer failed")
+
+    transport = HandleTransport(BrokenDevice())
+    transport._errors = (DriverError,)
+    tza = TZA500()
+    with pytest.raises(ConnectionError, match="USB transfer failed"):
+        tza.connect_transport(transport)
+
+
+class UnconfigurableTransport(HandleTransport):
+    """
+    Opens, but fails to set up the connection.
+    """
+    def __init__(self, *args) -> None:
+        super().__init__(FakeTZA500Device())
+        self.closed: bool = False
+
+    def configure(self, read_timeout: int, latency_timer: int) -> None:
+        raise ConnectionError("Cannot set the baud rate.")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_transport_is_closed_when_the_setup_fails(monkeypatch):
+    transport = UnconfigurableTransport()
+    tza = TZA500()
+    with pytest.raises(ConnectionError):
+        tza.connect_transport(transport)
+    assert transport.closed
+    assert tza._device is None and tza._transport is None
+
+    opened = []
+    monkeypatch.setattr(pytza500, "FTD2XXTransport", lambda serial: opened.append(UnconfigurableTransport()) or opened[-1])
+    with pytest.raises(Exception, match="Cannot open Device with serial number 12345"):
+        tza.connect("TZA500 - 12345")
+    assert opened[0].closed
+    assert tza._device is None
+    assert tza.connect_transport(HandleTransport(FakeTZA500Device())) # Not kept as connected
+    tza.disconnect()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Needs a pseudo terminal")
+def test_serial_transport_on_a_pseudo_terminal():
+    master, slave = os.openpty()
+    transport = SerialTransport(os.ttyname(slave), latency_timer=False)
+    try:
+        transport.open()
+        transport.configure(read_timeout=50, latency_timer=2)
+        assert transport.write(b"$U") == 2
+        assert os.read(master, 2) == b"$U"
+        os.write(master, b"U OK\r")
+        assert transport.read(5) == b"U OK\r"
+        assert transport.read(1) == b"" # Read timeout
+        os.write(master, b"B1\r")
+        while transport.queue_status() < 3:
+            pass
+        transport.purge()
+        assert transport.queue_status() == 0
+    finally:
+        transport.close()
+        os.close(slave)
+        os.close(master)
+    assert not transport.is_open
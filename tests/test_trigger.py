@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from pytza500 import UNITS
+from pytza500 import TriggeredCapture, EdgeTrigger, WindowTrigger, ThresholdTrigger, SlopeTrigger, EDGE
+
+
+def block(values, start: int = 0):
+    values = np.asarray(values, dtype=np.float64)
+    timestamps = np.arange(start, start + len(values), dtype=np.float64)
+    return timestamps, values, np.ones(len(values), dtype=np.uint8)
+
+
+def test_edge_trigger_rearms_only_after_the_hysteresis():
+    trigger = EdgeTrigger(level=10.0, edge=EDGE.RISING, hysteresis=2.0)
+    # Noise around the level does not fire again until the values fell below 8
+    assert trigger.find(*block([0.0, 11.0, 9.0, 11.0, 7.0, 12.0])[:2]).tolist() == [1, 5]
+    # The state is kept across blocks
+    assert trigger.find(*block([9.0, 11.0, 5.0])[:2]).tolist() == []
+    assert trigger.find(*block([12.0])[:2]).tolist() == [0]
+
+
+def test_edge_trigger_does_not_fire_when_starting_above_the_level():
+    trigger = EdgeTrigger(level=10.0, edge=EDGE.RISING)
+    assert trigger.find(*block([15.0, 12.0, 5.0, 15.0])[:2]).tolist() == [3]
+
+
+def test_edge_trigger_falling_and_both():
+    values = [5.0, 15.0, 5.0, 15.0]
+    assert EdgeTrigger(10.0, EDGE.FALLING).find(*block(values)[:2]).tolist() == [2]
+    assert EdgeTrigger(10.0, EDGE.BOTH).find(*block(values)[:2]).tolist() == [1, 2, 3]
+
+
+def test_window_trigger_fires_on_leaving_or_entering():
+    values = [0.0, 0.5, 2.0, 3.0, 0.0, -2.0]
+    assert WindowTrigger(-1.0, 1.0).find(*block(values)[:2]).tolist() == [2, 5]
+    trigger = WindowTrigger(-1.0, 1.0, inside=True)
+    assert trigger.find(*block(values[:3])[:2]).tolist() == []
+    assert trigger.find(*block(values[3:])[:2]).tolist() == [1]
+    with pytest.raises(Exception):
+        WindowTrigger(1.0, 1.0)
+
+
+def test_slope_trigger_uses_the_previous_block():
+    trigger = SlopeTrigger(rate=5.0, edge=EDGE.RISING)
+    timestamps, values, _ = block([0.0, 1.0, 2.0])
+    assert trigger.find(timestamps * 0.1, values).tolist() == [1, 2] # 10 per second
+    timestamps, values, _ = block([12.0, 2.0], start=3)
+    assert trigger.find(timestamps * 0.1, values).tolist() == [0]
+    assert SlopeTrigger(5.0, EDGE.FALLING).find(np.array([0.0, 1.0]), np.array([10.0, 0.0])).tolist() == [1]
+
+
+def test_threshold_trigger():
+    values = block([0.0, 5.0, -5.0, 1.0])[1]
+    assert ThresholdTrigger(2.0).find(None, values).tolist() == [1]
+    assert ThresholdTrigger(-2.0, EDGE.FALLING).find(None, values).tolist() == [2]
+    assert ThresholdTrigger(2.0, EDGE.BOTH).find(None, values).tolist() == [1, 2]
+
+
+def test_segments_are_the_same_for_any_block_split():
+    values = np.zeros(200)
+    values[[30, 31, 90, 150, 197]] = 1.0
+    timestamps, values, gains = block(values)
+
+    def capture(splits):
+        capture = TriggeredCapture(None, EdgeTrigger(0.5), pre_samples=5, post_samples=10)
+        segments = []
+        for first, last in zip([0] + splits, splits + [len(values)]):
+            segments += capture.process(timestamps[first:last], values[first:last], gains[first:last])
+        return segments
+
+    expected = capture([])
+    # 31 is no crossing, the segment of 197 is not complete
+    assert [segment.trigger_time for segment in expected] == [30.0, 90.0, 150.0]
+    for segment in expected:
+        assert segment.trigger_index == 5
+        assert segment.timestamps.tolist() == list(np.arange(segment.trigger_time - 5, segment.trigger_time + 11))
+        assert segment.values[segment.trigger_index] == 1.0
+
+    for splits in ([1, 2, 3], [35, 40, 41, 95], [100], list(range(1, 200))):
+        result = capture(splits)
+        assert [segment.trigger_time for segment in result] == [30.0, 90.0, 150.0]
+        for a, b in zip(expected, result):
+            assert a.timestamps.tolist() == b.timestamps.tolist()
+            assert a.values.tolist() == b.values.tolist()
+
+
+def test_segments_at_the_start_have_fewer_pre_samples():
+    capture = TriggeredCapture(None, ThresholdTrigger(0.5), pre_samples=5, post_samples=2)
+    segments = capture.process(*block([0.0, 0.0, 1.0, 0.0, 0.0]))
+    assert len(segments) == 1
+    assert segments[0].trigger_index == 2
+    assert segments[0].timestamps.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_holdoff_ignores_triggers_after_a_segment():
+    values = block(np.ones(20))
+    capture = TriggeredCapture(None, ThresholdTrigger(0.5), pre_samples=0, post_samples=2, holdoff=3)
+    assert [segment.trigger_time for segment in capture.process(*values)] == [0.0, 6.0, 12.0]
+    assert capture.segments == 3
+
+
+def test_reset_discards_the_history():
+    capture = TriggeredCapture(None, ThresholdTrigger(0.5), pre_samples=3, post_samples=1)
+    assert capture.process(*block([0.0, 0.0, 0.0])) == []
+    capture.reset()
+    segments = capture.process(*block([1.0, 0.0], start=3))
+    assert segments[0].trigger_index == 0
+    assert segments[0].timestamps.tolist() == [3.0, 4.0]
+
+
+def test_capture_from_the_stream(connect):
+    tza = connect(signal=1000.0, unit=UNITS.NANOAMPERE)
+    with TriggeredCapture(tza, ThresholdTrigger(0.0), pre_samples=2, post_samples=3) as capture:
+        segment = capture.get(timeout=5.0)
+    assert not tza.is_streaming
+    assert segment is not None
+    assert len(segment.values) == segment.trigger_index + 4
+    assert segment.unit == tza._unit
+
+
+def test_capture_does_not_share_a_running_stream(connect):
+    tza = connect()
+    assert tza.start_stream()
+    capture = TriggeredCapture(tza, ThresholdTrigger(0.0))
+    with pytest.raises(Exception, match="Stream already running"):
+        capture.start()
+    assert tza.is_streaming
+    tza.stop_stream()
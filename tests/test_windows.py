@@ -0,0 +1,43 @@
+import math
+import numpy as np
+import pytest
+
+from pytza500 import BANDWITH
+from pytza500.averaging import WindowStatistics
+from pytza500.simulator import sine_signal
+
+
+def test_window_statistics_match_numpy():
+    values = np.random.default_rng(1).normal(3.0, 2.0, 1000)
+    statistics = WindowStatistics()
+    statistics.add(values[:10])
+    for value in values[10:20]:
+        statistics.add_value(value)
+    statistics.add(values[20:])
+    assert statistics.count == 1000
+    assert statistics.mean == pytest.approx(np.mean(values))
+    assert statistics.std == pytest.approx(np.std(values, ddof=1))
+    assert (statistics.min, statistics.max) == (values.min(), values.max())
+
+
+def test_windows_describe_the_whole_window(connect):
+    # One period of a 4 Hz sine per window, 5 µA offset and 1 µA amplitude
+    tza = connect(signal=sine_signal(1000.0, 4.0, 5000.0), latency=0.0002)
+    assert tza.tza_set_bandwith(BANDWITH.HZ_100)
+    tza.wait_settled()
+    records, unit = tza.tza_get_windows(4.0, windows=2)
+    assert unit == "µA"
+    for record in records:
+        assert 40 <= record["count"] <= 50
+        assert record["mean"] == pytest.approx(5.0, abs=0.1)
+        assert record["std"] == pytest.approx(1.0 / math.sqrt(2.0), abs=0.1)
+        assert record["max"] - record["min"] > 1.8
+
+
+def test_windows_of_a_constant_signal(connect):
+    tza = connect(signal=2000.0)
+    records, _ = tza.tza_get_windows(20.0, duration=0.1)
+    assert len(records) == 2
+    assert np.all(records["mean"] == 2.0)
+    assert np.all(records["std"] == 0.0)
+    assert np.all(np.diff(records["timestamp"]) > 0.0)